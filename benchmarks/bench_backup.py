@@ -0,0 +1,50 @@
+"""
+Disk use and throughput of the deduplicating backup store.
+
+Stores a series of synthetic saves in which a few blocks change between consecutive backups, as in successive
+autosaves, and compares the bytes written against keeping every copy whole. Saves are built from blocks starting with
+the save chunk tag, like the compressed chunks of a real save body.
+
+Run with ``python -m benchmarks.bench_backup``.
+"""
+import random
+import tempfile
+import time
+
+from satisfactory_api_client.backup import SAVE_CHUNK_TAG, BackupStore
+
+SAVE_SIZES_MIB = (16, 64)
+BACKUPS = 10
+CHANGED_BLOCKS = 4
+BLOCK_SIZE = 128 * 1024
+FEED_SIZE = 1024 * 1024
+
+
+def _stream(blocks: list[bytes]):
+    data = b''.join(blocks)
+    for i in range(0, len(data), FEED_SIZE):
+        yield data[i:i + FEED_SIZE]
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for size_mib in SAVE_SIZES_MIB:
+        blocks = [SAVE_CHUNK_TAG + rng.randbytes(BLOCK_SIZE) for _ in range(size_mib * 2 ** 20 // BLOCK_SIZE)]
+        with tempfile.TemporaryDirectory() as directory:
+            store = BackupStore(directory)
+            start = time.perf_counter()
+            for i in range(BACKUPS):
+                result = store.write('bench', _stream(blocks), created=float(i))
+                print(f"  {size_mib:>3} MiB backup {i:>2}: {result.new_chunks:>4} new chunks, "
+                      f"dedup {result.dedup_ratio:6.1%}, {result.throughput / 2 ** 20:8.1f} MiB/s")
+                for _ in range(CHANGED_BLOCKS):
+                    blocks[rng.randrange(len(blocks))] = SAVE_CHUNK_TAG + rng.randbytes(BLOCK_SIZE)
+            elapsed = time.perf_counter() - start
+            stats = store.stats()
+        print(f"{size_mib} MiB x {BACKUPS}: {stats['logical_bytes'] / 2 ** 20:.0f} MiB of saves stored in "
+              f"{stats['stored_bytes'] / 2 ** 20:.0f} MiB ({stats['dedup_ratio']:.1%} saved), "
+              f"{stats['logical_bytes'] / elapsed / 2 ** 20:.0f} MiB/s overall")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Per-call latency of ``SatisfactoryAPI`` with a pooled keep-alive session versus a bare ``requests.post`` per call.
+
+Run with ``python -m benchmarks.bench_connection_pool``.
+"""
+import statistics
+import time
+
+import requests
+import urllib3
+
+from satisfactory_api_client import SatisfactoryAPI
+from .tls_server import LocalTLSServer
+
+CALLS = 200
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def _measure(call) -> list[float]:
+    timings = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(f"{label:<28} mean {statistics.mean(timings):7.3f} ms   p50 {statistics.median(timings):7.3f} ms   "
+          f"p99 {p99:7.3f} ms")
+
+
+def main() -> None:
+    with LocalTLSServer() as server:
+        url = f'https://127.0.0.1:{server.port}/api/v1'
+        payload = {'function': 'HealthCheck', 'data': {'ClientCustomData': ''}}
+        _report('requests.post per call', _measure(lambda: requests.post(url, json=payload, verify=False)))
+
+        with SatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True) as api:
+            _report('SatisfactoryAPI (pooled)', _measure(api.health_check))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Import time of the package and its clients, measured in fresh interpreters.
+
+Each statement is run ``--runs`` times in a new ``python`` process and the median time of an empty interpreter is
+subtracted. Pass ``--budget-ms`` to exit with status 1 when importing the bare package takes longer, e.g. in CI.
+
+Run with ``python -m benchmarks.bench_import [--runs N] [--budget-ms MS]``.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    'import satisfactory_api_client': 'import satisfactory_api_client',
+    'sync client': 'from satisfactory_api_client import SatisfactoryAPI',
+    'async client': 'from satisfactory_api_client import AsyncSatisfactoryAPI',
+    'both clients': 'from satisfactory_api_client import AsyncSatisfactoryAPI, SatisfactoryAPI',
+    'data classes': 'from satisfactory_api_client.data import Response, ServerOptions',
+}
+
+
+def _median_run_time(code: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=15, help='interpreter starts per statement')
+    parser.add_argument('--budget-ms', type=float, help='fail when the bare package import takes longer')
+    args = parser.parse_args()
+
+    baseline = _median_run_time('pass', args.runs)
+    print(f"{'empty interpreter':<32} {baseline:7.1f} ms")
+    results = {}
+    for label, code in STATEMENTS.items():
+        results[label] = _median_run_time(code, args.runs) - baseline
+        print(f"{label:<32} {results[label]:+7.1f} ms")
+
+    if args.budget_ms is not None and results['import satisfactory_api_client'] > args.budget_ms:
+        print(f"Importing the package exceeds the budget of {args.budget_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Decoding cost of large ``EnumerateSessions`` responses per JSON backend.
+
+First times decoding alone: the body parsed three times, as the client used to (error check, ``errorCode`` check,
+then ``data``), versus once with each available backend. Then times whole ``enumerate_sessions`` calls against a
+local HTTPS server per backend.
+
+Run with ``python -m benchmarks.bench_json``.
+"""
+import json
+import statistics
+import time
+
+from satisfactory_api_client import SatisfactoryAPI
+from satisfactory_api_client.json_backend import STDLIB_BACKEND, decode_response, get_json_backend
+from .tls_server import LocalTLSServer, make_sessions
+
+SESSION_COUNTS = (50, 500, 2000)
+CALLS = 20
+
+
+def _backends() -> list:
+    backends = [STDLIB_BACKEND]
+    try:
+        backends.append(get_json_backend('orjson'))
+    except ImportError:
+        pass
+    return backends
+
+
+def _median_ms(call, runs: int = CALLS) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _decode_three_times(body: bytes) -> dict:
+    json.loads(body)
+    if json.loads(body).get('errorCode'):
+        raise AssertionError
+    return json.loads(body).get('data')
+
+
+def main() -> None:
+    with LocalTLSServer() as server:
+        for count in SESSION_COUNTS:
+            sessions = make_sessions(count)
+            body = json.dumps({'data': sessions}).encode()
+            print(f"EnumerateSessions with {count} sessions ({len(body) / 2 ** 20:.1f} MiB)")
+            print(f"  {'decode, json x3 (before)':<28} {_median_ms(lambda: _decode_three_times(body)):8.2f} ms")
+            for backend in _backends():
+                decode = _median_ms(lambda: decode_response(backend, body))
+                print(f"  {f'decode, {backend.name} x1':<28} {decode:8.2f} ms")
+
+            server.sessions = sessions
+            for backend in _backends():
+                with SatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True,
+                                     json_backend=backend) as api:
+                    api.enumerate_sessions()
+                    call = _median_ms(api.enumerate_sessions)
+                print(f"  {f'enumerate_sessions, {backend.name}':<28} {call:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Throughput of decompressing save bodies in this process and on a process pool.
+
+Writes a synthetic save whose body is split into 128 KiB zlib-compressed chunks, like the saves the game writes, and
+decompresses it with one worker and with one per core.
+
+Run with ``python -m benchmarks.bench_save_body``.
+"""
+import os
+import struct
+import tempfile
+import time
+import zlib
+
+from satisfactory_api_client.backup import SAVE_CHUNK_TAG
+from satisfactory_api_client.savefile import iter_save_body
+
+BODY_SIZE_MIB = 128
+CHUNK_SIZE = 128 * 1024
+
+
+def _save() -> bytes:
+    empty = struct.pack('<i', 0)
+    # A version 13 header with empty strings
+    parts = [struct.pack('<3i', 13, 46, 385_000), empty * 3, struct.pack('<iqBi', 0, 0, 0, 0), empty * 2, empty,
+             empty, empty, empty]
+    block = os.urandom(256)
+    for _ in range(BODY_SIZE_MIB * 2 ** 20 // CHUNK_SIZE):
+        piece = (block * (CHUNK_SIZE // len(block)))[:CHUNK_SIZE - 1] + os.urandom(1)
+        compressed = zlib.compress(piece)
+        parts += [SAVE_CHUNK_TAG, b'\x22\x22\x22\x22', struct.pack('<qB4q', CHUNK_SIZE, 3, len(compressed),
+                                                                     len(piece), len(compressed), len(piece)),
+                  compressed]
+    return b''.join(parts)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.sav')
+        with open(path, 'wb') as f:
+            f.write(_save())
+        for workers in sorted({1, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            size = sum(len(data) for data in iter_save_body(path, max_workers=workers))
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>2} worker(s): {size / 2 ** 20:.0f} MiB in {elapsed:.2f} s "
+                  f"({size / elapsed / 2 ** 20:,.0f} MiB/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Speed of reading the headers of many save files.
+
+Writes a directory of synthetic saves with a current header and a body of random bytes, then reads every header
+through a memory map, as when scanning a directory of backups.
+
+Run with ``python -m benchmarks.bench_save_header``.
+"""
+import os
+import struct
+import tempfile
+import time
+
+from satisfactory_api_client.savefile import iter_save_file_headers
+
+SAVES = 2000
+BODY_SIZE = 256 * 1024
+ROUNDS = 3
+
+
+def _fstring(value: str) -> bytes:
+    return struct.pack('<i', len(value) + 1) + value.encode() + b'\0'
+
+
+def _header(index: int) -> bytes:
+    return b''.join([
+        struct.pack('<3i', 14, 46, 385_000), _fstring(f'Factory_{index}'), _fstring('Persistent_Level'),
+        _fstring('?startloc=Grass Fields'), _fstring('Factory'), struct.pack('<iqBi', 3600, 638 * 10 ** 15, 1, 44),
+        _fstring('{"Mods": []}'), struct.pack('<i', 0), _fstring(f'{index:032x}'), struct.pack('<ii', 1, 1),
+        bytes(16), struct.pack('<i', 0),
+    ])
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        body = os.urandom(BODY_SIZE)
+        paths = []
+        for i in range(SAVES):
+            path = os.path.join(directory, f'Factory_{i}.sav')
+            with open(path, 'wb') as f:
+                f.write(_header(i) + body)
+            paths.append(path)
+
+        for round_ in range(ROUNDS):
+            start = time.perf_counter()
+            count = sum(1 for _ in iter_save_file_headers(paths))
+            elapsed = time.perf_counter() - start
+            print(f"round {round_}: {count} headers in {elapsed * 1000:.0f} ms ({count / elapsed:,.0f} saves/s)")
+
+
+if __name__ == '__main__':
+    main()
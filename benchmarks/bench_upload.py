@@ -0,0 +1,65 @@
+"""
+Upload throughput and peak Python memory of ``upload_save_game`` (streamed multipart body) versus building the
+multipart body in memory with ``requests.post(files=...)``.
+
+Run with ``python -m benchmarks.bench_upload [size_mib]``.
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import requests
+import urllib3
+
+from satisfactory_api_client import AsyncSatisfactoryAPI, SatisfactoryAPI
+from .tls_server import LocalTLSServer
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def _measure(label: str, size: int, upload) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    upload()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<40} {size / elapsed / 2 ** 20:8.1f} MiB/s   peak memory {peak / 2 ** 20:8.2f} MiB")
+
+
+def main() -> None:
+    size = int(sys.argv[1]) * 2 ** 20 if len(sys.argv) > 1 else 64 * 2 ** 20
+
+    with tempfile.TemporaryDirectory() as directory, LocalTLSServer() as server:
+        path = os.path.join(directory, 'bench.sav')
+        with open(path, 'wb') as f:
+            f.write(os.urandom(size))
+
+        def in_memory():
+            with open(path, 'rb') as f:
+                requests.post(f'https://127.0.0.1:{server.port}/api/v1', verify=False, files={
+                    'data': (None, json.dumps({'function': 'UploadSaveGame', 'data': {'SaveName': 'bench'}}),
+                             'application/json'),
+                    'saveGameFile': ('bench.sav', f, 'application/octet-stream')
+                })
+
+        _measure('requests files= (in memory)', size, in_memory)
+
+        with SatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True) as api:
+            _measure('SatisfactoryAPI.upload_save_game', size, lambda: api.upload_save_game('bench', path))
+        assert server.uploaded_bytes > size
+
+        async def upload_async():
+            async with AsyncSatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True) as api:
+                await api.upload_save_game('bench', path)
+
+        _measure('AsyncSatisfactoryAPI.upload_save_game', size, lambda: asyncio.run(upload_async()))
+        assert server.uploaded_bytes > size
+
+
+if __name__ == '__main__':
+    main()
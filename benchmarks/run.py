@@ -0,0 +1,182 @@
+"""
+End-to-end throughput benchmarks of ``SatisfactoryAPI`` and ``AsyncSatisfactoryAPI`` against a local HTTPS stand-in.
+
+Measures calls/sec and p50/p99 latency across concurrency levels, ``EnumerateSessions`` decoding across payload sizes,
+and save download throughput and peak Python memory across save sizes. Results are written as JSON so they can be
+compared between releases.
+
+Run with ``python -m benchmarks.run [--calls N] [--output bench_results.json]``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from importlib import metadata
+
+from satisfactory_api_client import AsyncSatisfactoryAPI, SatisfactoryAPI
+from .tls_server import LocalTLSServer, make_sessions
+
+SYNC_CONCURRENCY = (1, 4, 16)
+ASYNC_CONCURRENCY = (1, 16, 64)
+SESSION_COUNTS = (1, 50, 500)
+SAVE_SIZES_MIB = (1, 16, 64)
+
+
+def _package_version() -> str | None:
+    try:
+        return metadata.version('satisfactory_api_client')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _summary(latencies: list[float], elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        'calls': len(latencies),
+        'calls_per_second': len(latencies) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000,
+    }
+
+
+def _sync_calls(port: int, concurrency: int, calls: int, func: str) -> dict:
+    with SatisfactoryAPI('127.0.0.1', port=port, skip_ssl_verification=True, pool_maxsize=concurrency) as api:
+        call = getattr(api, func)
+        call()
+
+        def worker(count: int) -> list[float]:
+            latencies = []
+            for _ in range(count):
+                start = time.perf_counter()
+                call()
+                latencies.append(time.perf_counter() - start)
+            return latencies
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            results = executor.map(worker, [calls // concurrency] * concurrency)
+            latencies = [latency for result in results for latency in result]
+        return _summary(latencies, time.perf_counter() - start)
+
+
+async def _async_calls(port: int, concurrency: int, calls: int, func: str) -> dict:
+    async with AsyncSatisfactoryAPI('127.0.0.1', port=port, skip_ssl_verification=True,
+                                    limit_per_host=concurrency) as api:
+        await getattr(api, func)()
+        counter = iter(range(calls))
+        latencies = []
+
+        async def worker() -> None:
+            # Distinct health check payloads keep identical in-flight reads from being coalesced into one request
+            for i in counter:
+                start = time.perf_counter()
+                await (api.health_check(str(i)) if func == 'health_check' else getattr(api, func)())
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return _summary(latencies, time.perf_counter() - start)
+
+
+def _peak_memory(download) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    download()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _downloads(server: LocalTLSServer, size_mib: int) -> dict:
+    server.save_size = size_mib * 2 ** 20
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, \
+            SatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True) as api:
+        path = os.path.join(directory, 'bench.sav')
+        scenarios = {
+            'sync_bytes': lambda: api.download_save_game('bench'),
+            'sync_stream_to_file': lambda: api.download_save_game_to('bench', path),
+        }
+
+        async def async_download(to_file: bool) -> None:
+            async with AsyncSatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True) as client:
+                if to_file:
+                    await client.download_save_game_to('bench', path)
+                else:
+                    await client.download_save_game('bench')
+
+        scenarios['async_bytes'] = lambda: asyncio.run(async_download(False))
+        scenarios['async_stream_to_file'] = lambda: asyncio.run(async_download(True))
+
+        for name, download in scenarios.items():
+            elapsed, peak = _peak_memory(download)
+            results[name] = {
+                'mib_per_second': size_mib / elapsed,
+                'peak_memory_mib': peak / 2 ** 20,
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=1000, help='calls per concurrency scenario')
+    parser.add_argument('--output', default='bench_results.json', help='where to write the JSON results')
+    args = parser.parse_args()
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'package_version': _package_version(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'calls': {'sync': {}, 'async': {}},
+        'enumerate_sessions': {},
+        'downloads': {},
+    }
+
+    with LocalTLSServer() as server:
+        for concurrency in SYNC_CONCURRENCY:
+            result = _sync_calls(server.port, concurrency, args.calls, 'health_check')
+            results['calls']['sync'][concurrency] = result
+            print(f"sync  health_check  concurrency {concurrency:>3}: {result['calls_per_second']:8.0f} calls/s  "
+                  f"p50 {result['p50_ms']:6.2f} ms  p99 {result['p99_ms']:6.2f} ms")
+
+        for concurrency in ASYNC_CONCURRENCY:
+            result = asyncio.run(_async_calls(server.port, concurrency, args.calls, 'health_check'))
+            results['calls']['async'][concurrency] = result
+            print(f"async health_check  concurrency {concurrency:>3}: {result['calls_per_second']:8.0f} calls/s  "
+                  f"p50 {result['p50_ms']:6.2f} ms  p99 {result['p99_ms']:6.2f} ms")
+
+        for count in SESSION_COUNTS:
+            server.sessions = make_sessions(count)
+            size = len(json.dumps({'data': server.sessions}))
+            result = _sync_calls(server.port, 1, max(args.calls // 10, 10), 'enumerate_sessions')
+            results['enumerate_sessions'][count] = {'payload_bytes': size, **result}
+            print(f"sync  enumerate_sessions {count:>4} sessions ({size / 1024:8.1f} KiB): "
+                  f"{result['calls_per_second']:8.0f} calls/s  p50 {result['p50_ms']:6.2f} ms")
+
+        for size_mib in SAVE_SIZES_MIB:
+            result = _downloads(server, size_mib)
+            results['downloads'][size_mib] = result
+            for name, values in result.items():
+                print(f"download {size_mib:>3} MiB {name:<22}: {values['mib_per_second']:7.1f} MiB/s  "
+                      f"peak memory {values['peak_memory_mib']:7.2f} MiB")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+import json
+import os
+import ssl
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from satisfactory_api_client.testing import generate_self_signed_certificate
+
+
+_SAVE_BLOCK = os.urandom(1024 * 1024)
+
+
+def make_sessions(count: int, saves_per_session: int = 10) -> dict:
+    """
+    Build an ``EnumerateSessions`` payload.
+
+    Parameters
+    ----------
+    count : int
+        The number of sessions.
+    saves_per_session : int, optional
+        The number of save headers per session, by default 10.
+
+    Returns
+    -------
+    dict
+        The ``data`` of an ``EnumerateSessions`` response.
+    """
+    return {
+        'currentSessionIndex': 0,
+        'sessions': [{
+            'sessionName': f'Session {i}',
+            'saveHeaders': [{
+                'saveVersion': 46,
+                'buildVersion': 365306,
+                'saveName': f'Session {i}_autosave_{j}',
+                'saveLocationInfo': 'Server',
+                'mapName': 'Persistent_Level',
+                'mapOptions': '',
+                'sessionName': f'Session {i}',
+                'playDurationSeconds': 3600 * j,
+                'saveDateTime': '2024.09.10-18.00.00',
+                'isModdedSave': False,
+                'isEditedSave': False,
+                'isCreativeModeEnabled': False,
+            } for j in range(saves_per_session)]
+        } for i in range(count)]
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _drain_body(self) -> int:
+        """Read and discard a (possibly chunked) request body, returning its size."""
+        received = 0
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            while size := int(self.rfile.readline().split(b';')[0], 16):
+                received += len(self.rfile.read(size))
+                self.rfile.readline()
+            self.rfile.readline()
+            return received
+        remaining = int(self.headers.get('Content-Length', 0))
+        while remaining:
+            received += len(chunk := self.rfile.read(min(remaining, 1024 * 1024)))
+            remaining -= len(chunk)
+        return received
+
+    def do_POST(self):
+        if self.headers.get('Content-Type', '').startswith('multipart/form-data'):
+            self.server.uploaded_bytes = self._drain_body()
+            self.send_response(204)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        func = json.loads(body).get('function')
+        if func == 'DownloadSaveGame':
+            self._send_save()
+            return
+        if func == 'HealthCheck':
+            encoded = json.dumps({'data': {'health': 'healthy', 'serverCustomData': ''}}).encode()
+        elif func == 'EnumerateSessions':
+            # Encoded once when set, so large payloads measure the client rather than this server
+            encoded = self.server.sessions_body
+        else:
+            state = {'serverGameState': {'activeSessionName': 'bench', 'numConnectedPlayers': 0}}
+            encoded = json.dumps({'data': state}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json;charset=utf-8')
+        self.send_header('Content-Length', str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def _send_save(self):
+        size = self.server.save_size
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(size))
+        self.end_headers()
+        block = _SAVE_BLOCK
+        while size:
+            chunk = block[:size] if size < len(block) else block
+            self.wfile.write(chunk)
+            size -= len(chunk)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalTLSServer:
+    """
+    A minimal HTTPS stand-in for a dedicated server, answering ``/api/v1`` calls on localhost.
+
+    Use it as a context manager; ``port`` is available once it is entered. Multipart uploads are read and discarded,
+    with the size of the last one kept in ``uploaded_bytes``. ``DownloadSaveGame`` returns ``save_size`` random bytes
+    and ``EnumerateSessions`` returns ``sessions``; both can be changed while the server runs.
+    """
+
+    def __init__(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cert_path, key_path = generate_self_signed_certificate(self._tmp.name)
+        self._context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self._context.load_cert_chain(self.cert_path, key_path)
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.uploaded_bytes = 0
+        self.save_size = 1024 * 1024
+        self.sessions = make_sessions(1)
+        self._server.socket = self._context.wrap_socket(self._server.socket, server_side=True)
+        self.port: int = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> 'LocalTLSServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._tmp.cleanup()
+
+    @property
+    def uploaded_bytes(self) -> int:
+        return self._server.uploaded_bytes
+
+    @property
+    def save_size(self) -> int:
+        return self._server.save_size
+
+    @save_size.setter
+    def save_size(self, value: int) -> None:
+        self._server.save_size = value
+
+    @property
+    def sessions(self) -> dict:
+        return self._server.sessions
+
+    @sessions.setter
+    def sessions(self, value: dict) -> None:
+        self._server.sessions = value
+        self._server.sessions_body = json.dumps({'data': value}).encode()
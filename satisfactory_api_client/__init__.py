@@ -1,8 +1,60 @@
-import urllib3
-from .api_client import SatisfactoryAPI
-from .async_api_client import AsyncSatisfactoryAPI
-from .exceptions import APIError, InvalidParameterError
+import importlib
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .api_client import SatisfactoryAPI
+    from .async_api_client import AsyncSatisfactoryAPI
+    from .async_fleet import AsyncSatisfactoryFleet
+    from .backup import BackupOrchestrator, BackupStore, RetentionPolicy, SaveCatalog
+    from .cache import ResponseCache
+    from .certificates import CertificateStore, DirectoryCertificateStore
+    from .exceptions import (APIError, CertificateMismatchError, CircuitOpenError, CorruptBackupError,
+                             InvalidParameterError, SaveFormatError)
+    from .fleet import SatisfactoryFleet
+    from .metrics import MetricsRegistry
+    from .migration import migrate_save, migrate_save_async
+    from .retry import CircuitBreaker, RetryPolicy
+    from .tokens import TokenManager
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# The public names and the modules defining them. They are imported on first access, so importing the package does
+# not pay for aiohttp when only the sync client is used, or for requests when only the async client is.
+_LAZY_IMPORTS: dict[str, str] = {
+    'SatisfactoryAPI': '.api_client',
+    'AsyncSatisfactoryAPI': '.async_api_client',
+    'AsyncSatisfactoryFleet': '.async_fleet',
+    'BackupOrchestrator': '.backup',
+    'BackupStore': '.backup',
+    'RetentionPolicy': '.backup',
+    'SaveCatalog': '.backup',
+    'ResponseCache': '.cache',
+    'CertificateStore': '.certificates',
+    'DirectoryCertificateStore': '.certificates',
+    'APIError': '.exceptions',
+    'CertificateMismatchError': '.exceptions',
+    'CircuitOpenError': '.exceptions',
+    'CorruptBackupError': '.exceptions',
+    'InvalidParameterError': '.exceptions',
+    'SaveFormatError': '.exceptions',
+    'SatisfactoryFleet': '.fleet',
+    'MetricsRegistry': '.metrics',
+    'migrate_save': '.migration',
+    'migrate_save_async': '.migration',
+    'CircuitBreaker': '.retry',
+    'RetryPolicy': '.retry',
+    'TokenManager': '.tokens',
+}
 
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
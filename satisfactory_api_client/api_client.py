@@ -1,23 +1,79 @@
+import contextlib
 import os
 import ssl
+import threading
+import time
+from typing import Callable, Iterable, Iterator
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
+from .cache import MISSING, ResponseCache
+from .certificates import CertificateStore, DirectoryCertificateStore
+from .compression import Codec, DecompressingReader, open_sink, uncompressed_size
 from .data.advanced_game_settings import AdvancedGameSettings
+from .data.advanced_game_settings_state import AdvancedGameSettingsState
 from .data.minimum_privilege_level import MinimumPrivilegeLevel
 from .data.new_game_save import NewGameData
 from .data.response import Response
+from .data.server_game_state import ServerGameState
 from .data.server_options import ServerOptions
-from .exceptions import APIError
+from .data.server_options_state import ServerOptionsState
+from .data.server_state_change import ServerStateChange
+from .data.sessions import SessionList
+from .exceptions import APIError, CircuitOpenError
+from .json_backend import JSONBackend, decode_response, error_from_response, get_json_backend
+from .metrics import MetricsRegistry
+from .retry import CircuitBreaker, RetryPolicy
+from .streaming import (DEFAULT_CHUNK_SIZE, Destination, MultipartUpload, ProgressCallback, ThreadedSink, UploadSource,
+                        content_length)
+from .tokens import Credentials, TokenManager
+from .watch import DEFAULT_WATCHED_FIELDS, AdaptiveInterval, ServerStateWatcher
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+_TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+"""Errors that mean the request may succeed if sent again. SSL errors are excluded, as retrying cannot fix them."""
+
+
+def _is_transient(error: Exception) -> bool:
+    return isinstance(error, _TRANSIENT_ERRORS) and not isinstance(error, requests.exceptions.SSLError)
+
+
+class _SSLContextAdapter(HTTPAdapter):
+    """An adapter that verifies connections with a given SSL context instead of a CA bundle file."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs['ssl_context'] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert) -> None:
+        super().cert_verify(conn, url, verify, cert)
+        # Loading the default CA bundle into the shared context would make it trust more than the server's certificate
+        conn.ca_certs = None
+        conn.ca_cert_dir = None
 
 
 class SatisfactoryAPI:
     """ A client for the Satisfactory Dedicated Server API """
 
-    def __init__(self, host: str, port: int = 7777, auth_token: str = None, skip_ssl_verification: bool = False):
+    def __init__(self, host: str, port: int = 7777, auth_token: str = None, skip_ssl_verification: bool = False,
+                 pool_maxsize: int = 10, cache: ResponseCache | None = None, retry_policy: RetryPolicy | None = None,
+                 circuit_breaker: CircuitBreaker | None = None, metrics: MetricsRegistry | None = None,
+                 json_backend: str | JSONBackend | None = None, certificate_store: CertificateStore | None = None,
+                 token_manager: TokenManager | None = None, verify_token: bool = False):
         """
         Initialize the API client
 
+        The client keeps a pooled ``requests.Session`` open for its lifetime, so consecutive calls reuse the same
+        keep-alive TLS connection instead of doing a new TCP connect and TLS handshake per call. Call `close` (or use
+        the client as a context manager) to release the pooled connections.
+
         Parameters
         ----------
         host : str
@@ -30,52 +86,161 @@ class SatisfactoryAPI:
         skip_ssl_verification : bool, optional
             Disable SSL certificate verification entirely, by default False.
             When True, ``init_certificate`` has no effect and all requests skip verification.
+        pool_maxsize : int, optional
+            The maximum number of keep-alive connections kept open to the server, by default 10.
+            Raise this when the client is shared between many threads.
+        cache : ResponseCache, optional
+            A cache for the results of read-only functions such as `query_server_state`, by default None.
+            Mutating calls made through this client invalidate the results they affect.
+        retry_policy : RetryPolicy, optional
+            How to retry idempotent calls that fail with a connection error or timeout, by default None (no retries).
+        circuit_breaker : CircuitBreaker, optional
+            A circuit breaker that fails calls fast while the server is down, by default None.
+            Share one instance between clients of the same server to share its state.
+        metrics : MetricsRegistry, optional
+            A registry to record the latency, status and size of every request in, by default None.
+        json_backend : str | JSONBackend, optional
+            The JSON library to encode requests and decode responses with: 'json', 'orjson' or a `JSONBackend`,
+            by default None (``orjson`` when it is installed, the standard library otherwise).
+        certificate_store : CertificateStore, optional
+            Where `init_certificate` gets the server's certificate from, by default None (the in-memory
+            `CertificateStore.default` shared by every client).
+        token_manager : TokenManager, optional
+            Where to get and store authentication tokens, and the credentials to log in again with, by default None.
+            Without an ``auth_token`` the client starts with the manager's best token for the server.
+        verify_token : bool, optional
+            Whether to verify ``auth_token`` with a round trip to the server now, by default False: an invalid token
+            is noticed on the first call instead, which logs in again if credentials are known, as
+            `AsyncSatisfactoryAPI` does.
 
         Raises
         ------
         APIError
-            If the authentication token is invalid
+            If the authentication token is invalid and ``verify_token`` is True
         """
         self.host: str = host
         self.port: int = port
         self.auth_token: str | None = auth_token
         self.skip_ssl_verification: bool = skip_ssl_verification
         self.cert_path: str | None = None
+        self.cache: ResponseCache | None = cache
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.circuit_breaker: CircuitBreaker | None = circuit_breaker
+        self.metrics: MetricsRegistry | None = metrics
+        self.json_backend: JSONBackend = get_json_backend(json_backend)
+        self.certificate_store: CertificateStore | None = certificate_store
+        self._ssl_context: ssl.SSLContext | None = None
+        self._pool_maxsize: int = pool_maxsize
+        self.token_manager: TokenManager | None = token_manager
+        self._login: Credentials | None = None
+        self._login_lock = threading.Lock()
+
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
 
         if self.auth_token:
-            self.verify_authentication_token()
+            if verify_token:
+                self.verify_authentication_token()
+        elif token_manager is not None:
+            self.auth_token = token_manager.get(host, port)
+
+    def __enter__(self) -> 'SatisfactoryAPI':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP session and every keep-alive connection it holds.
+
+        The client can still be used afterwards; a new connection is opened on the next call.
+        """
+        self._session.close()
 
     def init_certificate(self) -> None:
         """
-        Fetch and cache the server's SSL certificate for verified HTTPS requests.
+        Fetch the server's SSL certificate for verified HTTPS requests.
 
-        Downloads the server's self-signed certificate and saves it to a local
-        ``certs/`` directory. Once called, all subsequent requests will verify
-        against this certificate instead of skipping SSL verification.
+        The certificate comes from the client's certificate store, which fetches it from the server the first time.
+        Once called, all subsequent requests are verified against this certificate instead of skipping SSL
+        verification, using an SSL context shared with every other client of the server.
 
         Raises
         ------
         ssl.SSLError
             If the certificate cannot be retrieved from the server.
+        CertificateMismatchError
+            If the certificate does not match the fingerprint pinned in the store.
         RuntimeError
             If ``skip_ssl_verification`` is True.
         """
         if self.skip_ssl_verification:
             raise RuntimeError("Cannot initialise certificate while skip_ssl_verification is enabled.")
-        certs_dir = os.path.join(os.path.dirname(__file__), 'certs')
-        os.makedirs(certs_dir, exist_ok=True)
+        store = self.certificate_store or CertificateStore.default()
+        self._ssl_context = store.ssl_context(self.host, self.port)
+        if isinstance(store, DirectoryCertificateStore):
+            self.cert_path = store.path(self.host, self.port)
+        self._session.mount('https://', _SSLContextAdapter(self._ssl_context, pool_connections=1,
+                                                           pool_maxsize=self._pool_maxsize))
+
+    @contextlib.contextmanager
+    def _request(self, func, data=None, upload: MultipartUpload | None = None
+                 ) -> Iterator[requests.Response]:
+        """
+        Send a request to the API and yield the streamed response, closing it afterwards.
 
-        cert_path = os.path.join(certs_dir, f"{self.host.replace('.', '_')}_{self.port}.pem")
+        Parameters
+        ----------
+        func : str
+            The API function to call
+        data : dict, optional
+            The data to send in the request body, by default None
+        upload : MultipartUpload, optional
+            A streaming multipart body to send instead of the JSON request, by default None
 
-        if not os.path.exists(cert_path):
-            pem_cert = ssl.get_server_certificate((self.host, self.port))
-            with open(cert_path, 'w') as f:
-                f.write(pem_cert)
-            print(f"Certificate saved to {cert_path}")
+        Yields
+        ------
+        requests.Response
+            The response, with a 200 or 204 status code. Its body has not been read yet.
 
-        self.cert_path = cert_path
+        Raises
+        ------
+        APIError
+            If the API returns a non-200/204 status code.
+        """
+        url = f"https://{self.host}:{self.port}/api/v1"
+        headers = {'Content-Type': 'application/json'}
 
-    def _post(self, func, data=None, files=None):
+        if self.auth_token:
+            headers['Authorization'] = f'Bearer {self.auth_token}'
+
+        payload = {'function': func, 'data': data} if data is not None else {'function': func}
+
+        verify = not self.skip_ssl_verification and self._ssl_context is not None
+        tracker = self.metrics.track(f'{self.host}:{self.port}', func) if self.metrics is not None else None
+        with tracker or contextlib.nullcontext():
+            if upload is None:
+                response = self._session.post(url, data=self.json_backend.dumps(payload), headers=headers,
+                                              verify=verify, stream=True)
+            else:
+                headers['Content-Type'] = upload.content_type
+                response = self._session.post(url, data=upload, headers=headers, verify=verify, stream=True)
+            try:
+                if response.status_code != 200 and response.status_code != 204:
+                    raise error_from_response(self.json_backend, response.content, response.status_code)
+                yield response
+            finally:
+                if tracker is not None:
+                    body = response.request.body
+                    if isinstance(body, bytes):
+                        tracker.bytes_sent = len(body)
+                    elif upload is not None:
+                        tracker.bytes_sent = upload.len or 0
+                    tracker.bytes_received = response.raw.tell()
+                response.close()
+
+    def _post(self, func, data=None, upload: MultipartUpload | None = None):
         """
         Post a request to the API
 
@@ -85,8 +250,8 @@ class SatisfactoryAPI:
             The API function to call
         data : dict, optional
             The data to send in the request body, by default None
-        files : dict, optional
-            The files to send in the request, by default None
+        upload : MultipartUpload, optional
+            A streaming multipart body to send instead of the JSON request, by default None
         Returns
         -------
         dict or bytes or str
@@ -96,36 +261,158 @@ class SatisfactoryAPI:
         APIError
             If the API returns an error (non-200/204 status code) or if the response contains an error message.
         """
-        url = f"https://{self.host}:{self.port}/api/v1"
-        headers = {'Content-Type': 'application/json'}
+        cache = self.cache
+        token = self.auth_token
+        if cache is not None:
+            server = f'{self.host}:{self.port}'
+            cached = cache.get(func, data, server, token)
+            if cached is not MISSING:
+                return cached
+            generation = cache.generation
+
+        try:
+            try:
+                result = self._call(func, data, upload)
+            except APIError as e:
+                # An upload has been consumed by the failed attempt, so it cannot be sent again
+                if upload is not None or not self._renew_token(e, func, token):
+                    raise
+                result = self._call(func, data, upload)
+        finally:
+            if cache is not None:
+                cache.invalidate(func, server)
+
+        if cache is not None:
+            cache.put(func, data, result, generation, server, token)
+        return result
+
+    def _call(self, func, data=None, upload: MultipartUpload | None = None):
+        """
+        Send a request with the client's circuit breaker and retry policy applied. Takes the same arguments as `_post`.
 
-        if self.auth_token:
-            headers['Authorization'] = f'Bearer {self.auth_token}'
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit breaker is open, or the half-open health check probe failed.
+        """
+        breaker = self.circuit_breaker
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None and breaker.acquire() and func != 'HealthCheck':
+                self._probe(breaker)
+            try:
+                result = self._send(func, data, upload)
+            except APIError:
+                if breaker is not None:
+                    breaker.record_success()
+                raise
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if policy is None or not _is_transient(e) or not policy.should_retry(func, attempt):
+                    raise
+                time.sleep(policy.delay(attempt - 1))
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+    def _renew_token(self, error: APIError, func: str, token: str | None) -> bool:
+        """
+        Log in again after the server rejected ``token`` as invalid, if the client knows how.
 
-        payload = {'function': func, 'data': data} if data is not None else {'function': func}
+        Parameters
+        ----------
+        error : APIError
+            The error the call failed with.
+        func : str
+            The API function that was called.
+        token : str | None
+            The token the call was made with.
 
-        verify = False if self.skip_ssl_verification else (self.cert_path or False)
-        response = requests.post(url, json=payload, headers=headers, files=files, verify=verify, stream=True)
-        if response.status_code != 200 and response.status_code != 204:
-            raise APIError(
-                error_code=response.json().get('errorCode'),
-                message=response.json().get('errorMessage')
-            )
-
-        if response.status_code == 204:
-            return {}
-
-        #  use switch
-        match response.headers.get('Content-Type'):
-            case 'application/json;charset=utf-8':
-                if response.json().get('errorCode'):
-                    raise APIError(response.json().get('errorMessage'))
-                return response.json().get('data')
-            case 'application/octet-stream':
+        Returns
+        -------
+        bool
+            Whether the client has a new token, so the call should be made once more.
+        """
+        if error.error_code != 'invalid_token' or func in ('PasswordLogin', 'PasswordlessLogin'):
+            return False
+        with self._login_lock:
+            if self.auth_token != token:
+                # Another thread logged in again while this call was in flight
+                return True
+            manager = self.token_manager
+            if manager is not None and token:
+                manager.discard(self.host, self.port, token)
+            login = self._login or (manager.credentials(self.host, self.port) if manager is not None else None)
+            if login is None:
+                return False
+            self.auth_token = None
+            privilege, password = login
+            if password is None:
+                self.passwordless_login(privilege)
+            else:
+                self.password_login(privilege, password)
+            return True
+
+    def _store_token(self, token: str, privilege: MinimumPrivilegeLevel, password: str | None) -> None:
+        self.auth_token = token
+        self._login = (privilege, password)
+        if self.token_manager is not None:
+            self.token_manager.put(self.host, self.port, privilege, token)
+
+    def _probe(self, breaker: CircuitBreaker) -> None:
+        try:
+            self._send('HealthCheck', {'ClientCustomData': ''})
+        except APIError:
+            # The server answered, so it is up again
+            pass
+        except Exception as e:
+            breaker.record_failure()
+            raise CircuitOpenError(breaker.recovery_timeout) from e
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+
+    def _send(self, func, data=None, upload: MultipartUpload | None = None):
+        """
+        Send one request to the API and decode its response. Takes the same arguments as `_post`.
+        """
+        with self._request(func, data, upload) as response:
+            if response.status_code == 204:
+                # Drain the empty body so the connection is handed back to the pool instead of being closed
+                response.content
+                return {}
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'application/json' in content_type:
+                return decode_response(self.json_backend, response.content)
+            elif content_type == 'application/octet-stream':
                 return response.content
-            case _:
+            else:
                 return response.text
 
+    @contextlib.contextmanager
+    def _stream_save_game(self, save_name: str) -> Iterator[requests.Response]:
+        with contextlib.ExitStack() as stack:
+            token = self.auth_token
+            try:
+                response = stack.enter_context(self._request('DownloadSaveGame', {'SaveName': save_name}))
+            except APIError as e:
+                if not self._renew_token(e, 'DownloadSaveGame', token):
+                    raise
+                response = stack.enter_context(self._request('DownloadSaveGame', {'SaveName': save_name}))
+            if 'application/json' in response.headers.get('Content-Type', ''):
+                raise error_from_response(self.json_backend, response.content, response.status_code)
+            yield response
+
     def health_check(self, client_custom_data='') -> (
             Response):
         """
@@ -170,6 +457,9 @@ class SatisfactoryAPI:
         """
         Perform a passwordless login and store the authentication token.
 
+        The login is remembered and repeated when the server later rejects the token as invalid. The token is also
+        stored in the client's token manager, if it has one.
+
         Parameters
         ----------
         minimum_privilege_level : MinimumPrivilegeLevel
@@ -187,13 +477,16 @@ class SatisfactoryAPI:
             (e.g., incorrect password or insufficient privileges).
         """
         response = self._post('PasswordlessLogin', {'MinimumPrivilegeLevel': minimum_privilege_level.value})
-        self.auth_token = response['authenticationToken']
+        self._store_token(response['authenticationToken'], minimum_privilege_level, None)
         return Response(success=True, data={'message': 'Successfully logged in, the token is now stored'})
 
     def password_login(self, minimum_privilege_level: MinimumPrivilegeLevel, password: str) -> Response:
         """
         Perform a password login and store the authentication token.
 
+        The login is remembered and repeated when the server later rejects the token as invalid. The token is also
+        stored in the client's token manager, if it has one.
+
         Parameters
         ----------
         minimum_privilege_level : MinimumPrivilegeLevel
@@ -216,7 +509,7 @@ class SatisfactoryAPI:
             'MinimumPrivilegeLevel': minimum_privilege_level.value,
             'Password': password
         })
-        self.auth_token = response['authenticationToken']
+        self._store_token(response['authenticationToken'], minimum_privilege_level, password)
         return Response(success=True, data={'message': 'Successfully logged in, the token is now stored'})
 
     def query_server_state(self):
@@ -226,7 +519,7 @@ class SatisfactoryAPI:
         Returns
         -------
         Response
-            A Response containing the server state data.
+            A Response containing the server state data. Its ``model`` is a typed `ServerGameState`.
 
         Raises
         ------
@@ -234,7 +527,46 @@ class SatisfactoryAPI:
             If the API returns an error.
         """
         response = self._post('QueryServerState')
-        return Response(success=True, data=response)
+        return Response(success=True, data=response, model_factory=ServerGameState.from_response)
+
+    def watch_server_state(self, callback: Callable[[ServerStateChange], None],
+                           fields: Iterable[str] = DEFAULT_WATCHED_FIELDS, min_interval: float = 1.0,
+                           max_interval: float = 30.0, backoff: float = 2.0, tick_rate_tolerance: float = 0.5,
+                           on_error: Callable[[Exception], None] | None = None) -> ServerStateWatcher:
+        """
+        Watch the server state from a background thread, calling ``callback`` only when a watched field changes.
+
+        The server is polled every ``min_interval`` seconds while players are connected; while it is paused or
+        empty the interval grows by ``backoff`` per poll, up to ``max_interval``.
+
+        Parameters
+        ----------
+        callback : Callable[[ServerStateChange], None]
+            Called from the watcher thread with every change. The first call holds every watched field.
+        fields : Iterable[str], optional
+            The ``serverGameState`` fields to watch, by default player count, tick rate, paused flag and active
+            session.
+        min_interval : float, optional
+            The polling interval in seconds while the server is busy, by default 1.0.
+        max_interval : float, optional
+            The longest polling interval in seconds while the server is idle, by default 30.0.
+        backoff : float, optional
+            The factor the interval grows by per idle poll, by default 2.0.
+        tick_rate_tolerance : float, optional
+            The smallest change of ``averageTickRate`` that is reported, by default 0.5.
+        on_error : Callable[[Exception], None], optional
+            Called when a poll or ``callback`` fails, after which the watcher keeps polling. Without it the watcher
+            stops and keeps the exception in its ``error`` attribute.
+
+        Returns
+        -------
+        ServerStateWatcher
+            The started watcher thread. Call its ``stop`` method to end the watch.
+        """
+        watcher = ServerStateWatcher(self, callback, fields, AdaptiveInterval(min_interval, max_interval, backoff),
+                                     tick_rate_tolerance, on_error)
+        watcher.start()
+        return watcher
 
     def get_server_options(self):
         """
@@ -243,7 +575,7 @@ class SatisfactoryAPI:
         Returns
         -------
         Response
-            A Response containing the server options data.
+            A Response containing the server options data. Its ``model`` is a typed `ServerOptionsState`.
 
         Raises
         ------
@@ -251,7 +583,7 @@ class SatisfactoryAPI:
             If the API returns an error.
         """
         response = self._post('GetServerOptions')
-        return Response(success=True, data=response)
+        return Response(success=True, data=response, model_factory=ServerOptionsState.from_response)
 
     def get_advanced_game_settings(self) -> Response:
         """
@@ -260,10 +592,10 @@ class SatisfactoryAPI:
         Returns
         -------
         Response
-            A Response containing the advanced game settings.
+            A Response containing the advanced game settings. Its ``model`` is a typed `AdvancedGameSettingsState`.
         """
         response = self._post('GetAdvancedGameSettings')
-        return Response(success=True, data=response)
+        return Response(success=True, data=response, model_factory=AdvancedGameSettingsState.from_response)
 
     def apply_advanced_game_settings(self, settings: AdvancedGameSettings) -> Response:
         """
@@ -526,10 +858,10 @@ class SatisfactoryAPI:
         Returns
         -------
         Response
-            A Response containing the available sessions.
+            A Response containing the available sessions. Its ``model`` is a typed `SessionList`.
         """
         response = self._post('EnumerateSessions')
-        return Response(success=True, data=response)
+        return Response(success=True, data=response, model_factory=SessionList.from_response)
 
     def load_game(self, save_name: str, enable_advanced_game_settings: bool = False) -> Response:
         """
@@ -553,9 +885,63 @@ class SatisfactoryAPI:
         })
         return Response(success=True, data=response)
 
-    def upload_save_game(self, save_name: str, load_save_game: bool = False,
-                         enable_advanced_game_settings: bool = False) -> Response:
-        raise NotImplementedError('This method is not implemented yet')
+    def upload_save_game(self, save_name: str, source: UploadSource, load_save_game: bool = False,
+                         enable_advanced_game_settings: bool = False, size: int | None = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE, compression: str | Codec | None = None) -> Response:
+        """
+        Upload a save game file.
+
+        The save is streamed to the server as a multipart request while it is being read, so it is never loaded into
+        memory as a whole.
+
+        Parameters
+        ----------
+        save_name : str
+            The name to store the save file under.
+        source : str | os.PathLike | BinaryIO | Iterable[bytes]
+            A path to the save file, a binary file object opened for reading, or an iterable of byte chunks.
+        load_save_game : bool, optional
+            Whether to load the save right after uploading it (default is False).
+        enable_advanced_game_settings : bool, optional
+            Whether to enable advanced game settings when loading the save (default is False).
+        size : int, optional
+            The size of the save in bytes. Only needed when ``source`` is an iterable; without it the upload is
+            sent with chunked transfer encoding.
+        chunk_size : int, optional
+            The number of bytes read from a path or file object at a time, by default 1 MiB.
+        compression : str | Codec, optional
+            Set when ``source`` is compressed, such as a backup written by ``download_save_game_to`` with
+            ``compression``, to decompress it while uploading: 'gzip', 'zstd', a `Codec`, or 'detect' (or 'auto') to
+            tell from its first bytes. By default None (the source is uploaded as is). ``size`` is the uncompressed
+            size; when it is not given it is read from single-member gzip files, and other files are sent chunked.
+
+        Returns
+        -------
+        Response
+            A Response indicating the success of the upload.
+
+        Raises
+        ------
+        APIError
+            If the API returns an error.
+        """
+        if compression is not None:
+            if size is None and isinstance(source, (str, os.PathLike)):
+                size = uncompressed_size(source)
+            with DecompressingReader(source, compression, chunk_size) as reader:
+                return self.upload_save_game(save_name, reader, load_save_game, enable_advanced_game_settings, size,
+                                             chunk_size)
+
+        upload = MultipartUpload({
+            'function': 'UploadSaveGame',
+            'data': {
+                'SaveName': save_name,
+                'LoadSaveGame': load_save_game,
+                'EnableAdvancedGameSettings': enable_advanced_game_settings
+            }
+        }, source, f'{save_name}.sav', size=size, chunk_size=chunk_size)
+        response = self._post('UploadSaveGame', upload=upload)
+        return Response(success=True, data=response)
 
     def download_save_game(self, save_name: str) -> Response:
         """
@@ -575,3 +961,88 @@ class SatisfactoryAPI:
             'SaveName': save_name
         })
         return Response(success=True, data=response)
+
+    def iter_save_game(self, save_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Download a save game file as a stream of chunks, without holding the whole save in memory.
+
+        The connection stays open until the generator is exhausted or closed.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the save file to download.
+        chunk_size : int, optional
+            The maximum size of each yielded chunk in bytes, by default 1 MiB.
+
+        Yields
+        ------
+        bytes
+            The next chunk of the save file.
+
+        Raises
+        ------
+        APIError
+            If the API returns an error.
+        """
+        with self._stream_save_game(save_name) as response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def download_save_game_to(self, save_name: str, destination: Destination, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                              progress: ProgressCallback | None = None, hash_algorithm: str | None = 'sha256',
+                              compression: str | Codec | None = None, compression_level: int | None = None,
+                              threaded: bool = False) -> Response:
+        """
+        Download a save game file straight to disk, chunk by chunk, so memory use does not grow with the save size.
+
+        With ``compression`` the save is compressed on the fly, so a backup takes a fraction of the disk space
+        without a second pass over the file.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the save file to download.
+        destination : str | os.PathLike | BinaryIO
+            The path to write the save to, or a binary file object opened for writing. A path is written to
+            ``<path>.part`` first and only moved into place once the download is complete.
+        chunk_size : int, optional
+            The number of bytes read from the network at a time, by default 1 MiB.
+        progress : ProgressCallback, optional
+            Called as ``progress(bytes_done, total_bytes)`` after every chunk. ``total_bytes`` is None when the
+            server does not announce the size.
+        hash_algorithm : str | None, optional
+            The ``hashlib`` algorithm used to hash the save while it is written, by default 'sha256'.
+            None disables hashing.
+        compression : str | Codec, optional
+            The codec to compress the save with: 'zstd' (needs the ``zstandard`` package), 'gzip', 'auto' (zstd when
+            installed, gzip otherwise) or a `Codec`. By default None (no compression).
+        compression_level : int, optional
+            The compression level, by default the codec's default level.
+        threaded : bool, optional
+            Whether to compress and write on a worker thread, overlapping with the network, by default False.
+
+        Returns
+        -------
+        Response
+            A Response containing the save name, the number of bytes written and the hash of the save. The size and
+            hash are those of the uncompressed save; with ``compression`` it also contains the codec, the compressed
+            size, the compression ratio, the elapsed time and the throughput.
+
+        Raises
+        ------
+        APIError
+            If the API returns an error.
+        """
+        with self._stream_save_game(save_name) as response:
+            sink = open_sink(destination, content_length(response.headers), progress, hash_algorithm, compression,
+                             compression_level)
+            if threaded:
+                sink = ThreadedSink(sink)
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    sink.write(chunk)
+            except BaseException:
+                sink.abort()
+                raise
+            sink.commit()
+        return Response(success=True, data=sink.result(save_name))
@@ -1,24 +1,61 @@
 import asyncio
+import contextlib
+import functools
+import json
 import os
 import ssl
+import time
+from typing import AsyncIterator, Iterable
 
 import aiohttp
 
+from .cache import MISSING, ResponseCache
+from .certificates import CertificateStore, DirectoryCertificateStore
+from .compression import Codec, DecompressingReader, open_sink, uncompressed_size
+from .config import READ_FUNCTIONS
 from .data.advanced_game_settings import AdvancedGameSettings
+from .data.advanced_game_settings_state import AdvancedGameSettingsState
 from .data.minimum_privilege_level import MinimumPrivilegeLevel
 from .data.new_game_save import NewGameData
 from .data.response import Response
+from .data.server_game_state import ServerGameState
 from .data.server_options import ServerOptions
-from .exceptions import APIError
+from .data.server_options_state import ServerOptionsState
+from .data.server_state_change import ServerStateChange
+from .data.sessions import SessionList
+from .exceptions import APIError, CircuitOpenError
+from .json_backend import JSONBackend, decode_response, error_from_response, get_json_backend
+from .metrics import MetricsRegistry
+from .retry import CircuitBreaker, RetryPolicy
+from .streaming import (DEFAULT_CHUNK_SIZE, Destination, MultipartUpload, ProgressCallback, ThreadedSink, UploadSource,
+                        content_length)
+from .tokens import Credentials, TokenManager
+from .watch import DEFAULT_WATCHED_FIELDS, AdaptiveInterval, diff_server_state
+
+
+_TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+"""Errors that mean the request may succeed if sent again. SSL errors are excluded, as retrying cannot fix them."""
+
+
+def _is_transient(error: Exception) -> bool:
+    return isinstance(error, _TRANSIENT_ERRORS) and not isinstance(error, aiohttp.ClientSSLError)
 
 
 class AsyncSatisfactoryAPI:
     """ An async client for the Satisfactory Dedicated Server API """
 
-    def __init__(self, host: str, port: int = 7777, auth_token: str = None, skip_ssl_verification: bool = False):
+    def __init__(self, host: str, port: int = 7777, auth_token: str = None, skip_ssl_verification: bool = False,
+                 limit_per_host: int = 10, keepalive_timeout: float = 15.0,
+                 session: aiohttp.ClientSession | None = None, cache: ResponseCache | None = None,
+                 retry_policy: RetryPolicy | None = None, circuit_breaker: CircuitBreaker | None = None,
+                 metrics: MetricsRegistry | None = None, json_backend: str | JSONBackend | None = None,
+                 certificate_store: CertificateStore | None = None, token_manager: TokenManager | None = None):
         """
         Initialize the async API client
 
+        The client holds one ``aiohttp.ClientSession`` (and its connector, DNS cache and keep-alive TLS connections)
+        for its lifetime. Use it as ``async with AsyncSatisfactoryAPI(...) as api:`` or call `close` when done.
+
         Parameters
         ----------
         host : str
@@ -31,6 +68,35 @@ class AsyncSatisfactoryAPI:
         skip_ssl_verification : bool, optional
             Disable SSL certificate verification entirely, by default False.
             When True, ``init_certificate`` has no effect and all requests skip verification.
+        limit_per_host : int, optional
+            The maximum number of simultaneous connections to the server, by default 10.
+            Ignored when ``session`` is given.
+        keepalive_timeout : float, optional
+            How many seconds an idle connection is kept open for reuse, by default 15.0.
+            Ignored when ``session`` is given.
+        session : aiohttp.ClientSession, optional
+            An externally owned session to send requests with, by default None.
+            Pass the same session to many clients to share one connector between them; the client never closes a
+            session it did not create.
+        cache : ResponseCache, optional
+            A cache for the results of read-only functions such as `query_server_state`, by default None.
+            Mutating calls made through this client invalidate the results they affect.
+        retry_policy : RetryPolicy, optional
+            How to retry idempotent calls that fail with a connection error or timeout, by default None (no retries).
+        circuit_breaker : CircuitBreaker, optional
+            A circuit breaker that fails calls fast while the server is down, by default None.
+            Share one instance between clients of the same server to share its state.
+        metrics : MetricsRegistry, optional
+            A registry to record the latency, status and size of every request in, by default None.
+        json_backend : str | JSONBackend, optional
+            The JSON library to encode requests and decode responses with: 'json', 'orjson' or a `JSONBackend`,
+            by default None (``orjson`` when it is installed, the standard library otherwise).
+        certificate_store : CertificateStore, optional
+            Where `init_certificate` gets the server's certificate from, by default None (the in-memory
+            `CertificateStore.default` shared by every client).
+        token_manager : TokenManager, optional
+            Where to get and store authentication tokens, and the credentials to log in again with, by default None.
+            Without an ``auth_token`` the client starts with the manager's best token for the server.
         """
         self.host: str = host
         self.port: int = port
@@ -38,6 +104,49 @@ class AsyncSatisfactoryAPI:
         self.skip_ssl_verification: bool = skip_ssl_verification
         self.cert_path: str | None = None
         self._ssl_context: ssl.SSLContext | None = None
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session: bool = session is None
+        self.cache: ResponseCache | None = cache
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.circuit_breaker: CircuitBreaker | None = circuit_breaker
+        self.metrics: MetricsRegistry | None = metrics
+        self.json_backend: JSONBackend = get_json_backend(json_backend)
+        self.certificate_store: CertificateStore | None = certificate_store
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self.token_manager: TokenManager | None = token_manager
+        self._login: Credentials | None = None
+        self._login_lock = asyncio.Lock()
+
+        if not self.auth_token and token_manager is not None:
+            self.auth_token = token_manager.get(host, port)
+
+    async def __aenter__(self) -> 'AsyncSatisfactoryAPI':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the client's session and its pooled connections.
+
+        An injected session is left open for its owner to close. The client can still be used afterwards; a new
+        session is created on the next call.
+        """
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._owns_session:
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or (self._owns_session and self._session.closed):
+            connector = aiohttp.TCPConnector(limit_per_host=self.limit_per_host,
+                                             keepalive_timeout=self.keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
 
     def _get_ssl(self) -> ssl.SSLContext | bool:
         if self.skip_ssl_verification:
@@ -46,39 +155,83 @@ class AsyncSatisfactoryAPI:
 
     async def init_certificate(self) -> None:
         """
-        Fetch and cache the server's SSL certificate for verified HTTPS requests.
+        Fetch the server's SSL certificate for verified HTTPS requests.
 
-        Downloads the server's self-signed certificate and saves it to a local
-        ``certs/`` directory. Once called, all subsequent requests will verify
-        against this certificate instead of skipping SSL verification.
+        The certificate comes from the client's certificate store, which fetches it from the server the first time.
+        Once called, all subsequent requests are verified against this certificate instead of skipping SSL
+        verification, using an SSL context shared with every other client of the server.
 
         Raises
         ------
         ssl.SSLError
             If the certificate cannot be retrieved from the server.
+        CertificateMismatchError
+            If the certificate does not match the fingerprint pinned in the store.
         RuntimeError
             If ``skip_ssl_verification`` is True.
         """
         if self.skip_ssl_verification:
             raise RuntimeError("Cannot initialise certificate while skip_ssl_verification is enabled.")
+        store = self.certificate_store or CertificateStore.default()
+        self._ssl_context = await store.ssl_context_async(self.host, self.port)
+        if isinstance(store, DirectoryCertificateStore):
+            self.cert_path = store.path(self.host, self.port)
+
+    @contextlib.asynccontextmanager
+    async def _request(self, func, data=None, upload: MultipartUpload | None = None
+                       ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a request to the API and yield the response, releasing it afterwards.
+
+        Parameters
+        ----------
+        func : str
+            The API function to call
+        data : dict, optional
+            The data to send in the request body, by default None
+        upload : MultipartUpload, optional
+            A streaming multipart body to send instead of the JSON request, by default None
 
-        certs_dir = os.path.join(os.path.dirname(__file__), 'certs')
-        os.makedirs(certs_dir, exist_ok=True)
+        Yields
+        ------
+        aiohttp.ClientResponse
+            The response, with a 200 or 204 status code. Its body has not been read yet.
 
-        cert_path = os.path.join(certs_dir, f"{self.host.replace('.', '_')}_{self.port}.pem")
+        Raises
+        ------
+        APIError
+            If the API returns a non-200/204 status code.
+        """
+        url = f"https://{self.host}:{self.port}/api/v1"
+        headers = {'Content-Type': 'application/json'}
 
-        if not os.path.exists(cert_path):
-            pem_cert = await asyncio.to_thread(ssl.get_server_certificate, (self.host, self.port))
-            with open(cert_path, 'w') as f:
-                f.write(pem_cert)
-            print(f"Certificate saved to {cert_path}")
+        if self.auth_token:
+            headers['Authorization'] = f'Bearer {self.auth_token}'
 
-        self.cert_path = cert_path
-        ctx = ssl.create_default_context()
-        ctx.load_verify_locations(cert_path)
-        self._ssl_context = ctx
+        payload = {'function': func, 'data': data} if data is not None else {'function': func}
 
-    async def _post(self, func, data=None, files=None):
+        session = self._get_session()
+        tracker = self.metrics.track(f'{self.host}:{self.port}', func) if self.metrics is not None else None
+        with tracker or contextlib.nullcontext():
+            if upload is None:
+                request = session.post(url, data=self.json_backend.dumps(payload), headers=headers,
+                                       ssl=self._get_ssl())
+            else:
+                headers['Content-Type'] = upload.content_type
+                if upload.len is not None:
+                    headers['Content-Length'] = str(upload.len)
+                request = session.post(url, data=upload.iter_async(), headers=headers, ssl=self._get_ssl())
+            async with request as response:
+                try:
+                    if response.status not in (200, 204):
+                        raise error_from_response(self.json_backend, await response.read(), response.status)
+                    yield response
+                finally:
+                    if tracker is not None:
+                        tracker.bytes_sent = int(response.request_info.headers.get('Content-Length', 0))
+                        tracker.bytes_received = response.content.total_bytes
+
+    async def _post(self, func, data=None, upload: MultipartUpload | None = None):
         """
         Post a request to the API
 
@@ -88,8 +241,8 @@ class AsyncSatisfactoryAPI:
             The API function to call
         data : dict, optional
             The data to send in the request body, by default None
-        files : dict, optional
-            The files to send in the request, by default None
+        upload : MultipartUpload, optional
+            A streaming multipart body to send instead of the JSON request, by default None
         Returns
         -------
         dict or bytes or str
@@ -99,36 +252,184 @@ class AsyncSatisfactoryAPI:
         APIError
             If the API returns an error (non-200/204 status code) or if the response contains an error message.
         """
-        url = f"https://{self.host}:{self.port}/api/v1"
-        headers = {'Content-Type': 'application/json'}
+        cache = self.cache
+        token = self.auth_token
+        if cache is not None:
+            server = f'{self.host}:{self.port}'
+            cached = cache.get(func, data, server, token)
+            if cached is not MISSING:
+                return cached
+            generation = cache.generation
+
+        try:
+            try:
+                result = await self._send_once(func, data, upload)
+            except APIError as e:
+                # An upload has been consumed by the failed attempt, so it cannot be sent again
+                if upload is not None or not await self._renew_token(e, func, token):
+                    raise
+                result = await self._send_once(func, data, upload)
+        finally:
+            if cache is not None:
+                cache.invalidate(func, server)
+
+        if cache is not None:
+            cache.put(func, data, result, generation, server, token)
+        return result
+
+    async def _send_once(self, func, data=None, upload: MultipartUpload | None = None):
+        if func in READ_FUNCTIONS:
+            return await self._send_coalesced(func, data)
+        return await self._call(func, data, upload)
+
+    async def _renew_token(self, error: APIError, func: str, token: str | None) -> bool:
+        """
+        Log in again after the server rejected ``token`` as invalid, if the client knows how.
 
-        if self.auth_token:
-            headers['Authorization'] = f'Bearer {self.auth_token}'
+        Concurrent calls that fail with the same token share one login.
 
-        payload = {'function': func, 'data': data} if data is not None else {'function': func}
+        Parameters
+        ----------
+        error : APIError
+            The error the call failed with.
+        func : str
+            The API function that was called.
+        token : str | None
+            The token the call was made with.
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers, ssl=self._get_ssl()) as response:
-                if response.status not in (200, 204):
-                    error_data = await response.json(content_type=None)
-                    raise APIError(
-                        error_code=error_data.get('errorCode'),
-                        message=error_data.get('errorMessage')
-                    )
-
-                if response.status == 204:
-                    return {}
-
-                content_type = response.headers.get('Content-Type', '')
-                if 'application/json' in content_type:
-                    result = await response.json(content_type=None)
-                    if result.get('errorCode'):
-                        raise APIError(result.get('errorMessage'))
-                    return result.get('data')
-                elif content_type == 'application/octet-stream':
-                    return await response.read()
-                else:
-                    return await response.text()
+        Returns
+        -------
+        bool
+            Whether the client has a new token, so the call should be made once more.
+        """
+        if error.error_code != 'invalid_token' or func in ('PasswordLogin', 'PasswordlessLogin'):
+            return False
+        async with self._login_lock:
+            if self.auth_token != token:
+                # Another call logged in again while this one was in flight
+                return True
+            manager = self.token_manager
+            if manager is not None and token:
+                manager.discard(self.host, self.port, token)
+            login = self._login or (manager.credentials(self.host, self.port) if manager is not None else None)
+            if login is None:
+                return False
+            self.auth_token = None
+            privilege, password = login
+            if password is None:
+                await self.passwordless_login(privilege)
+            else:
+                await self.password_login(privilege, password)
+            return True
+
+    def _store_token(self, token: str, privilege: MinimumPrivilegeLevel, password: str | None) -> None:
+        self.auth_token = token
+        self._login = (privilege, password)
+        if self.token_manager is not None:
+            self.token_manager.put(self.host, self.port, privilege, token)
+
+    async def _send_coalesced(self, func, data=None):
+        """
+        Send a read-only request, sharing one round trip between all identical requests that are in flight.
+
+        Every awaiter receives the same result or exception. The shared request is shielded, so cancelling one
+        awaiter does not cancel it for the others.
+        """
+        key = (func, json.dumps(data, sort_keys=True) if data is not None else '', self.auth_token)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._call(func, data))
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._finish_in_flight, key))
+        return await asyncio.shield(task)
+
+    def _finish_in_flight(self, key: tuple, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved, in case every awaiter was cancelled before it arrived
+        if not task.cancelled():
+            task.exception()
+
+    async def _call(self, func, data=None, upload: MultipartUpload | None = None):
+        """
+        Send a request with the client's circuit breaker and retry policy applied. Takes the same arguments as `_post`.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit breaker is open, or the half-open health check probe failed.
+        """
+        breaker = self.circuit_breaker
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None and breaker.acquire() and func != 'HealthCheck':
+                await self._probe(breaker)
+            try:
+                result = await self._send(func, data, upload)
+            except APIError:
+                if breaker is not None:
+                    breaker.record_success()
+                raise
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if policy is None or not _is_transient(e) or not policy.should_retry(func, attempt):
+                    raise
+                await asyncio.sleep(policy.delay(attempt - 1))
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+    async def _probe(self, breaker: CircuitBreaker) -> None:
+        try:
+            await self._send('HealthCheck', {'ClientCustomData': ''})
+        except APIError:
+            # The server answered, so it is up again
+            pass
+        except Exception as e:
+            breaker.record_failure()
+            raise CircuitOpenError(breaker.recovery_timeout) from e
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+
+    async def _send(self, func, data=None, upload: MultipartUpload | None = None):
+        """
+        Send one request to the API and decode its response. Takes the same arguments as `_post`.
+        """
+        async with self._request(func, data, upload) as response:
+            if response.status == 204:
+                return {}
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'application/json' in content_type:
+                return decode_response(self.json_backend, await response.read())
+            elif content_type == 'application/octet-stream':
+                return await response.read()
+            else:
+                return await response.text()
+
+    @contextlib.asynccontextmanager
+    async def _stream_save_game(self, save_name: str) -> AsyncIterator[aiohttp.ClientResponse]:
+        async with contextlib.AsyncExitStack() as stack:
+            token = self.auth_token
+            try:
+                response = await stack.enter_async_context(self._request('DownloadSaveGame', {'SaveName': save_name}))
+            except APIError as e:
+                if not await self._renew_token(e, 'DownloadSaveGame', token):
+                    raise
+                response = await stack.enter_async_context(self._request('DownloadSaveGame', {'SaveName': save_name}))
+            if 'application/json' in response.headers.get('Content-Type', ''):
+                raise error_from_response(self.json_backend, await response.read(), response.status)
+            yield response
 
     async def health_check(self, client_custom_data: str = '') -> Response:
         """
@@ -173,6 +474,9 @@ class AsyncSatisfactoryAPI:
         """
         Perform a passwordless login and store the authentication token.
 
+        The login is remembered and repeated when the server later rejects the token as invalid. The token is also
+        stored in the client's token manager, if it has one.
+
         Parameters
         ----------
         minimum_privilege_level : MinimumPrivilegeLevel
@@ -189,13 +493,16 @@ class AsyncSatisfactoryAPI:
             If the API returns an error or if the login is unsuccessful.
         """
         response = await self._post('PasswordlessLogin', {'MinimumPrivilegeLevel': minimum_privilege_level.value})
-        self.auth_token = response['authenticationToken']
+        self._store_token(response['authenticationToken'], minimum_privilege_level, None)
         return Response(success=True, data={'message': 'Successfully logged in, the token is now stored'})
 
     async def password_login(self, minimum_privilege_level: MinimumPrivilegeLevel, password: str) -> Response:
         """
         Perform a password login and store the authentication token.
 
+        The login is remembered and repeated when the server later rejects the token as invalid. The token is also
+        stored in the client's token manager, if it has one.
+
         Parameters
         ----------
         minimum_privilege_level : MinimumPrivilegeLevel
@@ -217,7 +524,7 @@ class AsyncSatisfactoryAPI:
             'MinimumPrivilegeLevel': minimum_privilege_level.value,
             'Password': password
         })
-        self.auth_token = response['authenticationToken']
+        self._store_token(response['authenticationToken'], minimum_privilege_level, password)
         return Response(success=True, data={'message': 'Successfully logged in, the token is now stored'})
 
     async def query_server_state(self) -> Response:
@@ -227,7 +534,7 @@ class AsyncSatisfactoryAPI:
         Returns
         -------
         Response
-            A Response containing the server state data.
+            A Response containing the server state data. Its ``model`` is a typed `ServerGameState`.
 
         Raises
         ------
@@ -235,7 +542,52 @@ class AsyncSatisfactoryAPI:
             If the API returns an error.
         """
         response = await self._post('QueryServerState')
-        return Response(success=True, data=response)
+        return Response(success=True, data=response, model_factory=ServerGameState.from_response)
+
+    async def watch_server_state(self, fields: Iterable[str] = DEFAULT_WATCHED_FIELDS, min_interval: float = 1.0,
+                                 max_interval: float = 30.0, backoff: float = 2.0,
+                                 tick_rate_tolerance: float = 0.5) -> AsyncIterator[ServerStateChange]:
+        """
+        Watch the server state, yielding only when a watched field changes.
+
+        The server is polled every ``min_interval`` seconds while players are connected; while it is paused or
+        empty the interval grows by ``backoff`` per poll, up to ``max_interval``.
+
+        Parameters
+        ----------
+        fields : Iterable[str], optional
+            The ``serverGameState`` fields to watch, by default player count, tick rate, paused flag and active
+            session.
+        min_interval : float, optional
+            The polling interval in seconds while the server is busy, by default 1.0.
+        max_interval : float, optional
+            The longest polling interval in seconds while the server is idle, by default 30.0.
+        backoff : float, optional
+            The factor the interval grows by per idle poll, by default 2.0.
+        tick_rate_tolerance : float, optional
+            The smallest change of ``averageTickRate`` that is reported, by default 0.5.
+
+        Yields
+        ------
+        ServerStateChange
+            Every change. The first one holds every watched field.
+
+        Raises
+        ------
+        APIError
+            If a poll fails.
+        """
+        fields = tuple(fields)
+        interval = AdaptiveInterval(min_interval, max_interval, backoff)
+        reported = None
+        while True:
+            state = (await self.query_server_state()).data['serverGameState']
+            changes = diff_server_state(reported, state, fields, tick_rate_tolerance)
+            if changes:
+                # Diff against the last reported values, so slow drift below the tolerance still gets reported
+                reported = {**(reported or {}), **changes}
+                yield ServerStateChange(changes=changes, state=state, timestamp=time.time())
+            await asyncio.sleep(interval.update(state))
 
     async def get_server_options(self) -> Response:
         """
@@ -244,7 +596,7 @@ class AsyncSatisfactoryAPI:
         Returns
         -------
         Response
-            A Response containing the server options data.
+            A Response containing the server options data. Its ``model`` is a typed `ServerOptionsState`.
 
         Raises
         ------
@@ -252,7 +604,7 @@ class AsyncSatisfactoryAPI:
             If the API returns an error.
         """
         response = await self._post('GetServerOptions')
-        return Response(success=True, data=response)
+        return Response(success=True, data=response, model_factory=ServerOptionsState.from_response)
 
     async def get_advanced_game_settings(self) -> Response:
         """
@@ -261,10 +613,10 @@ class AsyncSatisfactoryAPI:
         Returns
         -------
         Response
-            A Response containing the advanced game settings.
+            A Response containing the advanced game settings. Its ``model`` is a typed `AdvancedGameSettingsState`.
         """
         response = await self._post('GetAdvancedGameSettings')
-        return Response(success=True, data=response)
+        return Response(success=True, data=response, model_factory=AdvancedGameSettingsState.from_response)
 
     async def apply_advanced_game_settings(self, settings: AdvancedGameSettings) -> Response:
         """
@@ -508,10 +860,10 @@ class AsyncSatisfactoryAPI:
         Returns
         -------
         Response
-            A Response containing the available sessions.
+            A Response containing the available sessions. Its ``model`` is a typed `SessionList`.
         """
         response = await self._post('EnumerateSessions')
-        return Response(success=True, data=response)
+        return Response(success=True, data=response, model_factory=SessionList.from_response)
 
     async def load_game(self, save_name: str, enable_advanced_game_settings: bool = False) -> Response:
         """
@@ -535,9 +887,69 @@ class AsyncSatisfactoryAPI:
         })
         return Response(success=True, data=response)
 
-    async def upload_save_game(self, save_name: str, load_save_game: bool = False,
-                               enable_advanced_game_settings: bool = False) -> Response:
-        raise NotImplementedError('This method is not implemented yet')
+    async def upload_save_game(self, save_name: str, source: UploadSource, load_save_game: bool = False,
+                               enable_advanced_game_settings: bool = False, size: int | None = None,
+                               chunk_size: int = DEFAULT_CHUNK_SIZE,
+                               compression: str | Codec | None = None) -> Response:
+        """
+        Upload a save game file.
+
+        The save is streamed to the server as a multipart request while it is being read, so it is never loaded into
+        memory as a whole. File reads run in a worker thread.
+
+        Parameters
+        ----------
+        save_name : str
+            The name to store the save file under.
+        source : str | os.PathLike | BinaryIO | Iterable[bytes] | AsyncIterable[bytes]
+            A path to the save file, a binary file object opened for reading, or an (async) iterable of byte chunks.
+        load_save_game : bool, optional
+            Whether to load the save right after uploading it (default is False).
+        enable_advanced_game_settings : bool, optional
+            Whether to enable advanced game settings when loading the save (default is False).
+        size : int, optional
+            The size of the save in bytes. Only needed when ``source`` is an iterable; without it the upload is
+            sent with chunked transfer encoding.
+        chunk_size : int, optional
+            The number of bytes read from a path or file object at a time, by default 1 MiB.
+        compression : str | Codec, optional
+            Set when ``source`` is a compressed path, file object or iterable, such as a backup written by
+            ``download_save_game_to`` with ``compression``, to decompress it while uploading: 'gzip', 'zstd', a
+            `Codec`, or 'detect' (or 'auto') to tell from its first bytes. By default None (the source is uploaded as
+            is). ``size`` is the uncompressed size; when it is not given it is read from single-member gzip files,
+            and other files are sent chunked.
+
+        Returns
+        -------
+        Response
+            A Response indicating the success of the upload.
+
+        Raises
+        ------
+        APIError
+            If the API returns an error.
+        """
+        if compression is not None:
+            if size is None and isinstance(source, (str, os.PathLike)):
+                size = await asyncio.to_thread(uncompressed_size, source)
+            reader = await asyncio.to_thread(DecompressingReader, source,
+                                             compression, chunk_size)
+            try:
+                return await self.upload_save_game(save_name, reader, load_save_game, enable_advanced_game_settings,
+                                                   size, chunk_size)
+            finally:
+                await asyncio.to_thread(reader.close)
+
+        upload = MultipartUpload({
+            'function': 'UploadSaveGame',
+            'data': {
+                'SaveName': save_name,
+                'LoadSaveGame': load_save_game,
+                'EnableAdvancedGameSettings': enable_advanced_game_settings
+            }
+        }, source, f'{save_name}.sav', size=size, chunk_size=chunk_size)
+        response = await self._post('UploadSaveGame', upload=upload)
+        return Response(success=True, data=response)
 
     async def download_save_game(self, save_name: str) -> Response:
         """
@@ -555,3 +967,100 @@ class AsyncSatisfactoryAPI:
         """
         response = await self._post('DownloadSaveGame', {'SaveName': save_name})
         return Response(success=True, data=response)
+
+    async def iter_save_game(self, save_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Download a save game file as an async stream of chunks, without holding the whole save in memory.
+
+        The connection stays open until the generator is exhausted or closed.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the save file to download.
+        chunk_size : int, optional
+            The maximum size of each yielded chunk in bytes, by default 1 MiB.
+
+        Yields
+        ------
+        bytes
+            The next chunk of the save file.
+
+        Raises
+        ------
+        APIError
+            If the API returns an error.
+        """
+        async with self._stream_save_game(save_name) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
+    async def download_save_game_to(self, save_name: str, destination: Destination,
+                                    chunk_size: int = DEFAULT_CHUNK_SIZE, progress: ProgressCallback | None = None,
+                                    hash_algorithm: str | None = 'sha256', compression: str | Codec | None = None,
+                                    compression_level: int | None = None, threaded: bool = False) -> Response:
+        """
+        Download a save game file straight to disk, chunk by chunk, so memory use does not grow with the save size.
+
+        Disk writes run in a worker thread so they do not block the event loop. With ``compression`` the save is
+        compressed on the fly, so a backup takes a fraction of the disk space without a second pass over the file.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the save file to download.
+        destination : str | os.PathLike | BinaryIO
+            The path to write the save to, or a binary file object opened for writing. A path is written to
+            ``<path>.part`` first and only moved into place once the download is complete.
+        chunk_size : int, optional
+            The number of bytes read from the network at a time, by default 1 MiB.
+        progress : ProgressCallback, optional
+            Called as ``progress(bytes_done, total_bytes)`` after every chunk. ``total_bytes`` is None when the
+            server does not announce the size.
+        hash_algorithm : str | None, optional
+            The ``hashlib`` algorithm used to hash the save while it is written, by default 'sha256'.
+            None disables hashing.
+        compression : str | Codec, optional
+            The codec to compress the save with: 'zstd' (needs the ``zstandard`` package), 'gzip', 'auto' (zstd when
+            installed, gzip otherwise) or a `Codec`. By default None (no compression).
+        compression_level : int, optional
+            The compression level, by default the codec's default level.
+        threaded : bool, optional
+            Whether to keep a dedicated worker thread compressing and writing while the next chunks are received,
+            instead of handing each chunk to the default executor and waiting for it, by default False.
+
+        Returns
+        -------
+        Response
+            A Response containing the save name, the number of bytes written and the hash of the save. The size and
+            hash are those of the uncompressed save; with ``compression`` it also contains the codec, the compressed
+            size, the compression ratio, the elapsed time and the throughput.
+
+        Raises
+        ------
+        APIError
+            If the API returns an error.
+        """
+        async with self._stream_save_game(save_name) as response:
+            total = content_length(response.headers)
+            # progress is reported from the event loop rather than from the writer thread
+            sink = await asyncio.to_thread(open_sink, destination, total, None, hash_algorithm, compression,
+                                           compression_level)
+            if threaded:
+                sink = ThreadedSink(sink)
+            # Counted here, as a threaded sink's size lags behind the chunks still queued for its worker
+            received = 0
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    if threaded:
+                        await sink.write_async(chunk)
+                    else:
+                        await asyncio.to_thread(sink.write, chunk)
+                    received += len(chunk)
+                    if progress is not None:
+                        progress(received, total)
+            except BaseException:
+                await asyncio.to_thread(sink.abort)
+                raise
+            await asyncio.to_thread(sink.commit)
+        return Response(success=True, data=sink.result(save_name))
@@ -0,0 +1,241 @@
+import asyncio
+import inspect
+import time
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+
+import aiohttp
+
+from .async_api_client import AsyncSatisfactoryAPI
+from .certificates import CertificateStore
+from .data.fleet_result import FleetResult
+from .data.response import Response
+from .metrics import MetricsRegistry
+from .retry import CircuitBreaker, RetryPolicy
+from .tokens import TokenManager
+
+FleetCall = str | Callable[[AsyncSatisfactoryAPI], Awaitable[Response]]
+"""The name of an `AsyncSatisfactoryAPI` method, or a coroutine function taking the client for each server."""
+
+
+class AsyncSatisfactoryFleet:
+    """ Fans out async API calls across many Satisfactory Dedicated Servers over one shared connector """
+
+    def __init__(self, servers: Iterable[str | tuple[str, int]] = (), auth_token: str = None,
+                 skip_ssl_verification: bool = False, concurrency: int = 64, timeout: float | None = 10.0,
+                 limit_per_host: int = 4, keepalive_timeout: float = 15.0, retry_policy: RetryPolicy | None = None,
+                 circuit_breaker: Callable[[], CircuitBreaker] | None = None,
+                 metrics: MetricsRegistry | None = None, certificate_store: CertificateStore | None = None,
+                 token_manager: TokenManager | None = None):
+        """
+        Initialize the fleet
+
+        Parameters
+        ----------
+        servers : Iterable[str | tuple[str, int]], optional
+            The servers to add, as hostnames or ``(host, port)`` tuples. More can be added with `add_server`.
+        auth_token : str, optional
+            The authentication token used for every server added without its own token, by default None.
+        skip_ssl_verification : bool, optional
+            Disable SSL certificate verification for every server, by default False.
+        concurrency : int, optional
+            The maximum number of calls in flight across the whole fleet, by default 64.
+        timeout : float | None, optional
+            The time in seconds each server gets to answer a call, by default 10.0. None disables the timeout.
+            Time spent waiting for a concurrency slot does not count.
+        limit_per_host : int, optional
+            The maximum number of simultaneous connections to a single server, by default 4.
+        keepalive_timeout : float, optional
+            How many seconds an idle connection is kept open for reuse, by default 15.0.
+        retry_policy : RetryPolicy, optional
+            The retry policy of every server, by default None (no retries).
+        circuit_breaker : Callable[[], CircuitBreaker], optional
+            A factory for the circuit breaker of each server, such as ``CircuitBreaker`` or
+            ``functools.partial(CircuitBreaker, failure_threshold=3)``, by default None (no circuit breakers).
+        metrics : MetricsRegistry, optional
+            A registry every server records its requests in, by default None.
+        certificate_store : CertificateStore, optional
+            The store `init_certificates` gets certificates from, by default None (`CertificateStore.default`).
+        token_manager : TokenManager, optional
+            The token manager of every server, by default None. Servers added without a token start with the
+            manager's token for them, and log in again with its credentials when their token is rejected.
+        """
+        self.auth_token: str | None = auth_token
+        self.skip_ssl_verification: bool = skip_ssl_verification
+        self.concurrency: int = concurrency
+        self.timeout: float | None = timeout
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.circuit_breaker: Callable[[], CircuitBreaker] | None = circuit_breaker
+        self.metrics: MetricsRegistry | None = metrics
+        self.certificate_store: CertificateStore | None = certificate_store
+        self.token_manager: TokenManager | None = token_manager
+        self.clients: dict[tuple[str, int], AsyncSatisfactoryAPI] = {}
+        self._session: aiohttp.ClientSession | None = None
+
+        for server in servers:
+            host, port = (server, 7777) if isinstance(server, str) else server
+            self.add_server(host, port)
+
+    async def __aenter__(self) -> 'AsyncSatisfactoryFleet':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared session and every pooled connection of the fleet."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=0, limit_per_host=self.limit_per_host,
+                                             keepalive_timeout=self.keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def attach_session(self, client: AsyncSatisfactoryAPI) -> None:
+        """
+        Make a client of the fleet use the fleet's shared session.
+
+        The session is attached lazily, as it can only be created inside a running event loop. Call this before
+        using a client directly rather than through `call`.
+
+        Parameters
+        ----------
+        client : AsyncSatisfactoryAPI
+            The client, as returned by `add_server`.
+        """
+        client._session, client._owns_session = self._get_session(), False
+
+    def add_server(self, host: str, port: int = 7777, auth_token: str = None) -> AsyncSatisfactoryAPI:
+        """
+        Add a server to the fleet.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server
+        port : int, optional
+            The port to connect to, by default 7777
+        auth_token : str, optional
+            The authentication token for this server, by default the fleet's ``auth_token``.
+
+        Returns
+        -------
+        AsyncSatisfactoryAPI
+            The client for the server. It shares the fleet's session and must not be closed on its own.
+        """
+        client = AsyncSatisfactoryAPI(host, port, auth_token=auth_token or self.auth_token,
+                                      skip_ssl_verification=self.skip_ssl_verification,
+                                      retry_policy=self.retry_policy,
+                                      circuit_breaker=self.circuit_breaker() if self.circuit_breaker else None,
+                                      metrics=self.metrics, certificate_store=self.certificate_store,
+                                      token_manager=self.token_manager)
+        self.clients[(host, port)] = client
+        return client
+
+    def remove_server(self, host: str, port: int = 7777) -> None:
+        """
+        Remove a server from the fleet.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server
+        port : int, optional
+            The port of the server, by default 7777
+        """
+        del self.clients[(host, port)]
+
+    async def init_certificates(self) -> dict[tuple[str, int], Exception]:
+        """
+        Fetch the certificates of every server concurrently and verify all later requests against them.
+
+        Returns
+        -------
+        dict[tuple[str, int], Exception]
+            The servers whose certificate could not be fetched or did not match its pin, with the error. Those
+            servers keep their previous SSL settings.
+        """
+        store = self.certificate_store or CertificateStore.default()
+        results = await store.fetch_all_async(self.clients)
+        errors = {}
+        for server, result in results.items():
+            if isinstance(result, Exception):
+                errors[server] = result
+            else:
+                # The store has the certificate and its context now, so this does not contact the server
+                await self.clients[server].init_certificate()
+        return errors
+
+    async def verify_tokens(self) -> dict[tuple[str, int], Exception]:
+        """
+        Verify the authentication token of every server concurrently.
+
+        Servers whose token was rejected log in again if their client or the token manager knows how.
+
+        Returns
+        -------
+        dict[tuple[str, int], Exception]
+            The servers whose token could not be verified, with the error.
+        """
+        return {(result.host, result.port): result.error async for result in self.call('verify_authentication_token')
+                if not result.success}
+
+    async def _call(self, client: AsyncSatisfactoryAPI, call: FleetCall, semaphore: asyncio.Semaphore,
+                    args: tuple, kwargs: dict) -> FleetResult:
+        async with semaphore:
+            self.attach_session(client)
+            start = time.perf_counter()
+            try:
+                coroutine = getattr(client, call)(*args, **kwargs) if isinstance(call, str) else call(client)
+                response = await asyncio.wait_for(coroutine, self.timeout)
+            except Exception as e:
+                return FleetResult(client.host, client.port, error=e, elapsed=time.perf_counter() - start)
+            return FleetResult(client.host, client.port, response=response, elapsed=time.perf_counter() - start)
+
+    def call(self, call: FleetCall, *args, **kwargs) -> AsyncIterator[FleetResult]:
+        """
+        Call an API function on every server and yield the results as they complete.
+
+        A failing or timed out server does not stop the others; its exception is reported in the result instead.
+        Leaving the loop early cancels the calls that are still running.
+
+        Parameters
+        ----------
+        call : str | Callable[[AsyncSatisfactoryAPI], Awaitable[Response]]
+            The name of the `AsyncSatisfactoryAPI` method to call, such as ``'health_check'``, or a coroutine
+            function that is called with each server's client, for calls that differ per server.
+        *args
+            Positional arguments for the method, when ``call`` is a name.
+        **kwargs
+            Keyword arguments for the method, when ``call`` is a name.
+
+        Yields
+        ------
+        FleetResult
+            The result of each server, in completion order.
+
+        Raises
+        ------
+        AttributeError
+            If ``call`` does not name an `AsyncSatisfactoryAPI` method.
+        """
+        if isinstance(call, str) and not inspect.iscoroutinefunction(getattr(AsyncSatisfactoryAPI, call, None)):
+            raise AttributeError(f"AsyncSatisfactoryAPI has no API method '{call}'")
+        # Checked before the generator is created, so a typo fails at the call rather than at the first iteration
+        return self._call_all(call, args, kwargs)
+
+    async def _call_all(self, call: FleetCall, args: tuple, kwargs: dict) -> AsyncIterator[FleetResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.create_task(self._call(client, call, semaphore, args, kwargs))
+                 for client in list(self.clients.values())]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,4 @@
+from .catalog import RetentionPolicy, SaveCatalog
+from .chunking import SAVE_CHUNK_TAG, AnchorChunker
+from .orchestrator import BackupOrchestrator, BandwidthLimiter
+from .store import BackupStore
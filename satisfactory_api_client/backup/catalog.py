@@ -0,0 +1,453 @@
+import hashlib
+import os
+import pathlib
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from ..data.catalog import CatalogEntry
+from ..exceptions import SaveFormatError
+from ..savefile.header import read_save_file_header
+from ..streaming import DEFAULT_CHUNK_SIZE
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    path TEXT PRIMARY KEY,
+    server TEXT,
+    session_name TEXT,
+    save_name TEXT,
+    created REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT,
+    modified REAL
+);
+CREATE INDEX IF NOT EXISTS saves_by_session ON saves (server, session_name, created);
+CREATE INDEX IF NOT EXISTS saves_by_created ON saves (created);
+CREATE INDEX IF NOT EXISTS saves_by_hash ON saves (hash);
+"""
+
+_COLUMNS = 'path, server, session_name, save_name, created, size, hash'
+
+
+def _hours(created: float) -> int:
+    return int(created // 3600)
+
+
+def _days(created: float):
+    return datetime.fromtimestamp(created, timezone.utc).date()
+
+
+def _weeks(created: float) -> tuple[int, int]:
+    return datetime.fromtimestamp(created, timezone.utc).isocalendar()[:2]
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    Which saves of a session to keep when pruning a `SaveCatalog`.
+
+    A save is kept if any rule keeps it. The periods are UTC hours, days and ISO weeks; a period rule keeps the
+    newest save of each of the latest periods that have saves, so gaps in the backups do not use up the allowance.
+
+    Attributes
+    ----------
+    last : int
+        The number of newest saves to keep.
+    hourly : int
+        The number of hours to keep the newest save of.
+    daily : int
+        The number of days to keep the newest save of.
+    weekly : int
+        The number of weeks to keep the newest save of.
+    """
+    last: int = 0
+    hourly: int = 0
+    daily: int = 0
+    weekly: int = 0
+
+    def keeps_nothing(self) -> bool:
+        """Whether the policy would delete every save."""
+        return not (self.last or self.hourly or self.daily or self.weekly)
+
+    def select(self, entries: list[CatalogEntry]) -> list[CatalogEntry]:
+        """
+        Pick the saves to keep.
+
+        Parameters
+        ----------
+        entries : list[CatalogEntry]
+            The saves of one session, newest first.
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The saves to keep, newest first.
+        """
+        kept = set(range(min(self.last, len(entries))))
+        for count, period in ((self.hourly, _hours), (self.daily, _days), (self.weekly, _weeks)):
+            seen = set()
+            for index, entry in enumerate(entries):
+                if len(seen) >= count:
+                    break
+                key = period(entry.created)
+                if key not in seen:
+                    seen.add(key)
+                    kept.add(index)
+        return [entries[index] for index in sorted(kept)]
+
+
+def _server_from_directory(name: str) -> str:
+    # Undo the ``<host>_<port>`` directory naming of `BackupOrchestrator`; other names are kept as they are
+    host, _, port = name.rpartition('_')
+    return f'{host}:{port}' if host and port.isdigit() else name
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(DEFAULT_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SaveCatalog:
+    """
+    A SQLite index of the save files kept on disk, by server, session, save name, time, size and hash.
+
+    Queries such as the newest save of every session use the indexes of the database instead of walking directories.
+    `apply_retention` deletes the files of the saves a `RetentionPolicy` does not keep and drops their entries in one
+    transaction. The catalog may be used from several threads.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The database file. It is created when needed. ``':memory:'`` keeps the catalog in memory.
+        """
+        self.path: str = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            if self.path != ':memory:':
+                # Readers do not block the writer, and commits are much cheaper
+                self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> 'SaveCatalog':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM saves').fetchone()[0]
+
+    def add(self, path: str | os.PathLike, server: str | None = None, session_name: str | None = None,
+            save_name: str | None = None, created: float | None = None, hash: str | None = None,
+            compute_hash: bool = True) -> CatalogEntry:
+        """
+        Index a save file, replacing its entry if it has one.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The save file.
+        server : str, optional
+            The server the save was downloaded from, such as ``host:port``.
+        session_name : str, optional
+            The session of the save, by default read from the header of the file.
+        save_name : str, optional
+            The name of the save, by default read from the header of the file, or the file name for saves too old to
+            record it.
+        created : float, optional
+            When the save was taken, by default the modification time of the file.
+        hash : str, optional
+            The SHA-256 hex digest of the file, such as the ``hash`` returned by ``download_save_game_to``.
+        compute_hash : bool, optional
+            Whether to hash the file when ``hash`` is not given, by default True.
+
+        Returns
+        -------
+        CatalogEntry
+            The entry.
+
+        Raises
+        ------
+        SaveFormatError
+            If the session or save name is not given and the file is not a save file.
+        """
+        entry = self._entry(os.path.abspath(path), server, session_name, save_name, created, hash, compute_hash)
+        self.add_many([entry])
+        return entry
+
+    def add_many(self, entries: Iterable[CatalogEntry]) -> int:
+        """
+        Index many saves in one transaction, replacing the entries of the same paths.
+
+        Parameters
+        ----------
+        entries : Iterable[CatalogEntry]
+            The entries. Their paths should be absolute.
+
+        Returns
+        -------
+        int
+            The number of entries written.
+        """
+        rows = [(entry.path, entry.server, entry.session_name, entry.save_name, entry.created, entry.size, entry.hash,
+                 _modified(entry.path)) for entry in entries]
+        with self._lock, self._connection:
+            self._connection.executemany('INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def scan(self, directory: str | os.PathLike, server: str | Callable[[str], str | None] | None = None,
+             pattern: str = '*.sav', compute_hash: bool = True) -> int:
+        """
+        Index the save files below a directory.
+
+        Files that are already indexed and have not changed since are skipped, so scanning again is cheap. Files that
+        are not saves are ignored.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            The directory, searched recursively.
+        server : str | Callable[[str], str | None], optional
+            The server of the saves, or a function of the path of a save returning it. By default it is read from
+            the name of the directory holding the save, as in the ``<host>_<port>/<save name>.sav`` layout
+            `BackupOrchestrator` writes, and recorded as ``host:port`` like the servers given to `add`.
+        pattern : str, optional
+            The glob pattern of the file names, by default '*.sav'.
+        compute_hash : bool, optional
+            Whether to hash the new and changed files, by default True.
+
+        Returns
+        -------
+        int
+            The number of new or changed entries.
+        """
+        with self._lock:
+            known = dict(self._connection.execute('SELECT path, modified FROM saves'))
+        entries = []
+        for file in pathlib.Path(directory).rglob(pattern):
+            path = str(file.absolute())
+            if not file.is_file() or known.get(path) == _modified(path):
+                continue
+            if server is None:
+                file_server = _server_from_directory(file.parent.name)
+            else:
+                file_server = server(path) if callable(server) else server
+            try:
+                entries.append(self._entry(path, file_server, None, None, None, None, compute_hash))
+            except SaveFormatError:
+                continue
+        return self.add_many(entries)
+
+    def _entry(self, path: str, server: str | None, session_name: str | None, save_name: str | None,
+               created: float | None, hash: str | None, compute_hash: bool) -> CatalogEntry:
+        if session_name is None or save_name is None:
+            header = read_save_file_header(path)
+            session_name = session_name if session_name is not None else header.session_name
+            save_name = save_name if save_name is not None else (
+                header.save_name or os.path.splitext(os.path.basename(path))[0])
+        stat = os.stat(path)
+        if hash is None and compute_hash:
+            hash = _file_hash(path)
+        return CatalogEntry(path, server, session_name, save_name, created if created is not None else stat.st_mtime,
+                            stat.st_size, hash)
+
+    def get(self, path: str | os.PathLike) -> CatalogEntry | None:
+        """The entry of a file, or None if it is not indexed."""
+        with self._lock:
+            row = self._connection.execute(f'SELECT {_COLUMNS} FROM saves WHERE path = ?',
+                                           (os.path.abspath(path),)).fetchone()
+        return CatalogEntry(*row) if row is not None else None
+
+    def find(self, server: str | None = None, session_name: str | None = None, save_name: str | None = None,
+             hash: str | None = None, since: float | None = None, until: float | None = None,
+             limit: int | None = None) -> list[CatalogEntry]:
+        """
+        Look up saves. Every given filter must match.
+
+        Parameters
+        ----------
+        server : str, optional
+            The server of the saves.
+        session_name : str, optional
+            The session of the saves.
+        save_name : str, optional
+            The name of the saves.
+        hash : str, optional
+            The SHA-256 hex digest of the saves, to find copies of a save.
+        since : float, optional
+            The earliest ``created`` time, inclusive.
+        until : float, optional
+            The latest ``created`` time, exclusive.
+        limit : int, optional
+            The maximum number of saves to return.
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The saves, newest first.
+        """
+        where, parameters = _filters(server=server, session_name=session_name, save_name=save_name, hash=hash)
+        if since is not None:
+            where.append('created >= ?')
+            parameters.append(since)
+        if until is not None:
+            where.append('created < ?')
+            parameters.append(until)
+        query = f'SELECT {_COLUMNS} FROM saves{_where(where)} ORDER BY created DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            parameters.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [CatalogEntry(*row) for row in rows]
+
+    def latest(self, server: str | None = None) -> list[CatalogEntry]:
+        """
+        The newest save of every session of every server.
+
+        Parameters
+        ----------
+        server : str, optional
+            Only look at the sessions of this server.
+
+        Returns
+        -------
+        list[CatalogEntry]
+            One save per server and session, ordered by server and session.
+        """
+        where, parameters = _filters(server=server)
+        query = (f'SELECT {_COLUMNS} FROM ('
+                 f'SELECT *, ROW_NUMBER() OVER (PARTITION BY server, session_name ORDER BY created DESC) AS rank '
+                 f'FROM saves{_where(where)}) WHERE rank = 1 ORDER BY server, session_name')
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [CatalogEntry(*row) for row in rows]
+
+    def remove(self, paths: Iterable[str | os.PathLike]) -> int:
+        """
+        Drop the entries of files, leaving the files in place.
+
+        Parameters
+        ----------
+        paths : Iterable[str | os.PathLike]
+            The files.
+
+        Returns
+        -------
+        int
+            The number of entries dropped.
+        """
+        with self._lock, self._connection:
+            return self._connection.executemany('DELETE FROM saves WHERE path = ?',
+                                                [(os.path.abspath(path),) for path in paths]).rowcount
+
+    def prune_missing(self) -> int:
+        """
+        Drop the entries of files that no longer exist.
+
+        Returns
+        -------
+        int
+            The number of entries dropped.
+        """
+        with self._lock:
+            paths = [row[0] for row in self._connection.execute('SELECT path FROM saves')]
+        return self.remove(path for path in paths if not os.path.exists(path))
+
+    def apply_retention(self, policy: RetentionPolicy, server: str | None = None, session_name: str | None = None,
+                        dry_run: bool = False) -> list[CatalogEntry]:
+        """
+        Delete the saves a retention policy does not keep, applying it to every server and session separately.
+
+        The files are deleted first, then the entries of all deleted files are dropped in one transaction, so the
+        catalog never lists a file that was deleted, even if deleting a later file fails.
+
+        Parameters
+        ----------
+        policy : RetentionPolicy
+            The saves to keep.
+        server : str, optional
+            Only prune the sessions of this server.
+        session_name : str, optional
+            Only prune this session.
+        dry_run : bool, optional
+            Whether to only report the saves that would be deleted, by default False.
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The deleted saves, or with ``dry_run`` the saves that would be deleted.
+
+        Raises
+        ------
+        ValueError
+            If the policy keeps nothing.
+        OSError
+            If a file cannot be deleted. The saves deleted before it are dropped from the catalog.
+        """
+        if policy.keeps_nothing():
+            raise ValueError('The retention policy keeps no saves')
+        where, parameters = _filters(server=server, session_name=session_name)
+        with self._lock:
+            rows = self._connection.execute(
+                f'SELECT {_COLUMNS} FROM saves{_where(where)} ORDER BY server, session_name, created DESC',
+                parameters).fetchall()
+
+        doomed: list[CatalogEntry] = []
+        group: list[CatalogEntry] = []
+        for entry in (CatalogEntry(*row) for row in rows):
+            if group and (group[0].server, group[0].session_name) != (entry.server, entry.session_name):
+                doomed += _unkept(policy, group)
+                group = []
+            group.append(entry)
+        doomed += _unkept(policy, group)
+        if dry_run:
+            return doomed
+
+        deleted: list[CatalogEntry] = []
+        try:
+            for entry in doomed:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+                deleted.append(entry)
+        finally:
+            self.remove(entry.path for entry in deleted)
+        return deleted
+
+
+def _unkept(policy: RetentionPolicy, entries: list[CatalogEntry]) -> list[CatalogEntry]:
+    kept = {entry.path for entry in policy.select(entries)}
+    return [entry for entry in entries if entry.path not in kept]
+
+
+def _filters(**values) -> tuple[list[str], list]:
+    where = [f'{column} = ?' for column, value in values.items() if value is not None]
+    return where, [value for value in values.values() if value is not None]
+
+
+def _where(conditions: list[str]) -> str:
+    return f" WHERE {' AND '.join(conditions)}" if conditions else ''
+
+
+def _modified(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
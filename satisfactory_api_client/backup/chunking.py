@@ -0,0 +1,97 @@
+from typing import Iterator
+
+SAVE_CHUNK_TAG = b'\xc1\x83\x2a\x9e'
+"""The tag (``0x9E2A83C1`` little-endian) that starts every compressed chunk in the body of a Satisfactory save."""
+
+DEFAULT_MIN_CHUNK_SIZE = 64 * 1024
+"""The default size below which the chunker does not cut at an anchor."""
+
+DEFAULT_MAX_CHUNK_SIZE = 4 * 1024 * 1024
+"""The default size at which the chunker cuts even without an anchor."""
+
+
+class AnchorChunker:
+    """
+    Splits a byte stream into content-defined chunks, cutting before every occurrence of an anchor sequence.
+
+    Because the cut points depend on the content rather than on offsets, inserting or removing data only changes the
+    chunks around the edit, and identical regions of two streams produce identical chunks. A Satisfactory save body is
+    a sequence of independently compressed chunks that each start with `SAVE_CHUNK_TAG`, so cutting on that tag lines
+    the store's chunks up with the save's own. Anchors closer than ``min_size`` to the previous cut are skipped, and a
+    chunk is cut at ``max_size`` when no anchor comes, so other content still yields bounded chunks.
+
+    Searching for the anchor runs at memory speed, unlike a byte-by-byte rolling hash in Python.
+    """
+
+    def __init__(self, anchor: bytes = SAVE_CHUNK_TAG, min_size: int = DEFAULT_MIN_CHUNK_SIZE,
+                 max_size: int = DEFAULT_MAX_CHUNK_SIZE):
+        """
+        Parameters
+        ----------
+        anchor : bytes, optional
+            The byte sequence to cut before, by default `SAVE_CHUNK_TAG`.
+        min_size : int, optional
+            The minimum chunk size in bytes, except for the last chunk, by default 64 KiB.
+        max_size : int, optional
+            The maximum chunk size in bytes, by default 4 MiB.
+
+        Raises
+        ------
+        ValueError
+            If the anchor is empty or the sizes are not ``0 < min_size <= max_size``.
+        """
+        if not anchor:
+            raise ValueError("The anchor must not be empty")
+        if not 0 < min_size <= max_size:
+            raise ValueError("The chunk sizes must satisfy 0 < min_size <= max_size")
+        self.anchor: bytes = anchor
+        self.min_size: int = min_size
+        self.max_size: int = max_size
+        self._buffer = bytearray()
+        # Where to resume searching, so data that has been searched once is not searched again
+        self._search_from: int = min_size
+
+    def feed(self, data: bytes) -> Iterator[bytes]:
+        """
+        Add data to the stream.
+
+        Parameters
+        ----------
+        data : bytes
+            The next part of the stream, of any size.
+
+        Yields
+        ------
+        bytes
+            The chunks completed by the data.
+        """
+        self._buffer += data
+        return self._cut(final=False)
+
+    def finish(self) -> Iterator[bytes]:
+        """
+        End the stream.
+
+        Yields
+        ------
+        bytes
+            The chunks left, if any data is left.
+        """
+        return self._cut(final=True)
+
+    def _cut(self, final: bool) -> Iterator[bytes]:
+        buffer = self._buffer
+        anchor_size = len(self.anchor)
+        while buffer:
+            end = buffer.find(self.anchor, self._search_from, self.max_size + anchor_size)
+            if end == -1:
+                # Wait until every position an anchor could start at before max_size has been seen, so the cuts do
+                # not depend on how the stream is split into calls
+                if not final and len(buffer) < self.max_size + anchor_size:
+                    self._search_from = max(self.min_size, len(buffer) - anchor_size + 1)
+                    return
+                end = min(self.max_size, len(buffer))
+            chunk = bytes(buffer[:end])
+            del buffer[:end]
+            self._search_from = self.min_size
+            yield chunk
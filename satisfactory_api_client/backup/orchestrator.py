@@ -0,0 +1,251 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator, Awaitable
+
+from ..data.fleet_backup_result import FleetBackupResult
+from ..data.response import Response
+from ..streaming import DEFAULT_CHUNK_SIZE, SaveGameSink
+from .store import BackupStore
+
+if TYPE_CHECKING:
+    from ..async_api_client import AsyncSatisfactoryAPI
+    from ..async_fleet import AsyncSatisfactoryFleet
+
+DEFAULT_SAVE_NAME = 'backup_{time:%Y%m%d_%H%M%S}'
+"""The default template of the names of the saves a `BackupOrchestrator` creates."""
+
+
+class BandwidthLimiter:
+    """
+    A token bucket that caps the combined rate of many async byte streams.
+
+    Streams take tokens for every chunk they pass on and wait while the bucket is empty, in the order they asked. A
+    chunk larger than the bucket is let through and the debt is paid off by waiting, so the long-run rate holds for
+    any chunk size. Tokens are reserved when a stream asks and the wait happens afterwards, so a stream paying off a
+    large chunk does not hold up the bookkeeping of the others.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        """
+        Parameters
+        ----------
+        rate : float
+            The maximum rate in bytes per second.
+        burst : float, optional
+            The size of the bucket in bytes: how much may pass at once after an idle period, by default one second
+            worth of ``rate``.
+
+        Raises
+        ------
+        ValueError
+            If ``rate`` is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("The rate must be positive")
+        self.rate: float = rate
+        self.burst: float = burst if burst is not None else rate
+        self._tokens: float = self.burst
+        self._updated: float = time.monotonic()
+
+    async def acquire(self, amount: int) -> None:
+        """
+        Wait until ``amount`` bytes may pass.
+
+        Parameters
+        ----------
+        amount : int
+            The number of bytes.
+        """
+        # Taking the tokens before waiting reserves them: whoever asks next finds the bucket deeper in debt and waits
+        # longer, which keeps the waiters in order. There is no await in between, so no lock is needed.
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate) - amount
+        self._updated = now
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    async def throttle(self, stream: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """
+        Pass a stream through the limiter.
+
+        Parameters
+        ----------
+        stream : AsyncIterable[bytes]
+            The stream.
+
+        Yields
+        ------
+        bytes
+            The chunks of the stream, no faster than the limiter allows.
+        """
+        async for chunk in stream:
+            await self.acquire(len(chunk))
+            yield chunk
+
+
+class BackupOrchestrator:
+    """
+    Backs up every server of an `AsyncSatisfactoryFleet`: saves the game, waits for the save to be listed by
+    ``enumerate_sessions``, and downloads it into a `BackupStore` or a directory.
+
+    The servers move through the three stages as a pipeline: each stage has its own concurrency limit, so downloads
+    of servers that saved early overlap with the saves of later servers, without more than a few saves or downloads
+    in flight at once. Server starts are staggered, so the hitch a save causes does not hit every server at the same
+    moment, and all downloads share one bandwidth cap, which also caps the disk write rate.
+
+    A server failing does not stop the others; its exception is reported in its result. The save and each
+    ``enumerate_sessions`` call get the fleet's ``timeout``, so a server that hangs does not hold a stage slot.
+    """
+
+    def __init__(self, fleet: 'AsyncSatisfactoryFleet', destination: BackupStore | str | os.PathLike,
+                 save_name: str = DEFAULT_SAVE_NAME, save_concurrency: int = 4, confirm_concurrency: int = 8,
+                 download_concurrency: int = 2, bandwidth: float | BandwidthLimiter | None = None,
+                 stagger: float = 0.0, confirm_timeout: float = 60.0, poll_interval: float = 1.0,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Parameters
+        ----------
+        fleet : AsyncSatisfactoryFleet
+            The servers to back up, logged in with administrator privileges.
+        destination : BackupStore | str | os.PathLike
+            The store to put the saves in, or a directory to write them to as ``<host>_<port>/<save name>.sav``.
+        save_name : str, optional
+            The template of the save names, formatted with ``host``, ``port`` and ``time`` (the UTC start of the
+            round, a `datetime`), by default `DEFAULT_SAVE_NAME`.
+        save_concurrency : int, optional
+            The maximum number of servers saving at once, by default 4.
+        confirm_concurrency : int, optional
+            The maximum number of ``enumerate_sessions`` calls in flight at once, by default 8.
+        download_concurrency : int, optional
+            The maximum number of downloads in flight at once, by default 2.
+        bandwidth : float | BandwidthLimiter, optional
+            The combined download rate cap in bytes per second, or a limiter to share with other work, by default
+            None (no cap).
+        stagger : float, optional
+            The seconds between the starts of consecutive servers, by default 0.0.
+        confirm_timeout : float, optional
+            How long to wait for a new save to be listed, in seconds, by default 60.0.
+        poll_interval : float, optional
+            The seconds between ``enumerate_sessions`` calls while waiting for a save, by default 1.0.
+        chunk_size : int, optional
+            The number of bytes read from the network at a time, by default 1 MiB.
+        """
+        self.fleet: 'AsyncSatisfactoryFleet' = fleet
+        self.destination: BackupStore | str = destination if isinstance(destination, BackupStore) \
+            else os.fspath(destination)
+        self.save_name: str = save_name
+        self.limiter: BandwidthLimiter | None = BandwidthLimiter(bandwidth) \
+            if isinstance(bandwidth, (int, float)) else bandwidth
+        self.stagger: float = stagger
+        self.confirm_timeout: float = confirm_timeout
+        self.poll_interval: float = poll_interval
+        self.chunk_size: int = chunk_size
+        self._save_slots = asyncio.Semaphore(save_concurrency)
+        self._confirm_slots = asyncio.Semaphore(confirm_concurrency)
+        self._download_slots = asyncio.Semaphore(download_concurrency)
+
+    async def run(self) -> list[FleetBackupResult]:
+        """
+        Back up every server of the fleet once.
+
+        Returns
+        -------
+        list[FleetBackupResult]
+            The result of each server, in the order of ``fleet.clients``.
+        """
+        started = datetime.now(timezone.utc)
+        return list(await asyncio.gather(*(
+            self._backup(client, index * self.stagger, started)
+            for index, client in enumerate(list(self.fleet.clients.values()))
+        )))
+
+    async def run_every(self, interval: float) -> AsyncIterator[list[FleetBackupResult]]:
+        """
+        Back up the fleet on a schedule.
+
+        Parameters
+        ----------
+        interval : float
+            The seconds between the starts of consecutive rounds. A round that takes longer is followed by the next
+            one right away.
+
+        Yields
+        ------
+        list[FleetBackupResult]
+            The results of each round.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            yield await self.run()
+            await asyncio.sleep(max(0.0, started + interval - loop.time()))
+
+    async def _backup(self, client: 'AsyncSatisfactoryAPI', delay: float, started: datetime) -> FleetBackupResult:
+        await asyncio.sleep(delay)
+        self.fleet.attach_session(client)
+        result = FleetBackupResult(client.host, client.port,
+                                   self.save_name.format(host=client.host, port=client.port, time=started))
+        start = time.perf_counter()
+        try:
+            stage_start = time.perf_counter()
+            async with self._save_slots:
+                await self._with_timeout(client.save_game(result.save_name))
+            result.stages['save'] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            await self._confirm(client, result.save_name)
+            result.stages['confirm'] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            async with self._download_slots:
+                await self._download(client, result)
+            result.stages['download'] = time.perf_counter() - stage_start
+        except Exception as e:
+            result.error = e
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    async def _with_timeout(self, call: Awaitable[Response]) -> Response:
+        try:
+            return await asyncio.wait_for(call, self.fleet.timeout)
+        except asyncio.TimeoutError:
+            # A distinct class before Python 3.11
+            raise TimeoutError(f'The server did not answer within {self.fleet.timeout}s') from None
+
+    async def _confirm(self, client: 'AsyncSatisfactoryAPI', save_name: str) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.confirm_timeout
+        while True:
+            async with self._confirm_slots:
+                sessions = (await self._with_timeout(client.enumerate_sessions())).model
+            if any(header.save_name == save_name for session in sessions.sessions for header in session.save_headers):
+                return
+            if loop.time() + self.poll_interval > deadline:
+                raise TimeoutError(f'Save {save_name!r} was not listed within {self.confirm_timeout}s')
+            await asyncio.sleep(self.poll_interval)
+
+    async def _download(self, client: 'AsyncSatisfactoryAPI', result: FleetBackupResult) -> None:
+        stream = client.iter_save_game(result.save_name, self.chunk_size)
+        if self.limiter is not None:
+            stream = self.limiter.throttle(stream)
+
+        if isinstance(self.destination, BackupStore):
+            result.backup = await self.destination.write_async(result.save_name, stream,
+                                                               server=f'{client.host}:{client.port}')
+            result.size = result.backup.manifest.size
+            return
+
+        directory = os.path.join(self.destination, f"{client.host.replace(':', '_')}_{client.port}")
+        await asyncio.to_thread(os.makedirs, directory, exist_ok=True)
+        result.path = os.path.join(directory, f'{result.save_name}.sav')
+        sink = await asyncio.to_thread(SaveGameSink, result.path, None, None, None)
+        try:
+            async for chunk in stream:
+                await asyncio.to_thread(sink.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(sink.abort)
+            raise
+        await asyncio.to_thread(sink.commit)
+        result.size = sink.size
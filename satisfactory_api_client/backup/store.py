@@ -0,0 +1,376 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+import urllib.parse
+from typing import TYPE_CHECKING, AsyncIterable, Callable, Iterable, Iterator
+
+from ..data.backup import BackupManifest, BackupResult
+from ..exceptions import CorruptBackupError
+from ..streaming import DEFAULT_CHUNK_SIZE, Destination, ProgressCallback, SaveGameSink
+from .chunking import AnchorChunker
+
+if TYPE_CHECKING:
+    from ..api_client import SatisfactoryAPI
+    from ..async_api_client import AsyncSatisfactoryAPI
+
+
+class _Ingest:
+    """The state of one save being written to a store: the chunker, the running hash and the counts."""
+
+    def __init__(self, store: 'BackupStore'):
+        self.store = store
+        self.chunker = store.chunker()
+        self.hash = hashlib.sha256()
+        self.size = 0
+        self.chunks: list[str] = []
+        self.new_chunks = 0
+        self.new_bytes = 0
+
+    def feed(self, data: bytes) -> None:
+        self.hash.update(data)
+        self.size += len(data)
+        self._put(self.chunker.feed(data))
+
+    def finish(self) -> None:
+        self._put(self.chunker.finish())
+
+    def _put(self, chunks: Iterable[bytes]) -> None:
+        for chunk in chunks:
+            digest, new = self.store.put_chunk(chunk)
+            self.chunks.append(digest)
+            if new:
+                self.new_chunks += 1
+                self.new_bytes += len(chunk)
+
+
+class BackupStore:
+    """
+    A deduplicating, content-addressed store of save game backups in a directory.
+
+    Saves are split into content-defined chunks by an `AnchorChunker`, and each chunk is stored once under its SHA-256
+    digest, no matter how many backups contain it. A backup is a `BackupManifest` listing the digests of its chunks, so
+    storing a save that mostly matches an earlier one only writes the chunks that changed. Saves are streamed through
+    the store as they are downloaded and never held in memory whole.
+
+    The layout is ``chunks/<first 2 hex digits>/<digest>`` for chunks and
+    ``manifests/<save name>/<created>.json`` for manifests. Files are written under a temporary name and renamed into
+    place, so several processes can share a store and an interrupted backup never leaves a partial file behind.
+    """
+
+    def __init__(self, root: str | os.PathLike, chunker: Callable[[], AnchorChunker] = AnchorChunker):
+        """
+        Parameters
+        ----------
+        root : str | os.PathLike
+            The directory of the store. It is created when needed.
+        chunker : Callable[[], AnchorChunker], optional
+            A factory for the chunker of each save, such as ``functools.partial(AnchorChunker, max_size=1 << 20)``,
+            by default `AnchorChunker`. Changing it for an existing store is safe but lowers deduplication against
+            the saves stored before.
+        """
+        self.root: str = os.fspath(root)
+        self.chunker: Callable[[], AnchorChunker] = chunker
+
+    def chunk_path(self, digest: str) -> str:
+        """The path a chunk is stored at."""
+        return os.path.join(self.root, 'chunks', digest[:2], digest)
+
+    def _manifest_dir(self, save_name: str) -> str:
+        # Quote everything, dots included, so a save name can never escape the manifests directory
+        return os.path.join(self.root, 'manifests', urllib.parse.quote(save_name, safe='').replace('.', '%2E'))
+
+    def manifest_path(self, save_name: str, created: float) -> str:
+        """The path the manifest of a backup is stored at."""
+        return os.path.join(self._manifest_dir(save_name), f'{created:.6f}.json')
+
+    def _write_file(self, path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def put_chunk(self, chunk: bytes) -> tuple[str, bool]:
+        """
+        Store a chunk unless it is stored already.
+
+        Parameters
+        ----------
+        chunk : bytes
+            The chunk.
+
+        Returns
+        -------
+        tuple[str, bool]
+            The SHA-256 hex digest of the chunk, and whether it was new.
+        """
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self.chunk_path(digest)
+        if os.path.exists(path):
+            return digest, False
+        self._write_file(path, chunk)
+        return digest, True
+
+    def get_chunk(self, digest: str, verify: bool = True) -> bytes:
+        """
+        Read a stored chunk.
+
+        Parameters
+        ----------
+        digest : str
+            The SHA-256 hex digest of the chunk.
+        verify : bool, optional
+            Whether to check the chunk against its digest, by default True.
+
+        Returns
+        -------
+        bytes
+            The chunk.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the chunk is not stored.
+        CorruptBackupError
+            If ``verify`` is True and the chunk does not match its digest.
+        """
+        with open(self.chunk_path(digest), 'rb') as f:
+            chunk = f.read()
+        if verify:
+            actual = hashlib.sha256(chunk).hexdigest()
+            if actual != digest:
+                raise CorruptBackupError(digest, actual)
+        return chunk
+
+    def _commit(self, ingest: _Ingest, save_name: str, server: str | None, created: float | None,
+                started: float) -> BackupResult:
+        ingest.finish()
+        manifest = BackupManifest(save_name=save_name, created=time.time() if created is None else created,
+                                  size=ingest.size, sha256=ingest.hash.hexdigest(), chunks=ingest.chunks, server=server)
+        self._write_file(self.manifest_path(save_name, manifest.created), json.dumps(manifest.to_dict()).encode())
+        return BackupResult(manifest=manifest, new_chunks=ingest.new_chunks, new_bytes=ingest.new_bytes,
+                            elapsed=time.perf_counter() - started)
+
+    def write(self, save_name: str, stream: Iterable[bytes], server: str | None = None, created: float | None = None
+              ) -> BackupResult:
+        """
+        Store a save from a stream of bytes.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the save.
+        stream : Iterable[bytes]
+            The content of the save, in parts of any size.
+        server : str, optional
+            The ``host:port`` of the server the save comes from, by default None.
+        created : float, optional
+            The ``time.time()`` to record the backup under, by default now.
+
+        Returns
+        -------
+        BackupResult
+            The manifest of the backup, with how much of it was new.
+        """
+        started = time.perf_counter()
+        ingest = _Ingest(self)
+        for data in stream:
+            ingest.feed(data)
+        return self._commit(ingest, save_name, server, created, started)
+
+    async def write_async(self, save_name: str, stream: AsyncIterable[bytes], server: str | None = None,
+                          created: float | None = None) -> BackupResult:
+        """Like `write`, for an async stream. Hashing and disk writes run in a worker thread."""
+        started = time.perf_counter()
+        ingest = _Ingest(self)
+        async for data in stream:
+            await asyncio.to_thread(ingest.feed, data)
+        return await asyncio.to_thread(self._commit, ingest, save_name, server, created, started)
+
+    def backup(self, client: 'SatisfactoryAPI', save_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+               ) -> BackupResult:
+        """
+        Download a save from a server and store it, writing only the chunks the store does not have yet.
+
+        Parameters
+        ----------
+        client : SatisfactoryAPI
+            The client of the server, logged in with administrator privileges.
+        save_name : str
+            The name of the save.
+        chunk_size : int, optional
+            The number of bytes read from the network at a time, by default 1 MiB.
+
+        Returns
+        -------
+        BackupResult
+            The manifest of the backup, with how much of it was new and how long it took.
+        """
+        return self.write(save_name, client.iter_save_game(save_name, chunk_size),
+                          server=f'{client.host}:{client.port}')
+
+    async def backup_async(self, client: 'AsyncSatisfactoryAPI', save_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+                           ) -> BackupResult:
+        """Like `backup`, with an `AsyncSatisfactoryAPI`."""
+        return await self.write_async(save_name, client.iter_save_game(save_name, chunk_size),
+                                      server=f'{client.host}:{client.port}')
+
+    def manifests(self, save_name: str | None = None) -> list[BackupManifest]:
+        """
+        List the stored backups.
+
+        Parameters
+        ----------
+        save_name : str, optional
+            Only list the backups of this save, by default None (all backups).
+
+        Returns
+        -------
+        list[BackupManifest]
+            The manifests, oldest first.
+        """
+        if save_name is not None:
+            directories = [self._manifest_dir(save_name)]
+        else:
+            root = os.path.join(self.root, 'manifests')
+            directories = [entry.path for entry in os.scandir(root)] if os.path.isdir(root) else []
+        manifests = []
+        for directory in directories:
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.name.endswith('.json') and not entry.name.startswith('.'):
+                    with open(entry.path, 'rb') as f:
+                        manifests.append(BackupManifest.from_dict(json.loads(f.read())))
+        manifests.sort(key=lambda manifest: manifest.created)
+        return manifests
+
+    def manifest(self, save_name: str, created: float | None = None) -> BackupManifest:
+        """
+        Find a backup by save name and time.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the save.
+        created : float, optional
+            A ``time.time()``; the last backup taken at or before it is returned. By default None (the latest backup).
+
+        Returns
+        -------
+        BackupManifest
+            The manifest of the backup.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no such backup.
+        """
+        candidates = [manifest for manifest in self.manifests(save_name)
+                      if created is None or manifest.created <= created]
+        if not candidates:
+            raise FileNotFoundError(f'No backup of save {save_name!r} found')
+        return candidates[-1]
+
+    def iter_save(self, manifest: BackupManifest, verify: bool = True) -> Iterator[bytes]:
+        """
+        Reassemble a backed up save chunk by chunk.
+
+        Parameters
+        ----------
+        manifest : BackupManifest
+            The manifest of the backup, from `manifest` or `manifests`.
+        verify : bool, optional
+            Whether to check every chunk against its digest, by default True.
+
+        Yields
+        ------
+        bytes
+            The chunks of the save, in order.
+        """
+        for digest in manifest.chunks:
+            yield self.get_chunk(digest, verify)
+
+    def restore(self, save_name: str, destination: Destination, created: float | None = None, verify: bool = True,
+                progress: ProgressCallback | None = None) -> BackupManifest:
+        """
+        Reassemble a backed up save into a file.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the save.
+        destination : str | os.PathLike | BinaryIO
+            The path to write the save to, or a binary file object opened for writing. A path is only created once
+            the whole save has been written and verified.
+        created : float, optional
+            A ``time.time()``; the last backup taken at or before it is restored. By default None (the latest backup).
+        verify : bool, optional
+            Whether to check every chunk and the whole save against their digests, by default True.
+        progress : ProgressCallback, optional
+            Called after every chunk with the bytes written so far and the size of the save.
+
+        Returns
+        -------
+        BackupManifest
+            The manifest of the restored backup.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no such backup, or one of its chunks is missing.
+        CorruptBackupError
+            If ``verify`` is True and the data does not match its digests.
+        """
+        manifest = self.manifest(save_name, created)
+        sink = SaveGameSink(destination, manifest.size, progress, 'sha256' if verify else None)
+        try:
+            for chunk in self.iter_save(manifest, verify):
+                sink.write(chunk)
+            if verify:
+                actual = sink.result(save_name)['hash']
+                if actual != manifest.sha256:
+                    raise CorruptBackupError(manifest.sha256, actual)
+        except BaseException:
+            sink.abort()
+            raise
+        sink.commit()
+        return manifest
+
+    def stats(self) -> dict:
+        """
+        Measure the deduplication of the whole store.
+
+        Returns
+        -------
+        dict
+            The number of backups (``backups``) and of distinct chunks (``chunks``), the total size of all backups
+            (``logical_bytes``), the size of the stored chunks (``stored_bytes``) and the fraction of the logical
+            bytes that deduplication saved (``dedup_ratio``).
+        """
+        manifests = self.manifests()
+        logical_bytes = sum(manifest.size for manifest in manifests)
+        stored_bytes = 0
+        chunks = 0
+        root = os.path.join(self.root, 'chunks')
+        if os.path.isdir(root):
+            for directory in os.scandir(root):
+                for entry in os.scandir(directory.path):
+                    if not entry.name.startswith('.'):
+                        chunks += 1
+                        stored_bytes += entry.stat().st_size
+        return {
+            'backups': len(manifests),
+            'chunks': chunks,
+            'logical_bytes': logical_bytes,
+            'stored_bytes': stored_bytes,
+            'dedup_ratio': 1.0 - stored_bytes / logical_bytes if logical_bytes else 0.0,
+        }
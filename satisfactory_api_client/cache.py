@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTLS: dict[str, float] = {
+    'QueryServerState': 2.0,
+    'GetServerOptions': 30.0,
+    'GetAdvancedGameSettings': 30.0,
+    'EnumerateSessions': 10.0,
+}
+"""The default number of seconds each read function is cached for."""
+
+_ALL_READS = tuple(DEFAULT_TTLS)
+
+INVALIDATED_BY: dict[str, tuple[str, ...]] = {
+    'ApplyServerOptions': ('GetServerOptions',),
+    'ApplyAdvancedGameSettings': ('GetAdvancedGameSettings', 'QueryServerState'),
+    'RenameServer': ('QueryServerState',),
+    'SetAutoLoadSessionName': ('QueryServerState',),
+    'SaveGame': ('EnumerateSessions',),
+    'DeleteSaveFile': ('EnumerateSessions',),
+    'DeleteSaveSession': ('EnumerateSessions',),
+    'UploadSaveGame': _ALL_READS,
+    'LoadGame': _ALL_READS,
+    'CreateNewGame': _ALL_READS,
+    'ClaimServer': _ALL_READS,
+    'RunCommand': _ALL_READS,
+    'Shutdown': _ALL_READS,
+}
+"""The cached read functions whose results are dropped when a mutating function is called."""
+
+MISSING = object()
+"""Returned by `ResponseCache.get` when there is no fresh entry."""
+
+
+class ResponseCache:
+    """
+    A bounded, thread-safe TTL cache for the results of read-only API functions.
+
+    Pass one to a client with ``cache=ResponseCache()``. Results of the functions in ``ttls`` are served from the
+    cache until they expire, and calling a mutating function (see `INVALIDATED_BY`) drops the results it affects.
+    Results are kept per server and per authentication token, so one cache can be shared by the clients of several
+    servers, or of one server with different privileges. Cached data is shared between callers and must be treated
+    as read-only.
+    """
+
+    def __init__(self, ttls: dict[str, float | None] | None = None, maxsize: int = 256):
+        """
+        Parameters
+        ----------
+        ttls : dict[str, float | None], optional
+            Seconds to cache each API function for, merged over `DEFAULT_TTLS`. Set a function to None or 0 to
+            stop caching it.
+        maxsize : int, optional
+            The maximum number of entries; the least recently used entry is evicted first, by default 256.
+        """
+        self.ttls: dict[str, float] = {func: ttl for func, ttl in {**DEFAULT_TTLS, **(ttls or {})}.items() if ttl}
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.generation: int = 0
+        self._entries: OrderedDict[tuple[str, str, str, str], tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(func: str, data: dict | None, server: str, token: str | None) -> tuple[str, str, str, str]:
+        return func, server, token or '', json.dumps(data, sort_keys=True) if data is not None else ''
+
+    def get(self, func: str, data: dict | None = None, server: str = '', token: str | None = None) -> object:
+        """
+        Look up the cached result of an API call.
+
+        Parameters
+        ----------
+        func : str
+            The API function.
+        data : dict, optional
+            The data sent with the call.
+        server : str, optional
+            The server the call is sent to, such as ``host:port``.
+        token : str, optional
+            The authentication token the call is sent with, as results depend on its privilege level.
+
+        Returns
+        -------
+        object
+            The cached result, or `MISSING` if the function is not cached or the entry is absent or expired.
+        """
+        if func not in self.ttls:
+            return MISSING
+        key = self._key(func, data, server, token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, func: str, data: dict | None, value: object, generation: int, server: str = '',
+            token: str | None = None) -> None:
+        """
+        Store the result of an API call.
+
+        Parameters
+        ----------
+        func : str
+            The API function.
+        data : dict | None
+            The data sent with the call.
+        value : object
+            The result to cache.
+        generation : int
+            The value of `generation` read before the call was sent. The result is dropped if an invalidation
+            happened while the call was in flight, as it may be stale.
+        server : str, optional
+            The server the call was sent to.
+        token : str, optional
+            The authentication token the call was sent with.
+        """
+        if func not in self.ttls:
+            return
+        key = self._key(func, data, server, token)
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttls[func], value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, func: str, server: str | None = None) -> None:
+        """
+        Drop the cached results affected by a call to ``func``. Does nothing for functions that change nothing.
+
+        Parameters
+        ----------
+        func : str
+            The API function that was called.
+        server : str, optional
+            The server it was called on, whose results are dropped for every token. By default the results of every
+            server are dropped.
+        """
+        affected = INVALIDATED_BY.get(func)
+        if not affected:
+            return
+        with self._lock:
+            self.generation += 1
+            for key in [key for key in self._entries if key[0] in affected and server in (None, key[1])]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        Returns
+        -------
+        dict
+            The number of hits, misses, evictions and current entries.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+            }
@@ -0,0 +1,228 @@
+import asyncio
+import hashlib
+import os
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from .exceptions import CertificateMismatchError
+
+Server = tuple[str, int]
+
+
+def fingerprint(pem: str) -> str:
+    """
+    Compute the SHA-256 fingerprint of a certificate.
+
+    Parameters
+    ----------
+    pem : str
+        The certificate in PEM format.
+
+    Returns
+    -------
+    str
+        The fingerprint as lowercase hex without separators.
+    """
+    return hashlib.sha256(ssl.PEM_cert_to_DER_cert(pem)).hexdigest()
+
+
+def _normalize_fingerprint(value: str) -> str:
+    return value.replace(':', '').lower()
+
+
+class CertificateStore:
+    """
+    Fetches and keeps the self-signed certificates of dedicated servers in memory, and builds the SSL contexts that
+    verify connections against them.
+
+    One `ssl.SSLContext` is built per certificate and shared by every client of the server, so the CA data is parsed
+    once per process instead of once per client or request. Pass a store to clients with
+    ``certificate_store=...``; clients without one share `CertificateStore.default`.
+
+    Certificates are trusted on first use unless pinned: with ``pins`` a fetched or stored certificate is only
+    accepted if its SHA-256 fingerprint matches.
+    """
+
+    _default: 'CertificateStore | None' = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, pins: dict[str, str] | None = None, check_hostname: bool = True):
+        """
+        Parameters
+        ----------
+        pins : dict[str, str], optional
+            The expected SHA-256 fingerprints of server certificates, keyed by ``host:port``, as hex with or without
+            colons (as printed by ``openssl x509 -fingerprint -sha256``). Servers without a pin are trusted on first
+            use.
+        check_hostname : bool, optional
+            Whether the host name must also match the certificate, by default True. Self-signed server certificates
+            often do not name the address they are reached on; disable this when pinning such certificates.
+        """
+        self.pins: dict[str, str] = {server: _normalize_fingerprint(value) for server, value in (pins or {}).items()}
+        self.check_hostname: bool = check_hostname
+        self._certificates: dict[Server, str] = {}
+        self._contexts: dict[str, ssl.SSLContext] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> 'CertificateStore':
+        """The in-memory store shared by clients created without a store."""
+        with cls._default_lock:
+            if CertificateStore._default is None:
+                CertificateStore._default = CertificateStore()
+            return CertificateStore._default
+
+    def _load(self, host: str, port: int) -> str | None:
+        """Look up a stored certificate. Subclasses may read it from elsewhere."""
+        return self._certificates.get((host, port))
+
+    def _save(self, host: str, port: int, pem: str) -> None:
+        """Store a fetched certificate. Subclasses may persist it elsewhere as well."""
+        self._certificates[(host, port)] = pem
+
+    def _check(self, host: str, port: int, pem: str) -> None:
+        pin = self.pins.get(f'{host}:{port}')
+        if pin is not None and fingerprint(pem) != pin:
+            raise CertificateMismatchError(host, port, pin, fingerprint(pem))
+
+    def get(self, host: str, port: int = 7777) -> str:
+        """
+        Get the certificate of a server, fetching it from the server if it is not stored yet.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server.
+        port : int, optional
+            The port of the server, by default 7777.
+
+        Returns
+        -------
+        str
+            The certificate in PEM format.
+
+        Raises
+        ------
+        ssl.SSLError
+            If the certificate cannot be retrieved from the server.
+        CertificateMismatchError
+            If the certificate does not match the server's pin.
+        """
+        with self._lock:
+            pem = self._load(host, port)
+        if pem is None:
+            pem = ssl.get_server_certificate((host, port))
+            self._check(host, port, pem)
+            with self._lock:
+                self._save(host, port, pem)
+        else:
+            self._check(host, port, pem)
+        return pem
+
+    async def get_async(self, host: str, port: int = 7777) -> str:
+        """Like `get`, with the blocking work run in a worker thread."""
+        return await asyncio.to_thread(self.get, host, port)
+
+    def ssl_context(self, host: str, port: int = 7777) -> ssl.SSLContext:
+        """
+        Get the SSL context that verifies connections to a server against its certificate.
+
+        The certificate is fetched first if needed. Servers with the same certificate share one context.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server.
+        port : int, optional
+            The port of the server, by default 7777.
+
+        Returns
+        -------
+        ssl.SSLContext
+            The shared context. Do not modify it.
+        """
+        pem = self.get(host, port)
+        key = fingerprint(pem)
+        with self._lock:
+            context = self._contexts.get(key)
+            if context is None:
+                context = ssl.create_default_context(cadata=pem)
+                context.check_hostname = self.check_hostname
+                self._contexts[key] = context
+        return context
+
+    async def ssl_context_async(self, host: str, port: int = 7777) -> ssl.SSLContext:
+        """Like `ssl_context`, with the blocking work run in a worker thread."""
+        return await asyncio.to_thread(self.ssl_context, host, port)
+
+    def fetch_all(self, servers: Iterable[Server], max_workers: int = 16) -> dict[Server, ssl.SSLContext | Exception]:
+        """
+        Fetch the certificates of many servers concurrently and build their SSL contexts.
+
+        Parameters
+        ----------
+        servers : Iterable[tuple[str, int]]
+            The ``(host, port)`` of each server.
+        max_workers : int, optional
+            The number of servers contacted at once, by default 16.
+
+        Returns
+        -------
+        dict[tuple[str, int], ssl.SSLContext | Exception]
+            The context of each server, or the error that prevented getting it.
+        """
+        servers = list(dict.fromkeys(servers))
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(servers)))) as executor:
+            futures = {server: executor.submit(self.ssl_context, *server) for server in servers}
+        return {server: future.exception() or future.result() for server, future in futures.items()}
+
+    async def fetch_all_async(self, servers: Iterable[Server]) -> dict[Server, ssl.SSLContext | Exception]:
+        """Like `fetch_all`, from an event loop. Servers are contacted on the loop's default executor."""
+        servers = list(dict.fromkeys(servers))
+        results = await asyncio.gather(*(self.ssl_context_async(*server) for server in servers),
+                                       return_exceptions=True)
+        return dict(zip(servers, results))
+
+
+class DirectoryCertificateStore(CertificateStore):
+    """
+    A `CertificateStore` that also keeps certificates as ``<host>_<port>.pem`` files in a directory, so they are
+    reused by later runs.
+    """
+
+    def __init__(self, directory: str | os.PathLike, pins: dict[str, str] | None = None, check_hostname: bool = True):
+        """
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            The directory to keep certificates in. It is created when needed.
+        pins : dict[str, str], optional
+            The expected SHA-256 fingerprints of server certificates, keyed by ``host:port``.
+        check_hostname : bool, optional
+            Whether the host name must also match the certificate, by default True.
+        """
+        super().__init__(pins, check_hostname)
+        self.directory: str = os.fspath(directory)
+
+    def path(self, host: str, port: int = 7777) -> str:
+        """The path the certificate of a server is kept at."""
+        return os.path.join(self.directory, f"{host.replace('.', '_')}_{port}.pem")
+
+    def _load(self, host: str, port: int) -> str | None:
+        pem = super()._load(host, port)
+        if pem is None:
+            try:
+                with open(self.path(host, port)) as f:
+                    pem = f.read()
+            except FileNotFoundError:
+                return None
+            super()._save(host, port, pem)
+        return pem
+
+    def _save(self, host: str, port: int, pem: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path(host, port), 'w') as f:
+            f.write(pem)
+        super()._save(host, port, pem)
@@ -0,0 +1,351 @@
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+
+from .streaming import DEFAULT_CHUNK_SIZE, Destination, ProgressCallback, SaveGameSink
+
+
+@dataclass(frozen=True)
+class Codec:
+    """
+    A streaming compression format for save files.
+
+    Attributes
+    ----------
+    name : str
+        The name of the codec.
+    extension : str
+        The file name extension of compressed files, such as '.zst'.
+    default_level : int
+        The compression level used when none is given.
+    compressor : Callable[[int], Any]
+        Creates a compressor for a level. It has ``compress(data) -> bytes`` and ``flush() -> bytes`` methods, like
+        ``zlib.compressobj``.
+    decompressor : Callable[[], Any]
+        Creates a decompressor for one gzip member or Zstandard frame. It has a ``decompress(data) -> bytes`` method
+        and ``eof`` and ``unused_data`` attributes, like ``zlib.decompressobj``.
+    """
+    name: str
+    extension: str
+    default_level: int
+    compressor: Callable[[int], Any]
+    decompressor: Callable[[], Any]
+
+
+GZIP_CODEC = Codec('gzip', '.gz', 6, lambda level: zlib.compressobj(level, zlib.DEFLATED, 31),
+                   lambda: zlib.decompressobj(31))
+"""The gzip codec, built on the standard library ``zlib`` module."""
+
+_codecs: dict[str, Codec] = {'gzip': GZIP_CODEC}
+
+
+def get_codec(name: str | Codec = 'auto') -> Codec:
+    """
+    Look up a compression codec.
+
+    Parameters
+    ----------
+    name : str | Codec, optional
+        'zstd' for Zstandard (needs the ``zstandard`` package), 'gzip', or a `Codec` to use as is. By default 'auto',
+        which picks Zstandard when it is installed and gzip otherwise.
+
+    Returns
+    -------
+    Codec
+        The codec.
+
+    Raises
+    ------
+    ImportError
+        If 'zstd' is asked for but ``zstandard`` is not installed.
+    ValueError
+        If the name is unknown.
+    """
+    if isinstance(name, Codec):
+        return name
+    if name == 'auto':
+        try:
+            return get_codec('zstd')
+        except ImportError:
+            return GZIP_CODEC
+    codec = _codecs.get(name)
+    if codec is not None:
+        return codec
+    if name != 'zstd':
+        raise ValueError(f"Unknown compression codec: {name!r}")
+
+    import zstandard
+    codec = _codecs['zstd'] = Codec('zstd', '.zst', 3,
+                                    lambda level: zstandard.ZstdCompressor(level=level).compressobj(),
+                                    lambda: zstandard.ZstdDecompressor().decompressobj())
+    return codec
+
+
+_MAGIC: dict[bytes, str] = {b'\x1f\x8b': 'gzip', b'\x28\xb5\x2f\xfd': 'zstd'}
+
+
+def detect_codec(header: bytes) -> Codec:
+    """
+    Find the codec of compressed data from its first bytes.
+
+    Parameters
+    ----------
+    header : bytes
+        At least the first 4 bytes of the data.
+
+    Returns
+    -------
+    Codec
+        The codec.
+
+    Raises
+    ------
+    ValueError
+        If the data is not in a known format.
+    ImportError
+        If the data is Zstandard compressed but ``zstandard`` is not installed.
+    """
+    for magic, name in _MAGIC.items():
+        if header.startswith(magic):
+            return get_codec(name)
+    raise ValueError("The data is not gzip or Zstandard compressed")
+
+
+class CompressingSink(SaveGameSink):
+    """
+    A `SaveGameSink` that compresses the save on the fly.
+
+    ``size``, ``progress`` and the hash describe the uncompressed save, so the hash can be compared with that of
+    other copies of it; ``compressed_size`` is the size of the file written.
+    """
+
+    def __init__(self, destination: Destination, codec: str | Codec = 'auto', level: int | None = None,
+                 total: int | None = None, progress: ProgressCallback | None = None,
+                 hash_algorithm: str | None = 'sha256'):
+        """
+        Parameters
+        ----------
+        destination : str | os.PathLike | BinaryIO
+            The path to write the compressed save to, or a binary file object opened for writing.
+        codec : str | Codec, optional
+            The codec, as accepted by `get_codec`, by default 'auto'.
+        level : int, optional
+            The compression level, by default the codec's default level.
+        total : int, optional
+            The expected size of the uncompressed save in bytes, passed through to ``progress``.
+        progress : ProgressCallback, optional
+            Called after every chunk with the uncompressed bytes written so far and ``total``.
+        hash_algorithm : str | None, optional
+            Any algorithm accepted by ``hashlib.new``, by default 'sha256'. None disables hashing.
+        """
+        self.codec: Codec = get_codec(codec)
+        self.level: int = self.codec.default_level if level is None else level
+        self.compressed_size: int = 0
+        self._compressor = self.codec.compressor(self.level)
+        self._started: float = time.perf_counter()
+        self._elapsed: float | None = None
+        super().__init__(destination, total, progress, hash_algorithm)
+
+    def _output(self, data: bytes) -> None:
+        compressed = self._compressor.compress(data)
+        if compressed:
+            self._file.write(compressed)
+            self.compressed_size += len(compressed)
+
+    def commit(self) -> None:
+        """Write the end of the compressed stream, then commit the file."""
+        tail = self._compressor.flush()
+        self._file.write(tail)
+        self.compressed_size += len(tail)
+        super().commit()
+        self._elapsed = time.perf_counter() - self._started
+
+    def result(self, save_name: str) -> dict:
+        """
+        Describe the finished download.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the downloaded save.
+
+        Returns
+        -------
+        dict
+            What `SaveGameSink.result` returns, plus the codec (``compression``), the size of the compressed file
+            (``compressed_size``), the uncompressed size divided by it (``ratio``), the seconds from the start of the
+            download to the commit (``elapsed``), and the uncompressed bytes processed per second (``throughput``).
+        """
+        result = super().result(save_name)
+        elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._started
+        result.update(
+            compression=self.codec.name,
+            compressed_size=self.compressed_size,
+            ratio=self.size / self.compressed_size if self.compressed_size else 0.0,
+            elapsed=elapsed,
+            throughput=self.size / elapsed if elapsed > 0 else 0.0,
+        )
+        return result
+
+
+def open_sink(destination: Destination, total: int | None = None, progress: ProgressCallback | None = None,
+              hash_algorithm: str | None = 'sha256', compression: str | Codec | None = None,
+              compression_level: int | None = None) -> SaveGameSink:
+    """Create a `CompressingSink`, or a plain `SaveGameSink` when ``compression`` is None."""
+    if compression is None:
+        return SaveGameSink(destination, total, progress, hash_algorithm)
+    return CompressingSink(destination, compression, compression_level, total, progress, hash_algorithm)
+
+
+class DecompressingReader:
+    """
+    A read-only binary file object that decompresses a compressed save as it is read.
+
+    Pass it as the source of ``upload_save_game`` to upload a compressed backup without writing the decompressed
+    save to disk. It reads the compressed source one chunk at a time, so memory use does not grow with the save size.
+    Sources made of several concatenated gzip members or Zstandard frames are decompressed in full.
+    """
+
+    def __init__(self, source: str | os.PathLike | BinaryIO | Iterable[bytes], codec: str | Codec | None = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Parameters
+        ----------
+        source : str | os.PathLike | BinaryIO | Iterable[bytes]
+            The compressed save: a path, a binary file object opened for reading, or an iterable of byte chunks.
+        codec : str | Codec, optional
+            The codec the source is compressed with: 'gzip', 'zstd' or a `Codec`. By default None, also spelled
+            'detect' or 'auto', which detects it from the first bytes of the source.
+        chunk_size : int, optional
+            The number of compressed bytes read from the source at a time, by default 1 MiB.
+        """
+        self.codec: Codec | None = None if codec in (None, 'detect', 'auto') else get_codec(codec)
+        self.compressed_size: int = 0
+        self._decompressor = self.codec.decompressor() if self.codec is not None else None
+        self._buffer = bytearray()
+        self._head = b''
+        self._eof = False
+        self._owns_file = isinstance(source, (str, os.PathLike))
+        self._file: BinaryIO | None = open(source, 'rb') if self._owns_file else (
+            source if hasattr(source, 'read') else None)
+        self._chunks: Iterator[bytes] = iter(lambda: self._file.read(chunk_size), b'') if self._file is not None \
+            else iter(source)
+
+    def __enter__(self) -> 'DecompressingReader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read decompressed bytes.
+
+        Parameters
+        ----------
+        size : int, optional
+            The maximum number of bytes to return, by default -1 (everything that is left).
+
+        Returns
+        -------
+        bytes
+            The bytes, fewer than ``size`` only at the end of the save.
+
+        Raises
+        ------
+        ValueError
+            If the codec cannot be detected, or the source ends within a gzip member or Zstandard frame.
+        """
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            compressed = next(self._chunks, b'')
+            if not compressed:
+                self._eof = True
+                if self._decompressor is None and self._head:
+                    detect_codec(self._head)  # Too short to be compressed with any codec: raises
+                if self._decompressor is not None and not self._decompressor.eof:
+                    raise ValueError(f'The {self.codec.name} compressed save is truncated')
+                break
+            self.compressed_size += len(compressed)
+            if self._decompressor is None:
+                # The magic bytes may be split across the first chunks of an iterable
+                self._head += compressed
+                if len(self._head) < 4:
+                    continue
+                compressed, self._head = self._head, b''
+                self.codec = detect_codec(compressed)
+                self._decompressor = self.codec.decompressor()
+            self._decompress(compressed)
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+    def _decompress(self, compressed: bytes) -> None:
+        while compressed:
+            if self._decompressor.eof:
+                # Another gzip member or Zstandard frame follows the one that ended
+                self._decompressor = self.codec.decompressor()
+            self._buffer += self._decompressor.decompress(compressed)
+            compressed = self._decompressor.unused_data if self._decompressor.eof else b''
+
+    def close(self) -> None:
+        """Close the source if the reader opened it."""
+        if self._owns_file and self._file is not None:
+            self._file.close()
+
+
+def uncompressed_size(path: str | os.PathLike) -> int | None:
+    """
+    Find the uncompressed size of a compressed save, when the format records it reliably.
+
+    Gzip files end with the size modulo 2 ** 32 of their last member, so it is only used when the file holds a single
+    member that decompresses to that size. Checking that decompresses the file once without keeping the output.
+    Zstandard files written by `CompressingSink` are streamed and do not record the size.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The compressed save.
+
+    Returns
+    -------
+    int | None
+        The size in bytes, or None if it is not recorded or cannot be trusted.
+    """
+    with open(path, 'rb') as f:
+        if not f.read(2) == b'\x1f\x8b':
+            return None
+        if f.seek(0, os.SEEK_END) < 18:
+            return None
+        f.seek(-4, os.SEEK_END)
+        size = struct.unpack('<I', f.read(4))[0]
+
+        f.seek(0)
+        decompressor = zlib.decompressobj(31)
+        total = 0
+        try:
+            for chunk in iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b''):
+                if decompressor.eof:
+                    # Data after the end of the first member: another member, whose trailer is the one read above
+                    return None
+                # Bounded output, so a highly compressed chunk does not inflate into memory all at once
+                while chunk and not decompressor.eof:
+                    total += len(decompressor.decompress(chunk, DEFAULT_CHUNK_SIZE))
+                    chunk = decompressor.unconsumed_tail
+        except zlib.error:
+            return None
+        if not decompressor.eof or decompressor.unused_data or total % 2 ** 32 != size:
+            return None
+        return total
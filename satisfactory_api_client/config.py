@@ -0,0 +1,9 @@
+READ_FUNCTIONS: frozenset[str] = frozenset({
+    'HealthCheck',
+    'VerifyAuthenticationToken',
+    'QueryServerState',
+    'GetServerOptions',
+    'GetAdvancedGameSettings',
+    'EnumerateSessions',
+})
+"""API functions that only read server state, so sending them twice has the same effect as sending them once."""
@@ -1,5 +1,58 @@
-from .advanced_game_settings import AdvancedGameSettings
-from .minimum_privilege_level import MinimumPrivilegeLevel
-from .new_game_save import NewGameData
-from .response import Response
-from .server_options import ServerOptions
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .advanced_game_settings import AdvancedGameSettings
+    from .advanced_game_settings_state import AdvancedGameSettingsState
+    from .backup import BackupManifest, BackupResult
+    from .catalog import CatalogEntry
+    from .fleet_backup_result import FleetBackupResult
+    from .fleet_result import FleetResult
+    from .migration import MigrationResult
+    from .minimum_privilege_level import MinimumPrivilegeLevel
+    from .new_game_save import NewGameData
+    from .response import Response
+    from .save_file_header import SaveFileHeader
+    from .server_game_state import ServerGameState
+    from .server_options import ServerOptions
+    from .server_options_state import ServerOptionsState
+    from .server_state_change import ServerStateChange
+    from .sessions import SaveHeader, Session, SessionList
+
+# Imported on first access, like the names of the top-level package
+_LAZY_IMPORTS: dict[str, str] = {
+    'AdvancedGameSettings': '.advanced_game_settings',
+    'AdvancedGameSettingsState': '.advanced_game_settings_state',
+    'BackupManifest': '.backup',
+    'BackupResult': '.backup',
+    'CatalogEntry': '.catalog',
+    'FleetBackupResult': '.fleet_backup_result',
+    'FleetResult': '.fleet_result',
+    'MigrationResult': '.migration',
+    'MinimumPrivilegeLevel': '.minimum_privilege_level',
+    'NewGameData': '.new_game_save',
+    'Response': '.response',
+    'SaveFileHeader': '.save_file_header',
+    'SaveHeader': '.sessions',
+    'ServerGameState': '.server_game_state',
+    'ServerOptions': '.server_options',
+    'ServerOptionsState': '.server_options_state',
+    'ServerStateChange': '.server_state_change',
+    'Session': '.sessions',
+    'SessionList': '.sessions',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
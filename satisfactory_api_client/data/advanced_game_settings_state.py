@@ -0,0 +1,27 @@
+from .advanced_game_settings import AdvancedGameSettings
+from .lazy_model import Field, LazyModel, settings_from_raw
+
+
+class AdvancedGameSettingsState(LazyModel):
+    """
+    The advanced game settings of a server, as returned by ``get_advanced_game_settings``.
+
+    A lazy view over the response data, which stays available in ``raw``.
+
+    Attributes
+    ----------
+    creative_mode_enabled : bool | None
+        Whether advanced game settings are enabled for the session.
+    settings : AdvancedGameSettings
+        The settings in effect.
+    """
+
+    __slots__ = ()
+
+    creative_mode_enabled = Field('creativeModeEnabled')
+    settings = Field('advancedGameSettings', {}, lambda raw: settings_from_raw(AdvancedGameSettings, raw), cached=True)
+
+    @classmethod
+    def from_response(cls, data: dict) -> 'AdvancedGameSettingsState':
+        """Build the model from the data of a ``GetAdvancedGameSettings`` response."""
+        return cls(data)
@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BackupManifest:
+    """
+    The recipe for reassembling one backed up save from the chunks of a `BackupStore`.
+
+    Attributes
+    ----------
+    save_name : str
+        The name of the save on the server.
+    created : float
+        The ``time.time()`` at which the backup was taken. Together with ``save_name`` it identifies the backup.
+    size : int
+        The size of the save in bytes.
+    sha256 : str
+        The SHA-256 hex digest of the whole save.
+    chunks : list[str]
+        The SHA-256 hex digests of the save's chunks, in order.
+    server : str | None
+        The ``host:port`` of the server the save was downloaded from, if known.
+    """
+    save_name: str
+    created: float
+    size: int
+    sha256: str
+    chunks: list[str] = field(default_factory=list)
+    server: str | None = None
+
+    def to_dict(self) -> dict:
+        """The manifest as a JSON-serializable dict."""
+        return {
+            'save_name': self.save_name,
+            'created': self.created,
+            'size': self.size,
+            'sha256': self.sha256,
+            'chunks': self.chunks,
+            'server': self.server,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BackupManifest':
+        """Build a manifest from the output of `to_dict`."""
+        return cls(save_name=data['save_name'], created=data['created'], size=data['size'], sha256=data['sha256'],
+                   chunks=list(data['chunks']), server=data.get('server'))
+
+
+@dataclass
+class BackupResult:
+    """
+    The outcome of storing one save in a `BackupStore`.
+
+    Attributes
+    ----------
+    manifest : BackupManifest
+        The manifest of the stored save.
+    new_chunks : int
+        The number of chunks that were not stored yet and had to be written.
+    new_bytes : int
+        The size of those chunks in bytes.
+    elapsed : float
+        The time the backup took in seconds, including the download.
+    """
+    manifest: BackupManifest
+    new_chunks: int
+    new_bytes: int
+    elapsed: float
+
+    @property
+    def dedup_ratio(self) -> float:
+        """The fraction of the save's bytes that were already stored, from 0.0 (all new) to 1.0 (nothing new)."""
+        if self.manifest.size == 0:
+            return 1.0
+        return 1.0 - self.new_bytes / self.manifest.size
+
+    @property
+    def throughput(self) -> float:
+        """The bytes of the save processed per second."""
+        return self.manifest.size / self.elapsed if self.elapsed > 0 else 0.0
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CatalogEntry:
+    """
+    A save file on disk, as indexed by a `SaveCatalog`.
+
+    Attributes
+    ----------
+    path : str
+        The absolute path of the file. It identifies the entry.
+    server : str | None
+        The server the save was downloaded from, such as ``host:port``.
+    session_name : str | None
+        The session the save belongs to.
+    save_name : str | None
+        The name of the save on the server.
+    created : float
+        When the save was taken, as a ``time.time()`` timestamp.
+    size : int
+        The size of the file in bytes.
+    hash : str | None
+        The SHA-256 hex digest of the file, or None if it was not computed.
+    """
+    path: str
+    server: str | None
+    session_name: str | None
+    save_name: str | None
+    created: float
+    size: int
+    hash: str | None = None
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+
+from .backup import BackupResult
+
+
+@dataclass
+class FleetBackupResult:
+    """
+    The outcome of backing up one server of a fleet with a `BackupOrchestrator`.
+
+    Attributes
+    ----------
+    host : str
+        The hostname or IP address of the server.
+    port : int
+        The port of the server.
+    save_name : str
+        The name of the save that was created and downloaded.
+    size : int
+        The number of bytes downloaded.
+    elapsed : float
+        The time from the start of the server's backup, after its stagger delay, to its end in seconds.
+    stages : dict[str, float]
+        The seconds spent in each stage that was reached (``save``, ``confirm`` and ``download``), including the time
+        waiting for a free slot.
+    path : str | None
+        The file the save was written to, when backing up to a directory.
+    backup : BackupResult | None
+        The result of storing the save, when backing up to a `BackupStore`.
+    error : BaseException | None
+        The exception that stopped the backup, or None if it succeeded.
+    """
+    host: str
+    port: int
+    save_name: str
+    size: int = 0
+    elapsed: float = 0.0
+    stages: dict[str, float] = field(default_factory=dict)
+    path: str | None = None
+    backup: BackupResult | None = None
+    error: BaseException | None = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the backup succeeded."""
+        return self.error is None
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+from .response import Response
+
+
+@dataclass
+class FleetResult:
+    """
+    The outcome of one API call made on behalf of a fleet.
+
+    Attributes
+    ----------
+    host : str
+        The hostname or IP address of the server the call was made to.
+    port : int
+        The port of the server.
+    response : Response | None
+        The Response returned by the call, or None if it failed.
+    error : BaseException | None
+        The exception raised by the call (including timeouts), or None if it succeeded.
+    elapsed : float
+        The time the call took in seconds.
+    """
+    host: str
+    port: int
+    response: Response | None = None
+    error: BaseException | None = None
+    elapsed: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
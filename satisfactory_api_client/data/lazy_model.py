@@ -0,0 +1,127 @@
+import dataclasses
+import typing
+from typing import Any, Callable
+
+
+class Field:
+    """
+    A read-only attribute of a `LazyModel` that looks its value up in the raw payload on access.
+
+    Nothing is converted or stored up front, so fields that are never read cost nothing.
+    """
+
+    __slots__ = ('key', 'default', 'convert', 'cached', 'name')
+
+    def __init__(self, key: str, default: Any = None, convert: Callable[[Any], Any] | None = None,
+                 cached: bool = False):
+        """
+        Parameters
+        ----------
+        key : str
+            The key of the value in the raw payload.
+        default : Any, optional
+            The value returned when the key is absent, by default None.
+        convert : Callable[[Any], Any], optional
+            Converts the raw value on access, by default None (returned as is).
+        cached : bool, optional
+            Keep the converted value after the first access, for conversions that build nested models, by default
+            False.
+        """
+        self.key = key
+        self.default = default
+        self.convert = convert
+        self.cached = cached
+        self.name = key
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: 'LazyModel | None', owner: type) -> Any:
+        if instance is None:
+            return self
+        if self.cached:
+            try:
+                return instance._cache[self.name]
+            except AttributeError:
+                instance._cache = {}
+            except KeyError:
+                pass
+        value = instance.raw.get(self.key, self.default)
+        if self.convert is not None and value is not None:
+            value = self.convert(value)
+        if self.cached:
+            instance._cache[self.name] = value
+        return value
+
+
+class LazyModel:
+    """
+    A typed, read-only view over one object of an API payload.
+
+    The raw dictionary is kept in ``raw`` and every `Field` reads from it on access, so a model costs one small
+    slotted object on top of the payload no matter how many fields it declares. Nested models are built on first
+    access and then kept.
+    """
+
+    __slots__ = ('raw', '_cache')
+
+    def __init__(self, raw: dict):
+        """
+        Parameters
+        ----------
+        raw : dict
+            The object of the API payload the model describes.
+        """
+        self.raw: dict = raw
+
+    @classmethod
+    def fields(cls) -> tuple[str, ...]:
+        """The names of the model's fields."""
+        return tuple(name for klass in reversed(cls.__mro__) for name, value in vars(klass).items()
+                     if isinstance(value, Field))
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.raw == other.raw
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.fields())
+        return f'{type(self).__name__}({fields})'
+
+
+def settings_from_raw(settings_class: type, raw: dict) -> Any:
+    """
+    Build a settings dataclass, such as `ServerOptions`, from the ``FG.``-prefixed strings the API reports.
+
+    Parameters
+    ----------
+    settings_class : type
+        The dataclass to build. Values are matched to its fields by the last dotted part of their key.
+    raw : dict
+        The settings as reported by the API, e.g. ``{'FG.DSAutoPause': 'True'}``.
+
+    Returns
+    -------
+    Any
+        The dataclass, with the values converted to the types of its fields. Unknown keys are ignored.
+    """
+    kinds = {}
+    for field in dataclasses.fields(settings_class):
+        kinds[field.name] = next((arg for arg in typing.get_args(field.type) if arg is not type(None)), field.type)
+
+    values = {}
+    for key, value in raw.items():
+        name = key.rsplit('.', 1)[-1]
+        kind = kinds.get(name)
+        if kind is None:
+            continue
+        if kind is bool:
+            values[name] = value if isinstance(value, bool) else str(value).lower() == 'true'
+        elif kind in (int, float):
+            values[name] = kind(float(value)) if kind is int else float(value)
+        else:
+            values[name] = value
+    return settings_class(**values)
@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class MigrationResult:
+    """
+    The outcome of moving a save from one server to another with `migrate_save`.
+
+    Attributes
+    ----------
+    source_save_name : str
+        The name of the save on the source server.
+    save_name : str
+        The name the save was uploaded under on the target server.
+    size : int
+        The number of bytes transferred.
+    hash_algorithm : str | None
+        The ``hashlib`` algorithm of ``hash``, or None if hashing was disabled.
+    hash : str | None
+        The hex digest of the transferred save, or None if hashing was disabled.
+    session_name : str | None
+        The session the target lists the save under, or None if it was not verified.
+    loaded : bool
+        Whether the save was loaded on the target.
+    health : str | None
+        The health the target reported after loading the save, or None if it was not verified.
+    elapsed : float
+        The time the migration took in seconds.
+    stages : dict[str, float]
+        The seconds spent in each stage that was reached (``transfer``, ``verify`` and ``load``).
+    """
+    source_save_name: str
+    save_name: str
+    size: int = 0
+    hash_algorithm: str | None = None
+    hash: str | None = None
+    session_name: str | None = None
+    loaded: bool = False
+    health: str | None = None
+    elapsed: float = 0.0
+    stages: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """The transfer rate in bytes per second."""
+        transfer = self.stages.get('transfer', 0.0)
+        return self.size / transfer if transfer > 0 else 0.0
@@ -1,4 +1,6 @@
 import dataclasses
+import functools
+from typing import Any, Callable
 
 
 @dataclasses.dataclass
@@ -12,6 +14,19 @@ class Response:
         Whether the request was successful.
     data : dict | str
         The data returned from the API.
+    model_factory : Callable[[Any], Any] | None
+        Builds the typed `model` of ``data``. Set by the methods that have one; not compared.
     """
     success: bool
     data: dict | bytes
+    model_factory: Callable[[Any], Any] | None = dataclasses.field(default=None, compare=False, repr=False)
+
+    @functools.cached_property
+    def model(self) -> Any:
+        """
+        The data as a typed, lazily evaluated model, such as `ServerGameState` for ``query_server_state``. Built on
+        first access. None for responses without a model.
+        """
+        if self.model_factory is None:
+            return None
+        return self.model_factory(self.data)
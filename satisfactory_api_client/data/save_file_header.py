@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+_TICKS_EPOCH = datetime(1, 1, 1)
+
+
+@dataclass(slots=True)
+class SaveFileHeader:
+    """
+    The header at the start of a ``.sav`` file, as read by `read_save_file_header`.
+
+    Fields added in later header versions are None in files written with an older version.
+
+    Attributes
+    ----------
+    save_header_version : int
+        The version of the header layout.
+    save_version : int
+        The version of the save format.
+    build_version : int
+        The build of the game that wrote the save.
+    save_name : str | None
+        The name of the save file (header version 14 and later).
+    map_name : str
+        The map the save was made on.
+    map_options : str
+        The options of the map.
+    session_name : str
+        The session the save belongs to.
+    play_duration_seconds : int
+        The play time recorded in the save.
+    save_date_ticks : int
+        When the save was made, in 100 ns ticks since 0001-01-01.
+    session_visibility : int | None
+        The visibility of the session (header version 5 and later).
+    editor_object_version : int | None
+        The editor object version of the game (header version 7 and later).
+    mod_metadata : str | None
+        The mods the save was made with, as JSON (header version 8 and later).
+    is_modded_save : bool | None
+        Whether the save was made with mods (header version 8 and later).
+    save_identifier : str | None
+        The unique identifier of the save (header version 10 and later).
+    is_partitioned_world : bool | None
+        Whether the world is partitioned (header version 11 and later).
+    save_data_hash : bytes | None
+        The MD5 hash of the save body, when the file records a valid one (header version 12 and later). Files
+        without a valid hash store no hash bytes.
+    is_creative_mode_enabled : bool | None
+        Whether advanced game settings are enabled in the save (header version 13 and later).
+    header_size : int
+        The size of the header in bytes: the offset of the save body in the file.
+    """
+    save_header_version: int
+    save_version: int
+    build_version: int
+    save_name: str | None
+    map_name: str
+    map_options: str
+    session_name: str
+    play_duration_seconds: int
+    save_date_ticks: int
+    session_visibility: int | None = None
+    editor_object_version: int | None = None
+    mod_metadata: str | None = None
+    is_modded_save: bool | None = None
+    save_identifier: str | None = None
+    is_partitioned_world: bool | None = None
+    save_data_hash: bytes | None = None
+    is_creative_mode_enabled: bool | None = None
+    header_size: int = 0
+
+    @property
+    def save_date_time(self) -> datetime:
+        """When the save was made, as recorded by the game (no time zone)."""
+        return _TICKS_EPOCH + timedelta(microseconds=self.save_date_ticks // 10)
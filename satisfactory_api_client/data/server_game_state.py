@@ -0,0 +1,53 @@
+from .lazy_model import Field, LazyModel
+
+
+class ServerGameState(LazyModel):
+    """
+    The state of the game running on a server, as returned by ``query_server_state``.
+
+    A lazy view over the ``serverGameState`` payload, which stays available in ``raw``.
+
+    Attributes
+    ----------
+    active_session_name : str | None
+        The name of the session being played.
+    num_connected_players : int | None
+        The number of players connected.
+    player_limit : int | None
+        The maximum number of players.
+    tech_tier : int | None
+        The highest tech tier unlocked.
+    active_schematic : str | None
+        The milestone being worked on.
+    game_phase : str | None
+        The current game phase (Space Elevator tier).
+    is_game_running : bool | None
+        Whether a game is loaded.
+    total_game_duration : int | None
+        The play time of the session in seconds.
+    is_game_paused : bool | None
+        Whether the game is paused.
+    average_tick_rate : float | None
+        The average server tick rate.
+    auto_load_session_name : str | None
+        The session loaded when the server starts.
+    """
+
+    __slots__ = ()
+
+    active_session_name = Field('activeSessionName')
+    num_connected_players = Field('numConnectedPlayers')
+    player_limit = Field('playerLimit')
+    tech_tier = Field('techTier')
+    active_schematic = Field('activeSchematic')
+    game_phase = Field('gamePhase')
+    is_game_running = Field('isGameRunning')
+    total_game_duration = Field('totalGameDuration')
+    is_game_paused = Field('isGamePaused')
+    average_tick_rate = Field('averageTickRate')
+    auto_load_session_name = Field('autoLoadSessionName')
+
+    @classmethod
+    def from_response(cls, data: dict) -> 'ServerGameState':
+        """Build the model from the data of a ``QueryServerState`` response."""
+        return cls(data['serverGameState'])
@@ -0,0 +1,27 @@
+from .lazy_model import Field, LazyModel, settings_from_raw
+from .server_options import ServerOptions
+
+
+class ServerOptionsState(LazyModel):
+    """
+    The options of a server, as returned by ``get_server_options``.
+
+    A lazy view over the response data, which stays available in ``raw``.
+
+    Attributes
+    ----------
+    options : ServerOptions
+        The options in effect.
+    pending_options : ServerOptions
+        Options that were changed but only take effect once the session is reloaded.
+    """
+
+    __slots__ = ()
+
+    options = Field('serverOptions', {}, lambda raw: settings_from_raw(ServerOptions, raw), cached=True)
+    pending_options = Field('pendingServerOptions', {}, lambda raw: settings_from_raw(ServerOptions, raw), cached=True)
+
+    @classmethod
+    def from_response(cls, data: dict) -> 'ServerOptionsState':
+        """Build the model from the data of a ``GetServerOptions`` response."""
+        return cls(data)
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ServerStateChange:
+    """
+    A change in the state of a server, as reported by the watch methods.
+
+    Attributes
+    ----------
+    changes : dict
+        The watched fields of ``serverGameState`` whose value changed, mapped to their new value.
+        The first change of a watch holds every watched field.
+    state : dict
+        The full ``serverGameState`` the change was detected in.
+    timestamp : float
+        The ``time.time()`` at which the state was received.
+    """
+    changes: dict
+    state: dict
+    timestamp: float
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+from .lazy_model import Field, LazyModel
+
+
+def _parse_save_date_time(value: str) -> datetime:
+    return datetime.strptime(value, '%Y.%m.%d-%H.%M.%S')
+
+
+class SaveHeader(LazyModel):
+    """
+    The header of a save file, as listed by ``enumerate_sessions``.
+
+    Attributes
+    ----------
+    save_version : int | None
+        The version of the save format.
+    build_version : int | None
+        The build of the game that wrote the save.
+    save_name : str | None
+        The name of the save file.
+    save_location_info : str | None
+        Where the save is stored.
+    map_name : str | None
+        The map the save was made on.
+    map_options : str | None
+        The options of the map.
+    session_name : str | None
+        The session the save belongs to.
+    play_duration_seconds : int | None
+        The play time recorded in the save.
+    save_date_time : datetime | None
+        When the save was made, as reported by the server (no time zone).
+    is_modded_save : bool | None
+        Whether the save was made with mods.
+    is_edited_save : bool | None
+        Whether the save was edited.
+    is_creative_mode_enabled : bool | None
+        Whether advanced game settings are enabled in the save.
+    """
+
+    __slots__ = ()
+
+    save_version = Field('saveVersion')
+    build_version = Field('buildVersion')
+    save_name = Field('saveName')
+    save_location_info = Field('saveLocationInfo')
+    map_name = Field('mapName')
+    map_options = Field('mapOptions')
+    session_name = Field('sessionName')
+    play_duration_seconds = Field('playDurationSeconds')
+    save_date_time = Field('saveDateTime', convert=_parse_save_date_time)
+    is_modded_save = Field('isModdedSave')
+    is_edited_save = Field('isEditedSave')
+    is_creative_mode_enabled = Field('isCreativeModeEnabled')
+
+
+class Session(LazyModel):
+    """
+    A game session and its saves, as listed by ``enumerate_sessions``.
+
+    Attributes
+    ----------
+    session_name : str | None
+        The name of the session.
+    save_headers : tuple[SaveHeader, ...]
+        The headers of the session's saves, built on first access.
+    """
+
+    __slots__ = ()
+
+    session_name = Field('sessionName')
+    save_headers = Field('saveHeaders', (), lambda raw: tuple(SaveHeader(header) for header in raw), cached=True)
+
+
+class SessionList(LazyModel):
+    """
+    The sessions saved on a server, as returned by ``enumerate_sessions``.
+
+    A lazy view over the response data, which stays available in ``raw``. The session and save header models are
+    only built when ``sessions`` is first read.
+
+    Attributes
+    ----------
+    sessions : tuple[Session, ...]
+        The sessions, built on first access.
+    current_session_index : int | None
+        The index of the session being played in ``sessions``.
+    """
+
+    __slots__ = ()
+
+    sessions = Field('sessions', (), lambda raw: tuple(Session(session) for session in raw), cached=True)
+    current_session_index = Field('currentSessionIndex')
+
+    @property
+    def current_session(self) -> Session | None:
+        """The session being played, or None if no session is loaded."""
+        index = self.current_session_index
+        if index is None or not 0 <= index < len(self.sessions):
+            return None
+        return self.sessions[index]
+
+    @classmethod
+    def from_response(cls, data: dict) -> 'SessionList':
+        """Build the model from the data of an ``EnumerateSessions`` response."""
+        return cls(data)
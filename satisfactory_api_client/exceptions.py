@@ -1,3 +1,6 @@
+import ssl
+
+
 class APIError(Exception):
     """
     Exception raised for API errors.
@@ -35,3 +38,77 @@ class APIError(Exception):
 class InvalidParameterError(APIError):
     """Exception raised for invalid parameters."""
     pass
+
+
+class CircuitOpenError(APIError):
+    """
+    Exception raised when a call is refused without contacting the server, because its circuit breaker is open.
+
+    Attributes
+    ----------
+    retry_after : float
+        The number of seconds until the circuit allows a probe again.
+    """
+
+    retry_after: float
+
+    def __init__(self, retry_after: float):
+        self.retry_after = max(retry_after, 0.0)
+        super().__init__('circuit_open', f'Server is unavailable, retrying in {self.retry_after:.1f}s')
+
+
+class CertificateMismatchError(ssl.SSLError):
+    """
+    Exception raised when a server's certificate does not match the fingerprint it is pinned to.
+
+    Attributes
+    ----------
+    host : str
+        The hostname or IP address of the server.
+    port : int
+        The port of the server.
+    expected : str
+        The pinned SHA-256 fingerprint.
+    actual : str
+        The SHA-256 fingerprint of the certificate the server presented.
+    """
+
+    def __init__(self, host: str, port: int, expected: str, actual: str):
+        self.host = host
+        self.port = port
+        self.expected = expected
+        self.actual = actual
+        super().__init__(f'Certificate of {host}:{port} has fingerprint {actual}, expected {expected}')
+
+
+class CorruptBackupError(ValueError):
+    """
+    Exception raised when stored backup data does not match the hash it is stored under.
+
+    Attributes
+    ----------
+    digest : str
+        The SHA-256 hex digest the data should have.
+    actual : str
+        The SHA-256 hex digest of the data that was read.
+    """
+
+    def __init__(self, digest: str, actual: str):
+        self.digest = digest
+        self.actual = actual
+        super().__init__(f'Backup data {digest} is corrupt: its SHA-256 digest is {actual}')
+
+
+class SaveFormatError(ValueError):
+    """
+    Exception raised when a save file cannot be parsed, because it is truncated or is not a save file.
+
+    Attributes
+    ----------
+    offset : int
+        The position in the file at which parsing failed.
+    """
+
+    def __init__(self, message: str, offset: int):
+        self.offset = offset
+        super().__init__(f'{message} at offset {offset}')
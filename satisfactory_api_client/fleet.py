@@ -0,0 +1,207 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator
+
+from .api_client import SatisfactoryAPI
+from .certificates import CertificateStore
+from .data.fleet_result import FleetResult
+from .data.response import Response
+from .metrics import MetricsRegistry
+from .retry import CircuitBreaker, RetryPolicy
+from .tokens import TokenManager
+
+FleetCall = str | Callable[[SatisfactoryAPI], Response]
+"""The name of a `SatisfactoryAPI` method, or a function taking the client for each server."""
+
+
+class SatisfactoryFleet:
+    """ Runs API calls across many Satisfactory Dedicated Servers on a bounded thread pool """
+
+    def __init__(self, servers: Iterable[str | tuple[str, int]] = (), auth_token: str = None,
+                 skip_ssl_verification: bool = False, max_workers: int = 16, pool_maxsize: int = 2,
+                 retry_policy: RetryPolicy | None = None, circuit_breaker: Callable[[], CircuitBreaker] | None = None,
+                 metrics: MetricsRegistry | None = None, certificate_store: CertificateStore | None = None,
+                 token_manager: TokenManager | None = None):
+        """
+        Initialize the fleet
+
+        Parameters
+        ----------
+        servers : Iterable[str | tuple[str, int]], optional
+            The servers to add, as hostnames or ``(host, port)`` tuples. More can be added with `add_server`.
+        auth_token : str, optional
+            The authentication token used for every server added without its own token, by default None.
+        skip_ssl_verification : bool, optional
+            Disable SSL certificate verification for every server, by default False.
+        max_workers : int, optional
+            The number of worker threads, and so the maximum number of calls in flight, by default 16.
+        pool_maxsize : int, optional
+            The number of keep-alive connections each server's client keeps open, by default 2.
+        retry_policy : RetryPolicy, optional
+            The retry policy of every server, by default None (no retries).
+        circuit_breaker : Callable[[], CircuitBreaker], optional
+            A factory for the circuit breaker of each server, such as ``CircuitBreaker`` or
+            ``functools.partial(CircuitBreaker, failure_threshold=3)``, by default None (no circuit breakers).
+        metrics : MetricsRegistry, optional
+            A registry every server records its requests in, by default None.
+        certificate_store : CertificateStore, optional
+            The store `init_certificates` gets certificates from, by default None (`CertificateStore.default`).
+        token_manager : TokenManager, optional
+            The token manager of every server, by default None. Servers added without a token start with the
+            manager's token for them, and log in again with its credentials when their token is rejected.
+        """
+        self.auth_token: str | None = auth_token
+        self.skip_ssl_verification: bool = skip_ssl_verification
+        self.pool_maxsize: int = pool_maxsize
+        self.max_workers: int = max_workers
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.circuit_breaker: Callable[[], CircuitBreaker] | None = circuit_breaker
+        self.metrics: MetricsRegistry | None = metrics
+        self.certificate_store: CertificateStore | None = certificate_store
+        self.token_manager: TokenManager | None = token_manager
+        self.clients: dict[tuple[str, int], SatisfactoryAPI] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='satisfactory-fleet')
+
+        for server in servers:
+            host, port = (server, 7777) if isinstance(server, str) else server
+            self.add_server(host, port)
+
+    def __enter__(self) -> 'SatisfactoryFleet':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads and close the pooled connections of every server."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for client in self.clients.values():
+            client.close()
+
+    def add_server(self, host: str, port: int = 7777, auth_token: str = None) -> SatisfactoryAPI:
+        """
+        Add a server to the fleet.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server
+        port : int, optional
+            The port to connect to, by default 7777
+        auth_token : str, optional
+            The authentication token for this server, by default the fleet's ``auth_token``. It is not verified until
+            it is used or `verify_tokens` is called.
+
+        Returns
+        -------
+        SatisfactoryAPI
+            The client for the server.
+        """
+        client = SatisfactoryAPI(host, port, auth_token=auth_token or self.auth_token,
+                                 skip_ssl_verification=self.skip_ssl_verification, pool_maxsize=self.pool_maxsize,
+                                 retry_policy=self.retry_policy,
+                                 circuit_breaker=self.circuit_breaker() if self.circuit_breaker else None,
+                                 metrics=self.metrics, certificate_store=self.certificate_store,
+                                 token_manager=self.token_manager, verify_token=False)
+        self.clients[(host, port)] = client
+        return client
+
+    def remove_server(self, host: str, port: int = 7777) -> None:
+        """
+        Remove a server from the fleet and close its connections.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server
+        port : int, optional
+            The port of the server, by default 7777
+        """
+        self.clients.pop((host, port)).close()
+
+    def init_certificates(self) -> dict[tuple[str, int], Exception]:
+        """
+        Fetch the certificates of every server concurrently and verify all later requests against them.
+
+        Returns
+        -------
+        dict[tuple[str, int], Exception]
+            The servers whose certificate could not be fetched or did not match its pin, with the error. Those
+            servers keep their previous SSL settings.
+        """
+        store = self.certificate_store or CertificateStore.default()
+        results = store.fetch_all(self.clients, max_workers=self.max_workers)
+        errors = {}
+        for server, result in results.items():
+            if isinstance(result, Exception):
+                errors[server] = result
+            else:
+                # The store has the certificate and its context now, so this does not contact the server
+                self.clients[server].init_certificate()
+        return errors
+
+    def verify_tokens(self) -> dict[tuple[str, int], Exception]:
+        """
+        Verify the authentication token of every server concurrently.
+
+        Tokens are not verified when servers are added, so adding many servers does not wait for a round trip to
+        each. Servers whose token was rejected log in again if their client or the token manager knows how.
+
+        Returns
+        -------
+        dict[tuple[str, int], Exception]
+            The servers whose token could not be verified, with the error.
+        """
+        return {(result.host, result.port): result.error for result in self.call('verify_authentication_token')
+                if not result.success}
+
+    @staticmethod
+    def _call(client: SatisfactoryAPI, call: FleetCall, args: tuple, kwargs: dict) -> FleetResult:
+        start = time.perf_counter()
+        try:
+            response = getattr(client, call)(*args, **kwargs) if isinstance(call, str) else call(client)
+        except Exception as e:
+            return FleetResult(client.host, client.port, error=e, elapsed=time.perf_counter() - start)
+        return FleetResult(client.host, client.port, response=response, elapsed=time.perf_counter() - start)
+
+    def call(self, call: FleetCall, *args, **kwargs) -> Iterator[FleetResult]:
+        """
+        Call an API function on every server and yield the results as they complete.
+
+        A failing server does not stop the others; its exception is reported in the result instead. Leaving the
+        loop early cancels the calls that have not started yet.
+
+        Parameters
+        ----------
+        call : str | Callable[[SatisfactoryAPI], Response]
+            The name of the `SatisfactoryAPI` method to call, such as ``'health_check'``, or a function that is
+            called with each server's client, for calls that differ per server.
+        *args
+            Positional arguments for the method, when ``call`` is a name.
+        **kwargs
+            Keyword arguments for the method, when ``call`` is a name.
+
+        Yields
+        ------
+        FleetResult
+            The result of each server, in completion order.
+
+        Raises
+        ------
+        AttributeError
+            If ``call`` does not name a `SatisfactoryAPI` method.
+        """
+        if isinstance(call, str) and not callable(getattr(SatisfactoryAPI, call, None)):
+            raise AttributeError(f"SatisfactoryAPI has no API method '{call}'")
+        # Checked before the generator is created, so a typo fails at the call rather than at the first iteration
+        return self._call_all(call, args, kwargs)
+
+    def _call_all(self, call: FleetCall, args: tuple, kwargs: dict) -> Iterator[FleetResult]:
+        futures: list[Future] = [self._executor.submit(self._call, client, call, args, kwargs)
+                                 for client in list(self.clients.values())]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
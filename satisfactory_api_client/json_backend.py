@@ -0,0 +1,126 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .exceptions import APIError
+
+
+@dataclass(frozen=True)
+class JSONBackend:
+    """
+    The functions a client encodes request bodies and decodes response bodies with.
+
+    Attributes
+    ----------
+    name : str
+        The name of the backend.
+    dumps : Callable[[Any], bytes]
+        Encodes a request payload to UTF-8 JSON.
+    loads : Callable[[bytes], Any]
+        Decodes a UTF-8 JSON response body.
+    """
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+STDLIB_BACKEND = JSONBackend('json', lambda obj: json.dumps(obj).encode(), json.loads)
+"""The backend built on the standard library ``json`` module."""
+
+_backends: dict[str, JSONBackend] = {'json': STDLIB_BACKEND}
+
+
+def get_json_backend(name: str | JSONBackend | None = None) -> JSONBackend:
+    """
+    Look up a JSON backend.
+
+    Parameters
+    ----------
+    name : str | JSONBackend | None, optional
+        'json' for the standard library, 'orjson' for ``orjson``, or a `JSONBackend` to use as is. None picks
+        ``orjson`` when it is installed and the standard library otherwise.
+
+    Returns
+    -------
+    JSONBackend
+        The backend.
+
+    Raises
+    ------
+    ImportError
+        If 'orjson' is asked for but not installed.
+    ValueError
+        If the name is unknown.
+    """
+    if isinstance(name, JSONBackend):
+        return name
+    if name is None:
+        try:
+            return get_json_backend('orjson')
+        except ImportError:
+            return STDLIB_BACKEND
+    backend = _backends.get(name)
+    if backend is not None:
+        return backend
+    if name != 'orjson':
+        raise ValueError(f"Unknown JSON backend: {name!r}")
+
+    import orjson
+    backend = _backends['orjson'] = JSONBackend('orjson', orjson.dumps, orjson.loads)
+    return backend
+
+
+def decode_response(backend: JSONBackend, body: bytes) -> Any:
+    """
+    Decode the body of a successful API response and unwrap its data.
+
+    Parameters
+    ----------
+    backend : JSONBackend
+        The backend to decode with.
+    body : bytes
+        The JSON response body.
+
+    Returns
+    -------
+    Any
+        The ``data`` of the response.
+
+    Raises
+    ------
+    APIError
+        If the response holds an error, or is not a JSON object.
+    """
+    result = backend.loads(body)
+    if not isinstance(result, dict):
+        raise APIError(error_code='invalid_response',
+                       message=f'Expected a JSON object, got {type(result).__name__}: {body[:200]!r}')
+    if result.get('errorCode'):
+        raise APIError(error_code=result['errorCode'], message=result.get('errorMessage'))
+    return result.get('data')
+
+
+def error_from_response(backend: JSONBackend, body: bytes, status: int) -> APIError:
+    """
+    Build the error for a failed API response.
+
+    Parameters
+    ----------
+    backend : JSONBackend
+        The backend to decode with.
+    body : bytes
+        The response body, normally a JSON error.
+    status : int
+        The HTTP status code of the response.
+
+    Returns
+    -------
+    APIError
+        The error reported by the server, or one describing the status code if the body is not a JSON error, as
+        sent by proxies in front of the server.
+    """
+    try:
+        result = backend.loads(body)
+        return APIError(error_code=result.get('errorCode'), message=result.get('errorMessage'))
+    except (ValueError, AttributeError):
+        return APIError(error_code=f'http_{status}', message=body.decode('utf-8', 'replace')[:200])
@@ -0,0 +1,211 @@
+import bisect
+import threading
+import time
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""The default upper bounds, in seconds, of the latency histogram buckets."""
+
+
+class _Series:
+    """The counters of one (server, function) pair."""
+
+    __slots__ = ('counts', 'sum', 'count', 'statuses', 'bytes_sent', 'bytes_received')
+
+    def __init__(self, buckets: int):
+        self.counts: list[int] = [0] * (buckets + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+        self.statuses: dict[str, int] = {}
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+
+
+class CallTracker:
+    """
+    Measures one request. Returned by `MetricsRegistry.track` and used as a context manager around the request.
+
+    Set ``bytes_sent`` and ``bytes_received`` while the request runs. On exit the call is recorded with status
+    ``'ok'``, the ``error_code`` of an `APIError`, or the name of any other exception type.
+    """
+
+    __slots__ = ('registry', 'server', 'func', 'start', 'bytes_sent', 'bytes_received')
+
+    def __init__(self, registry: 'MetricsRegistry', server: str, func: str):
+        self.registry = registry
+        self.server = server
+        self.func = func
+        self.start: float = 0.0
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+
+    def __enter__(self) -> 'CallTracker':
+        self.registry._enter(self.server)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        duration = time.perf_counter() - self.start
+        if exc_type is None:
+            status = 'ok'
+        else:
+            status = getattr(exc_val, 'error_code', None) or exc_type.__name__
+        self.registry._exit(self.server, self.func, duration, status, self.bytes_sent, self.bytes_received)
+
+
+class MetricsRegistry:
+    """
+    Collects per-server, per-function latency histograms, status counters, byte counters and in-flight gauges.
+
+    Pass one registry to any number of clients with ``metrics=MetricsRegistry()``. Every HTTP round trip is
+    recorded, including each retry. Read the numbers with `snapshot` or `to_prometheus`.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Parameters
+        ----------
+        buckets : tuple[float, ...], optional
+            The sorted upper bounds, in seconds, of the latency histogram buckets, by default `DEFAULT_BUCKETS`.
+        """
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._in_flight: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def track(self, server: str, func: str) -> CallTracker:
+        """
+        Start measuring a request.
+
+        Parameters
+        ----------
+        server : str
+            The server the request goes to, as ``host:port``.
+        func : str
+            The API function called.
+
+        Returns
+        -------
+        CallTracker
+            A context manager to wrap the request in.
+        """
+        return CallTracker(self, server, func)
+
+    def _enter(self, server: str) -> None:
+        with self._lock:
+            self._in_flight[server] = self._in_flight.get(server, 0) + 1
+
+    def _exit(self, server: str, func: str, duration: float, status: str, bytes_sent: int,
+              bytes_received: int) -> None:
+        bucket = bisect.bisect_left(self.buckets, duration)
+        with self._lock:
+            self._in_flight[server] -= 1
+            series = self._series.get((server, func))
+            if series is None:
+                series = self._series[(server, func)] = _Series(len(self.buckets))
+            series.counts[bucket] += 1
+            series.sum += duration
+            series.count += 1
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            series.bytes_sent += bytes_sent
+            series.bytes_received += bytes_received
+
+    def reset(self) -> None:
+        """Drop every recorded value. Gauges of requests still in flight are kept."""
+        with self._lock:
+            self._series.clear()
+
+    def _quantile(self, series: _Series, q: float) -> float | None:
+        """Estimate a latency quantile from the histogram by interpolating within the bucket it falls in."""
+        if not series.count:
+            return None
+        rank = q * series.count
+        cumulative = 0
+        for i, count in enumerate(series.counts):
+            if count and cumulative + count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1] if self.buckets else None
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return None
+
+    def snapshot(self) -> dict:
+        """
+        Get a consistent copy of every metric.
+
+        Returns
+        -------
+        dict
+            Keyed by server (``host:port``), each holding its ``in_flight`` gauge and a ``functions`` dict with,
+            per API function: ``count``, ``sum`` (seconds), estimated ``p50``/``p90``/``p99`` latencies, cumulative
+            ``buckets`` as ``[upper_bound, count]`` pairs (the last bound being ``inf``), ``statuses`` counts,
+            ``bytes_sent`` and ``bytes_received``.
+        """
+        with self._lock:
+            result = {server: {'in_flight': count, 'functions': {}} for server, count in self._in_flight.items()}
+            for (server, func), series in self._series.items():
+                cumulative = 0
+                buckets = []
+                for bound, count in zip((*self.buckets, float('inf')), series.counts):
+                    cumulative += count
+                    buckets.append([bound, cumulative])
+                result[server]['functions'][func] = {
+                    'count': series.count,
+                    'sum': series.sum,
+                    'p50': self._quantile(series, 0.5),
+                    'p90': self._quantile(series, 0.9),
+                    'p99': self._quantile(series, 0.99),
+                    'buckets': buckets,
+                    'statuses': dict(series.statuses),
+                    'bytes_sent': series.bytes_sent,
+                    'bytes_received': series.bytes_received,
+                }
+        return result
+
+    def to_prometheus(self, prefix: str = 'satisfactory_api') -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The prefix of every metric name, by default 'satisfactory_api'.
+
+        Returns
+        -------
+        str
+            The metrics, ready to be served on a ``/metrics`` endpoint.
+        """
+        snapshot = self.snapshot()
+        duration, requests, sent, received, in_flight = [], [], [], [], []
+        for server, server_metrics in snapshot.items():
+            in_flight.append(f'{prefix}_requests_in_flight{{server="{_escape(server)}"}} {server_metrics["in_flight"]}')
+            for func, metrics in server_metrics['functions'].items():
+                labels = f'server="{_escape(server)}",function="{_escape(func)}"'
+                for bound, count in metrics['buckets']:
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    duration.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{le}"}} {count}')
+                duration.append(f'{prefix}_request_duration_seconds_sum{{{labels}}} {metrics["sum"]!r}')
+                duration.append(f'{prefix}_request_duration_seconds_count{{{labels}}} {metrics["count"]}')
+                for status, count in metrics['statuses'].items():
+                    requests.append(f'{prefix}_requests_total{{{labels},status="{_escape(status)}"}} {count}')
+                sent.append(f'{prefix}_request_bytes_total{{{labels}}} {metrics["bytes_sent"]}')
+                received.append(f'{prefix}_response_bytes_total{{{labels}}} {metrics["bytes_received"]}')
+
+        sections = [
+            ('request_duration_seconds', 'histogram', 'Latency of API requests.', duration),
+            ('requests_total', 'counter', 'API requests by result status.', requests),
+            ('request_bytes_total', 'counter', 'Bytes sent in API request bodies.', sent),
+            ('response_bytes_total', 'counter', 'Bytes received in API response bodies.', received),
+            ('requests_in_flight', 'gauge', 'API requests currently in flight.', in_flight),
+        ]
+        lines = []
+        for name, kind, description, samples in sections:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+            lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,334 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, AsyncIterator, Iterator
+
+from .data.migration import MigrationResult
+from .streaming import DEFAULT_CHUNK_SIZE, ProgressCallback, content_length
+
+if TYPE_CHECKING:
+    from .api_client import SatisfactoryAPI
+    from .async_api_client import AsyncSatisfactoryAPI
+
+DEFAULT_MAX_BUFFERED_CHUNKS = 8
+"""The default number of chunks held between the download and the upload of a migration."""
+
+
+class _ChunkPipe:
+    """
+    A bounded, thread-safe queue of chunks from a download thread to an upload.
+
+    The download waits while the pipe is full, so memory use is capped at ``max_chunks`` chunks however far the
+    download runs ahead of the upload. Iterating the pipe yields the chunks until the download finishes, and raises
+    the download's exception if it failed.
+    """
+
+    def __init__(self, max_chunks: int):
+        self.max_chunks: int = max_chunks
+        self.size: int | None = None
+        self.error: BaseException | None = None
+        self.started = threading.Event()
+        self._chunks: deque[bytes] = deque()
+        self._condition = threading.Condition()
+        self._finished = False
+        self._closed = False
+
+    def put(self, chunk: bytes) -> bool:
+        """Queue a chunk, waiting while the pipe is full. Returns False once the reading side is gone."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._closed or len(self._chunks) < self.max_chunks)
+            if self._closed:
+                return False
+            self._chunks.append(chunk)
+            self._condition.notify_all()
+            return True
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Mark the end of the download, or its failure."""
+        with self._condition:
+            self._finished = True
+            self.error = error
+            self._condition.notify_all()
+        self.started.set()
+
+    def close(self) -> None:
+        """Stop reading, letting the download end early."""
+        with self._condition:
+            self._closed = True
+            self._chunks.clear()
+            self._condition.notify_all()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._chunks or self._finished)
+                if not self._chunks:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                chunk = self._chunks.popleft()
+                self._condition.notify_all()
+            yield chunk
+
+
+class _Tally:
+    """Counts and hashes the chunks passed to an upload, and reports progress."""
+
+    def __init__(self, hash_algorithm: str | None, progress: ProgressCallback | None):
+        self.hash_algorithm: str | None = hash_algorithm
+        self.size: int = 0
+        self._hash = hashlib.new(hash_algorithm) if hash_algorithm is not None else None
+        self._progress = progress
+
+    def add(self, chunk: bytes, total: int | None) -> None:
+        self.size += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        if self._progress is not None:
+            self._progress(self.size, total)
+
+    def fill(self, result: MigrationResult) -> None:
+        result.size = self.size
+        result.hash_algorithm = self.hash_algorithm
+        result.hash = self._hash.hexdigest() if self._hash is not None else None
+
+
+def _find_session(sessions, save_name: str) -> str | None:
+    for session in sessions.sessions:
+        if any(header.save_name == save_name for header in session.save_headers):
+            return session.session_name
+    return None
+
+
+def _is_running(state, session_name: str | None) -> bool:
+    return bool(state.is_game_running) and state.active_session_name == session_name
+
+
+def _poll(check, timeout: float, poll_interval: float, message: str):
+    deadline = time.monotonic() + timeout
+    while True:
+        value = check()
+        if value:
+            return value
+        if time.monotonic() + poll_interval > deadline:
+            raise TimeoutError(message)
+        time.sleep(poll_interval)
+
+
+async def _poll_async(check, timeout: float, poll_interval: float, message: str):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        value = await check()
+        if value:
+            return value
+        if loop.time() + poll_interval > deadline:
+            raise TimeoutError(message)
+        await asyncio.sleep(poll_interval)
+
+
+def migrate_save(source: 'SatisfactoryAPI', target: 'SatisfactoryAPI', save_name: str,
+                 target_save_name: str | None = None, load_game: bool = False,
+                 enable_advanced_game_settings: bool = False, verify: bool = True,
+                 max_buffered_chunks: int = DEFAULT_MAX_BUFFERED_CHUNKS, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 progress: ProgressCallback | None = None, hash_algorithm: str | None = 'sha256',
+                 timeout: float = 60.0, poll_interval: float = 1.0) -> MigrationResult:
+    """
+    Move a save from one server to another without writing it to disk or holding it in memory as a whole.
+
+    The download from ``source`` runs on a worker thread and feeds the upload to ``target`` through a buffer of at
+    most ``max_buffered_chunks`` chunks, so both transfers run at once and memory use does not grow with the save
+    size. The size the source announces is used as the size of the upload.
+
+    Parameters
+    ----------
+    source : SatisfactoryAPI
+        The server to copy the save from, logged in with administrator privileges.
+    target : SatisfactoryAPI
+        The server to copy the save to, logged in with administrator privileges.
+    save_name : str
+        The name of the save on the source.
+    target_save_name : str, optional
+        The name to store the save under on the target, by default ``save_name``.
+    load_game : bool, optional
+        Whether to load the save on the target once it is uploaded, by default False.
+    enable_advanced_game_settings : bool, optional
+        Whether to enable advanced game settings when loading the save, by default False.
+    verify : bool, optional
+        Whether to wait for the target to list the save and, with ``load_game``, to report the session of the save as
+        running, by default True.
+    max_buffered_chunks : int, optional
+        The maximum number of chunks held between the download and the upload, by default 8.
+    chunk_size : int, optional
+        The number of bytes read from the source at a time, by default 1 MiB.
+    progress : ProgressCallback, optional
+        Called as ``progress(bytes_done, total_bytes)`` after every chunk passed to the upload.
+    hash_algorithm : str | None, optional
+        The ``hashlib`` algorithm used to hash the save while it is transferred, by default 'sha256'. None disables
+        hashing.
+    timeout : float, optional
+        How long to wait for each verification, in seconds, by default 60.0.
+    poll_interval : float, optional
+        The seconds between checks while verifying, by default 1.0.
+
+    Returns
+    -------
+    MigrationResult
+        The size and hash of the transferred save, and what was verified.
+
+    Raises
+    ------
+    APIError
+        If either server returns an error. A download failing midway aborts the upload.
+    TimeoutError
+        If the target does not list the save, or does not run its session, within ``timeout``.
+    """
+    target_save_name = target_save_name or save_name
+    result = MigrationResult(save_name, target_save_name)
+    tally = _Tally(hash_algorithm, progress)
+    pipe = _ChunkPipe(max_buffered_chunks)
+
+    def download() -> None:
+        try:
+            with source._stream_save_game(save_name) as response:
+                pipe.size = content_length(response.headers)
+                pipe.started.set()
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if not pipe.put(chunk):
+                        return
+        except BaseException as e:
+            pipe.finish(e)
+        else:
+            pipe.finish()
+
+    def chunks() -> Iterator[bytes]:
+        for chunk in pipe:
+            tally.add(chunk, pipe.size)
+            yield chunk
+
+    start = time.perf_counter()
+    reader = threading.Thread(target=download, name='satisfactory-migration', daemon=True)
+    reader.start()
+    try:
+        pipe.started.wait()
+        if pipe.error is not None:
+            raise pipe.error
+        try:
+            target.upload_save_game(target_save_name, chunks(), size=pipe.size, chunk_size=chunk_size)
+        except Exception:
+            # The upload fails when the download does; report the cause rather than the aborted request
+            if pipe.error is not None:
+                raise pipe.error
+            raise
+    finally:
+        pipe.close()
+        reader.join()
+    tally.fill(result)
+    result.stages['transfer'] = time.perf_counter() - start
+
+    if verify:
+        stage_start = time.perf_counter()
+        result.session_name = _poll(
+            lambda: _find_session(target.enumerate_sessions().model, target_save_name),
+            timeout, poll_interval, f'Save {target_save_name!r} was not listed within {timeout}s')
+        result.stages['verify'] = time.perf_counter() - stage_start
+
+    if load_game:
+        stage_start = time.perf_counter()
+        target.load_game(target_save_name, enable_advanced_game_settings)
+        result.loaded = True
+        if verify:
+            _poll(lambda: _is_running(target.query_server_state().model, result.session_name),
+                  timeout, poll_interval, f'Session {result.session_name!r} was not running within {timeout}s')
+            result.health = target.health_check().data.get('health')
+        result.stages['load'] = time.perf_counter() - stage_start
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def migrate_save_async(source: 'AsyncSatisfactoryAPI', target: 'AsyncSatisfactoryAPI', save_name: str,
+                             target_save_name: str | None = None, load_game: bool = False,
+                             enable_advanced_game_settings: bool = False, verify: bool = True,
+                             max_buffered_chunks: int = DEFAULT_MAX_BUFFERED_CHUNKS,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE, progress: ProgressCallback | None = None,
+                             hash_algorithm: str | None = 'sha256', timeout: float = 60.0,
+                             poll_interval: float = 1.0) -> MigrationResult:
+    """
+    Move a save from one server to another, like `migrate_save`, with async clients.
+
+    The download runs as a task feeding the upload through an ``asyncio.Queue`` of at most ``max_buffered_chunks``
+    chunks. Takes the same arguments as `migrate_save`.
+    """
+    target_save_name = target_save_name or save_name
+    result = MigrationResult(save_name, target_save_name)
+    tally = _Tally(hash_algorithm, progress)
+    queue: asyncio.Queue = asyncio.Queue(max_buffered_chunks)
+    loop = asyncio.get_running_loop()
+    size: asyncio.Future = loop.create_future()
+    end = object()
+    errors: list[Exception] = []
+
+    async def download() -> None:
+        try:
+            async with source._stream_save_game(save_name) as response:
+                size.set_result(content_length(response.headers))
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    await queue.put(chunk)
+        except Exception as e:
+            errors.append(e)
+            if not size.done():
+                size.set_exception(e)
+            else:
+                await queue.put(e)
+        else:
+            await queue.put(end)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        while (chunk := await queue.get()) is not end:
+            if isinstance(chunk, BaseException):
+                raise chunk
+            tally.add(chunk, size.result())
+            yield chunk
+
+    start = time.perf_counter()
+    reader = asyncio.create_task(download())
+    try:
+        await target.upload_save_game(target_save_name, chunks(), size=await size, chunk_size=chunk_size)
+    except Exception:
+        if errors:
+            raise errors[0]
+        raise
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+    tally.fill(result)
+    result.stages['transfer'] = time.perf_counter() - start
+
+    if verify:
+        stage_start = time.perf_counter()
+
+        async def listed() -> str | None:
+            return _find_session((await target.enumerate_sessions()).model, target_save_name)
+
+        result.session_name = await _poll_async(listed, timeout, poll_interval,
+                                                f'Save {target_save_name!r} was not listed within {timeout}s')
+        result.stages['verify'] = time.perf_counter() - stage_start
+
+    if load_game:
+        stage_start = time.perf_counter()
+        await target.load_game(target_save_name, enable_advanced_game_settings)
+        result.loaded = True
+        if verify:
+            async def running() -> bool:
+                return _is_running((await target.query_server_state()).model, result.session_name)
+
+            await _poll_async(running, timeout, poll_interval,
+                              f'Session {result.session_name!r} was not running within {timeout}s')
+            result.health = (await target.health_check()).data.get('health')
+        result.stages['load'] = time.perf_counter() - stage_start
+
+    result.elapsed = time.perf_counter() - start
+    return result
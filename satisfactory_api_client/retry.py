@@ -0,0 +1,164 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+from .config import READ_FUNCTIONS
+from .exceptions import CircuitOpenError
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how often a client retries a call that failed with a connection error or timeout.
+
+    Only idempotent functions are retried, as a write that failed mid-flight may already have been applied.
+    The delay before retry ``n`` (counting from 0) is drawn uniformly from ``[0, min(max_delay, base_delay *
+    multiplier ** n)]`` ("full jitter"), so many clients retrying against the same server do not do so in lockstep.
+
+    Attributes
+    ----------
+    max_attempts : int
+        The maximum number of attempts, including the first one.
+    base_delay : float
+        The delay cap in seconds before the first retry.
+    max_delay : float
+        The largest delay cap in seconds.
+    multiplier : float
+        The factor the delay cap grows by per retry.
+    jitter : bool
+        Whether to randomize the delay. When False, the cap itself is used.
+    retry_functions : frozenset[str]
+        The API functions that may be retried.
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 5.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_functions: frozenset[str] = READ_FUNCTIONS
+
+    def should_retry(self, func: str, attempt: int) -> bool:
+        """
+        Whether a failed call should be retried.
+
+        Parameters
+        ----------
+        func : str
+            The API function that failed.
+        attempt : int
+            The number of attempts made so far.
+
+        Returns
+        -------
+        bool
+            True if ``func`` may be retried and attempts are left.
+        """
+        return func in self.retry_functions and attempt < self.max_attempts
+
+    def delay(self, retry: int) -> float:
+        """
+        The number of seconds to wait before a retry.
+
+        Parameters
+        ----------
+        retry : int
+            The number of the retry, counting from 0.
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        cap = min(self.max_delay, self.base_delay * self.multiplier ** retry)
+        return random.uniform(0, cap) if self.jitter else cap
+
+
+class CircuitState(Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a server that keeps failing with connection errors, so it does not tie up workers while it is
+    down.
+
+    After ``failure_threshold`` consecutive connection failures the circuit opens and calls fail immediately with
+    `CircuitOpenError`. Once ``recovery_timeout`` seconds have passed it becomes half-open: the next call first
+    sends a ``HealthCheck`` probe, which closes the circuit if the server answers and reopens it if not. Only one
+    probe runs at a time; other calls keep failing fast until it finishes.
+
+    API errors do not count as failures, since the server answered them.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Parameters
+        ----------
+        failure_threshold : int, optional
+            The number of consecutive connection failures that opens the circuit, by default 5.
+        recovery_timeout : float, optional
+            The number of seconds the circuit stays open before a probe is allowed, by default 30.0.
+        """
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self.failures: int = 0
+        self._opened_at: float | None = None
+        self._probing: bool = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def acquire(self) -> bool:
+        """
+        Ask to make a call.
+
+        Returns
+        -------
+        bool
+            True if the circuit is half-open and the caller must send a health check probe first.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit is open, or half-open with a probe already running.
+        """
+        with self._lock:
+            state = self.state
+            if state is CircuitState.CLOSED:
+                return False
+            if state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            retry_after = self.recovery_timeout - (time.monotonic() - self._opened_at)
+        raise CircuitOpenError(retry_after)
+
+    def record_success(self) -> None:
+        """Close the circuit after the server answered."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release(self) -> None:
+        """Give up a probe without a verdict, e.g. when the call was cancelled, so another call can probe."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a connection failure, opening the circuit when the threshold is reached or a probe failed."""
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
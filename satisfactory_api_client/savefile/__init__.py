@@ -0,0 +1,2 @@
+from .body import SaveChunk, decompress_save_body, iter_save_body, iter_save_chunks
+from .header import iter_save_file_headers, parse_save_file_header, read_save_file_header
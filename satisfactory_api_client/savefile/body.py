@@ -0,0 +1,244 @@
+import mmap
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Iterator, NamedTuple
+
+from ..backup.chunking import SAVE_CHUNK_TAG
+from ..exceptions import SaveFormatError
+from ..streaming import Destination, ProgressCallback, SaveGameSink
+from .header import _map_save_file, parse_save_file_header
+
+_ARCHIVE_V2_TAG = b'\x22\x22\x22\x22'
+_LEGACY_TAG = bytes(4)
+_V2_CHUNK_HEADER = struct.Struct('<8xqB4q')
+_LEGACY_CHUNK_HEADER = struct.Struct('<8xq4q')
+
+DEFAULT_BATCH_SIZE = 4 * 1024 * 1024
+"""The default number of uncompressed bytes decompressed by one task of the process pool."""
+
+
+class SaveChunk(NamedTuple):
+    """
+    The location of one compressed chunk of a save body.
+
+    Attributes
+    ----------
+    offset : int
+        The offset of the chunk header in the file.
+    data_offset : int
+        The offset of the compressed data in the file.
+    compressed_size : int
+        The size of the compressed data in bytes.
+    uncompressed_size : int
+        The size of the data once decompressed.
+    """
+    offset: int
+    data_offset: int
+    compressed_size: int
+    uncompressed_size: int
+
+
+def iter_save_chunks(buffer, offset: int) -> Iterator[SaveChunk]:
+    """
+    Locate the compressed chunks of a save body by walking their headers, without decompressing anything.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray | memoryview | mmap.mmap
+        The save file.
+    offset : int
+        The offset of the body: the ``header_size`` of the save's header.
+
+    Yields
+    ------
+    SaveChunk
+        The chunks, in order.
+
+    Raises
+    ------
+    SaveFormatError
+        If a chunk header is missing or the file ends within a chunk.
+    """
+    end = len(buffer)
+    while offset < end:
+        if buffer[offset:offset + 4] != SAVE_CHUNK_TAG:
+            raise SaveFormatError('Missing save chunk tag', offset)
+        version = buffer[offset + 4:offset + 8]
+        if version == _ARCHIVE_V2_TAG:
+            layout = _V2_CHUNK_HEADER
+        elif version == _LEGACY_TAG:
+            layout = _LEGACY_CHUNK_HEADER
+        else:
+            raise SaveFormatError('Unknown save chunk header version', offset + 4)
+        if offset + layout.size > end:
+            raise SaveFormatError('Unexpected end of a save chunk header', offset)
+        # The compressed and uncompressed sizes are stored twice: for the chunk, and for its only block
+        compressed_size, uncompressed_size = layout.unpack_from(buffer, offset)[-4:-2]
+        data_offset = offset + layout.size
+        if compressed_size < 0 or uncompressed_size < 0 or data_offset + compressed_size > end:
+            raise SaveFormatError('Unexpected end of a save chunk', offset)
+        yield SaveChunk(offset, data_offset, compressed_size, uncompressed_size)
+        offset = data_offset + compressed_size
+
+
+def _decompress(buffer, chunks: list[SaveChunk]) -> bytes:
+    return b''.join(zlib.decompress(buffer[chunk.data_offset:chunk.data_offset + chunk.compressed_size])
+                    for chunk in chunks)
+
+
+# The memory map of the save file, opened once in each worker process of the pool
+_worker_buffer: mmap.mmap | None = None
+
+
+def _open_worker_file(path: str) -> None:
+    global _worker_buffer
+    with open(path, 'rb') as f:
+        _worker_buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _decompress_in_worker(chunks: list[SaveChunk]) -> bytes:
+    return _decompress(_worker_buffer, chunks)
+
+
+def _batches(chunks: Iterable[SaveChunk], batch_size: int) -> Iterator[list[SaveChunk]]:
+    batch: list[SaveChunk] = []
+    size = 0
+    for chunk in chunks:
+        batch.append(chunk)
+        size += chunk.uncompressed_size
+        if size >= batch_size:
+            yield batch
+            batch = []
+            size = 0
+    if batch:
+        yield batch
+
+
+def _checked(data: bytes, batch: list[SaveChunk]) -> bytes:
+    if len(data) != sum(chunk.uncompressed_size for chunk in batch):
+        raise SaveFormatError('Save chunk size mismatch', batch[0].offset)
+    return data
+
+
+def iter_save_body(path: str | os.PathLike, max_workers: int | None = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Decompress the body of a save file, on all cores, as a stream of chunks in order.
+
+    The file is memory-mapped and the chunk boundaries are found from the chunk headers. Batches of chunks are then
+    decompressed on a process pool whose workers map the file themselves, so only the chunk locations and the
+    decompressed data cross between processes. At most two batches per worker are in flight, so memory use does not
+    grow with the save size.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The ``.sav`` file.
+    max_workers : int, optional
+        The number of worker processes, by default ``os.cpu_count()``. With 1 the body is decompressed in this
+        process.
+    batch_size : int, optional
+        The number of uncompressed bytes decompressed by one task, by default 4 MiB.
+
+    Yields
+    ------
+    bytes
+        The decompressed body, one batch at a time.
+
+    Raises
+    ------
+    SaveFormatError
+        If the file is not a save file, or its body is truncated or corrupt.
+    """
+    with _map_save_file(path) as buffer:
+        header = parse_save_file_header(buffer)
+        yield from _iter_body(path, buffer, iter_save_chunks(buffer, header.header_size), max_workers, batch_size)
+
+
+def _iter_body(path: str | os.PathLike, buffer: mmap.mmap, chunks: Iterable[SaveChunk], max_workers: int | None,
+               batch_size: int) -> Iterator[bytes]:
+    max_workers = max_workers or os.cpu_count() or 1
+    batches = _batches(chunks, batch_size)
+    if max_workers == 1:
+        for batch in batches:
+            try:
+                data = _decompress(buffer, batch)
+            except zlib.error as e:
+                raise SaveFormatError(f'Corrupt save chunk ({e})', batch[0].offset) from e
+            yield _checked(data, batch)
+        return
+
+    with ProcessPoolExecutor(max_workers, initializer=_open_worker_file, initargs=(os.fspath(path),)) as pool:
+        pending: deque[tuple[list[SaveChunk], Future]] = deque()
+        try:
+            for batch in batches:
+                pending.append((batch, pool.submit(_decompress_in_worker, batch)))
+                while len(pending) > 2 * max_workers:
+                    yield _result(*pending.popleft())
+            while pending:
+                yield _result(*pending.popleft())
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _result(batch: list[SaveChunk], future: Future) -> bytes:
+    try:
+        data = future.result()
+    except zlib.error as e:
+        raise SaveFormatError(f'Corrupt save chunk ({e})', batch[0].offset) from e
+    return _checked(data, batch)
+
+
+def decompress_save_body(path: str | os.PathLike, destination: Destination, max_workers: int | None = None,
+                         batch_size: int = DEFAULT_BATCH_SIZE, progress: ProgressCallback | None = None,
+                         hash_algorithm: str | None = 'sha256') -> dict:
+    """
+    Decompress the body of a save file to a file, using all cores.
+
+    Use `iter_save_body` to pass the body to anything else.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The ``.sav`` file.
+    destination : str | os.PathLike | BinaryIO
+        The path to write the body to, or a binary file object opened for writing. A path is written to
+        ``<path>.part`` first and only moved into place once the body is complete.
+    max_workers : int, optional
+        The number of worker processes, by default ``os.cpu_count()``.
+    batch_size : int, optional
+        The number of uncompressed bytes decompressed by one task, by default 4 MiB.
+    progress : ProgressCallback, optional
+        Called as ``progress(bytes_done, total_bytes)`` after every batch.
+    hash_algorithm : str | None, optional
+        The ``hashlib`` algorithm used to hash the body, by default 'sha256'. None disables hashing.
+
+    Returns
+    -------
+    dict
+        The save name from the header (the file name for saves too old to record it), the ``size`` of the body,
+        ``hash_algorithm`` and the ``hash`` of the body.
+
+    Raises
+    ------
+    SaveFormatError
+        If the file is not a save file, or its body is truncated or corrupt.
+    """
+    with _map_save_file(path) as buffer:
+        header = parse_save_file_header(buffer)
+        # The chunks are located once, both for the total size and for the decompression
+        chunks = list(iter_save_chunks(buffer, header.header_size))
+        sink = SaveGameSink(destination, sum(chunk.uncompressed_size for chunk in chunks), progress, hash_algorithm)
+        try:
+            for data in _iter_body(path, buffer, chunks, max_workers, batch_size):
+                sink.write(data)
+        except BaseException:
+            sink.abort()
+            raise
+    sink.commit()
+    save_name = header.save_name or os.path.splitext(os.path.basename(path))[0]
+    return sink.result(save_name)
@@ -0,0 +1,167 @@
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+from ..data.save_file_header import SaveFileHeader
+from ..exceptions import SaveFormatError
+
+_INT32 = struct.Struct('<i')
+_INT64 = struct.Struct('<q')
+_VERSIONS = struct.Struct('<3i')
+# Far beyond any header version the game has used, but small enough to reject most files that are not saves
+_MAX_HEADER_VERSION = 255
+
+
+class _Cursor:
+    """Reads little-endian values from a buffer, raising `SaveFormatError` instead of reading past its end."""
+
+    __slots__ = ('buffer', 'offset', 'end')
+
+    def __init__(self, buffer, offset: int = 0):
+        self.buffer = buffer
+        self.offset: int = offset
+        self.end: int = len(buffer)
+
+    def _take(self, size: int) -> int:
+        offset = self.offset
+        if size < 0 or offset + size > self.end:
+            raise SaveFormatError('Unexpected end of the save header', offset)
+        self.offset = offset + size
+        return offset
+
+    def unpack(self, layout: struct.Struct) -> tuple:
+        return layout.unpack_from(self.buffer, self._take(layout.size))
+
+    def int32(self) -> int:
+        return _INT32.unpack_from(self.buffer, self._take(4))[0]
+
+    def int64(self) -> int:
+        return _INT64.unpack_from(self.buffer, self._take(8))[0]
+
+    def byte(self) -> int:
+        return self.buffer[self._take(1)]
+
+    def bytes(self, size: int) -> bytes:
+        offset = self._take(size)
+        return bytes(self.buffer[offset:offset + size])
+
+    def string(self) -> str:
+        # An FString: its length including the terminating null, negated for UTF-16 text, then the characters
+        length = self.int32()
+        if length == 0:
+            return ''
+        if length > 0:
+            offset = self._take(length)
+            return bytes(self.buffer[offset:offset + length - 1]).decode('latin-1')
+        offset = self._take(-2 * length)
+        return bytes(self.buffer[offset:offset - 2 * length - 2]).decode('utf-16-le')
+
+
+def parse_save_file_header(buffer) -> SaveFileHeader:
+    """
+    Parse the header of a save file.
+
+    Only the header is read, so ``buffer`` may hold the whole file, such as the bytes returned by
+    ``download_save_game`` or a memory map, or just its start.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray | memoryview | mmap.mmap
+        The save file.
+
+    Returns
+    -------
+    SaveFileHeader
+        The header.
+
+    Raises
+    ------
+    SaveFormatError
+        If the buffer ends within the header, or does not start with a save header.
+    """
+    cursor = _Cursor(buffer)
+    header_version, save_version, build_version = cursor.unpack(_VERSIONS)
+    if not 1 <= header_version <= _MAX_HEADER_VERSION:
+        raise SaveFormatError(f'Invalid save header version {header_version}', 0)
+
+    save_name = cursor.string() if header_version >= 14 else None
+    header = SaveFileHeader(header_version, save_version, build_version, save_name, cursor.string(),
+                            cursor.string(), cursor.string(), cursor.int32(), cursor.int64())
+    if header_version >= 5:
+        header.session_visibility = cursor.byte()
+    if header_version >= 7:
+        header.editor_object_version = cursor.int32()
+    if header_version >= 8:
+        header.mod_metadata = cursor.string()
+        header.is_modded_save = cursor.int32() != 0
+    if header_version >= 10:
+        header.save_identifier = cursor.string()
+    if header_version >= 11:
+        header.is_partitioned_world = cursor.int32() != 0
+    if header_version >= 12:
+        # An FMD5Hash: a validity flag, followed by the digest only when it is valid
+        if cursor.int32() != 0:
+            header.save_data_hash = cursor.bytes(16)
+    if header_version >= 13:
+        header.is_creative_mode_enabled = cursor.int32() != 0
+    header.header_size = cursor.offset
+    return header
+
+
+def read_save_file_header(path: str | os.PathLike) -> SaveFileHeader:
+    """
+    Read the header of a save file from disk.
+
+    The file is memory-mapped, so only the pages holding the header are read, however large the save is.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The ``.sav`` file.
+
+    Returns
+    -------
+    SaveFileHeader
+        The header.
+
+    Raises
+    ------
+    SaveFormatError
+        If the file is not a save file, or ends within the header.
+    """
+    with _map_save_file(path) as buffer:
+        return parse_save_file_header(buffer)
+
+
+@contextmanager
+def _map_save_file(path: str | os.PathLike) -> Iterator[mmap.mmap]:
+    """Memory-map a save file for reading, raising `SaveFormatError` for an empty file, which cannot be mapped."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise SaveFormatError('Unexpected end of the save header', 0)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def iter_save_file_headers(paths: Iterable[str | os.PathLike]) -> Iterator[tuple[str, SaveFileHeader]]:
+    """
+    Read the headers of many save files, skipping the files that are not save files.
+
+    Parameters
+    ----------
+    paths : Iterable[str | os.PathLike]
+        The files, such as ``pathlib.Path(directory).rglob('*.sav')``.
+
+    Yields
+    ------
+    tuple[str, SaveFileHeader]
+        The path of each save file and its header.
+    """
+    for path in paths:
+        try:
+            header = read_save_file_header(path)
+        except SaveFormatError:
+            continue
+        yield os.fspath(path), header
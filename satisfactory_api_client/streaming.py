@@ -0,0 +1,292 @@
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Callable, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+"""The default number of bytes read from the network per chunk when streaming save games."""
+
+ProgressCallback = Callable[[int, int | None], None]
+"""Called as ``progress(bytes_done, total_bytes)`` after every chunk. ``total_bytes`` is None when unknown."""
+
+Destination = str | os.PathLike | BinaryIO
+
+UploadSource = str | os.PathLike | BinaryIO | Iterable[bytes] | AsyncIterable[bytes]
+
+
+def content_length(headers) -> int | None:
+    """
+    Read the ``Content-Length`` header of a response.
+
+    Parameters
+    ----------
+    headers : Mapping
+        The response headers.
+
+    Returns
+    -------
+    int | None
+        The announced body size, or None if the server did not send one.
+    """
+    value = headers.get('Content-Length')
+    return int(value) if value is not None else None
+
+
+class SaveGameSink:
+    """
+    Writes a save game stream to a path or file object chunk by chunk, hashing and reporting progress on the fly.
+
+    When writing to a path the data first goes to ``<path>.part``, which is moved into place by `commit`, so an
+    interrupted download never leaves a truncated save behind.
+    """
+
+    def __init__(self, destination: Destination, total: int | None = None, progress: ProgressCallback | None = None,
+                 hash_algorithm: str | None = 'sha256'):
+        """
+        Parameters
+        ----------
+        destination : str | os.PathLike | BinaryIO
+            The path to write the save to, or a binary file object opened for writing.
+        total : int, optional
+            The expected size of the save in bytes, passed through to ``progress``.
+        progress : ProgressCallback, optional
+            Called after every chunk with the bytes written so far and ``total``.
+        hash_algorithm : str | None, optional
+            Any algorithm accepted by ``hashlib.new``, by default 'sha256'. None disables hashing.
+        """
+        self.total: int | None = total
+        self.size: int = 0
+        self._progress = progress
+        self._hash = hashlib.new(hash_algorithm) if hash_algorithm else None
+        self.hash_algorithm: str | None = hash_algorithm
+
+        if isinstance(destination, (str, os.PathLike)):
+            self._path: str | None = os.fspath(destination)
+            self._file: BinaryIO = open(self._path + '.part', 'wb')
+        else:
+            self._path = None
+            self._file = destination
+
+    def write(self, chunk: bytes) -> None:
+        """Write, hash and count one chunk."""
+        self._output(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        self.size += len(chunk)
+        if self._progress is not None:
+            self._progress(self.size, self.total)
+
+    def _output(self, data: bytes) -> None:
+        """Write data to the file. Subclasses may transform it first."""
+        self._file.write(data)
+
+    def commit(self) -> None:
+        """Flush the data and, when writing to a path, move the finished file into place."""
+        if self._path is None:
+            self._file.flush()
+            return
+        self._file.close()
+        os.replace(self._path + '.part', self._path)
+
+    def abort(self) -> None:
+        """Discard a partially written path destination. File objects are left to their owner."""
+        if self._path is None:
+            return
+        self._file.close()
+        try:
+            os.remove(self._path + '.part')
+        except FileNotFoundError:
+            pass
+
+    def result(self, save_name: str) -> dict:
+        """
+        Describe the finished download.
+
+        Parameters
+        ----------
+        save_name : str
+            The name of the downloaded save.
+
+        Returns
+        -------
+        dict
+            The save name, the number of bytes written and the hex digest (None when hashing is disabled).
+        """
+        return {
+            'save_name': save_name,
+            'size': self.size,
+            'hash_algorithm': self.hash_algorithm,
+            'hash': self._hash.hexdigest() if self._hash is not None else None,
+        }
+
+
+class ThreadedSink:
+    """
+    Runs the writes of a `SaveGameSink` on a worker thread, so compressing and writing one chunk overlaps with
+    receiving the next from the network.
+
+    Writes stay in order. At most ``max_pending`` chunks wait for the worker; beyond that `write` blocks, which bounds
+    memory use when the disk or the compressor is slower than the network. ``progress`` callbacks of the sink are
+    called from the worker thread.
+    """
+
+    def __init__(self, sink: SaveGameSink, max_pending: int = 4):
+        """
+        Parameters
+        ----------
+        sink : SaveGameSink
+            The sink to write to.
+        max_pending : int, optional
+            The maximum number of chunks queued for the worker, by default 4.
+        """
+        self.sink: SaveGameSink = sink
+        self.max_pending: int = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='satisfactory-sink')
+        self._pending: deque[Future] = deque()
+
+    @property
+    def size(self) -> int:
+        """The number of bytes the worker has written so far."""
+        return self.sink.size
+
+    def write(self, chunk: bytes) -> None:
+        """Queue a chunk, waiting while too many chunks are queued."""
+        self._pending.append(self._executor.submit(self.sink.write, chunk))
+        while len(self._pending) > self.max_pending:
+            self._pending.popleft().result()
+
+    async def write_async(self, chunk: bytes) -> None:
+        """Like `write`, waiting without blocking the event loop."""
+        self._pending.append(self._executor.submit(self.sink.write, chunk))
+        while len(self._pending) > self.max_pending:
+            await asyncio.wrap_future(self._pending.popleft())
+
+    def commit(self) -> None:
+        """Wait for the queued chunks, then commit the sink."""
+        try:
+            while self._pending:
+                self._pending.popleft().result()
+            self.sink.commit()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def abort(self) -> None:
+        """Drop the queued chunks, then abort the sink."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+        self.sink.abort()
+
+    def result(self, save_name: str) -> dict:
+        """Describe the finished download, as `SaveGameSink.result` does."""
+        return self.sink.result(save_name)
+
+
+def _source_size(source: UploadSource) -> int | None:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if hasattr(source, 'read'):
+        try:
+            if not source.seekable():
+                return None
+            position = source.tell()
+            end = source.seek(0, os.SEEK_END)
+            source.seek(position)
+            return end - position
+        except (AttributeError, OSError):
+            return None
+    return None
+
+
+class MultipartUpload:
+    """
+    A streaming ``multipart/form-data`` body for the ``UploadSaveGame`` function.
+
+    The body holds the JSON request in a ``data`` part and the save in a ``saveGameFile`` part. The save is read
+    from its source one chunk at a time while the request is being sent, so it is never loaded into memory as a
+    whole. When the size of the source is known (paths, regular files, or an explicit ``size``) the body has a
+    fixed length; otherwise it is sent with chunked transfer encoding.
+    """
+
+    def __init__(self, payload: dict, source: UploadSource, filename: str, size: int | None = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Parameters
+        ----------
+        payload : dict
+            The JSON request, ``{'function': 'UploadSaveGame', 'data': {...}}``.
+        source : str | os.PathLike | BinaryIO | Iterable[bytes] | AsyncIterable[bytes]
+            A path, a binary file object opened for reading, or an (async) iterable of byte chunks.
+        filename : str
+            The file name sent for the save part.
+        size : int, optional
+            The number of bytes ``source`` will produce. Only needed for iterables, whose size cannot be looked up.
+        chunk_size : int, optional
+            The number of bytes read from a path or file object at a time, by default 1 MiB.
+        """
+        self.boundary: str = uuid.uuid4().hex
+        self.content_type: str = f'multipart/form-data; boundary={self.boundary}'
+        self._source = source
+        self._chunk_size = chunk_size
+        self._head = (
+            f'--{self.boundary}\r\n'
+            'Content-Disposition: form-data; name="data"\r\n'
+            'Content-Type: application/json\r\n\r\n'
+            f'{json.dumps(payload)}\r\n'
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="saveGameFile"; filename="{filename}"\r\n'
+            'Content-Type: application/octet-stream\r\n\r\n'
+        ).encode()
+        self._tail = f'\r\n--{self.boundary}--\r\n'.encode()
+
+        source_size = size if size is not None else _source_size(source)
+        # ``len`` is the attribute requests looks up to send a Content-Length instead of chunked encoding
+        self.len: int | None = (
+            len(self._head) + source_size + len(self._tail) if source_size is not None else None
+        )
+
+    def _read_chunks(self, file: BinaryIO) -> Iterator[bytes]:
+        return iter(lambda: file.read(self._chunk_size), b'')
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        if isinstance(self._source, (str, os.PathLike)):
+            with open(self._source, 'rb') as file:
+                yield from self._read_chunks(file)
+        elif hasattr(self._source, 'read'):
+            yield from self._read_chunks(self._source)
+        else:
+            yield from self._source
+        yield self._tail
+
+    async def iter_async(self) -> AsyncIterator[bytes]:
+        """
+        Iterate the body from an event loop. File reads run in a worker thread so they do not block the loop.
+
+        Yields
+        ------
+        bytes
+            The next chunk of the body.
+        """
+        yield self._head
+        if isinstance(self._source, (str, os.PathLike)) or hasattr(self._source, 'read'):
+            owns_file = isinstance(self._source, (str, os.PathLike))
+            file = await asyncio.to_thread(open, self._source, 'rb') if owns_file else self._source
+            try:
+                while chunk := await asyncio.to_thread(file.read, self._chunk_size):
+                    yield chunk
+            finally:
+                if owns_file:
+                    await asyncio.to_thread(file.close)
+        elif hasattr(self._source, '__aiter__'):
+            async for chunk in self._source:
+                yield chunk
+        else:
+            for chunk in self._source:
+                yield chunk
+        yield self._tail
@@ -0,0 +1,2 @@
+from .certs import generate_self_signed_certificate
+from .fake_server import FakeSatisfactoryServer, FakeSave, Faults
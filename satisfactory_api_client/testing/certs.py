@@ -0,0 +1,74 @@
+import datetime
+import ipaddress
+import os
+import shutil
+import subprocess
+
+
+def generate_self_signed_certificate(directory: str) -> tuple[str, str]:
+    """
+    Generate a throwaway self-signed certificate for ``localhost`` and ``127.0.0.1``.
+
+    The certificate is made with the ``cryptography`` package when it is installed
+    (``pip install satisfactory_api_client[testing]``), and with the ``openssl`` command line tool otherwise.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to write ``cert.pem`` and ``key.pem`` to.
+
+    Returns
+    -------
+    tuple[str, str]
+        The paths of the certificate and the private key.
+
+    Raises
+    ------
+    RuntimeError
+        If neither ``cryptography`` nor ``openssl`` is available.
+    """
+    cert_path = os.path.join(directory, 'cert.pem')
+    key_path = os.path.join(directory, 'key.pem')
+    try:
+        _generate_with_cryptography(cert_path, key_path)
+    except ImportError:
+        if shutil.which('openssl') is None:
+            raise RuntimeError("Generating a certificate needs the cryptography package "
+                               "(pip install satisfactory_api_client[testing]) or the openssl command line tool "
+                               "on PATH") from None
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-subj', '/CN=localhost',
+             '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1', '-keyout', key_path, '-out', cert_path],
+            check=True, capture_output=True
+        )
+    return cert_path, key_path
+
+
+def _generate_with_cryptography(cert_path: str, key_path: str) -> None:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName('localhost'),
+                                                    x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]),
+                       critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    with open(key_path, 'wb') as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                  serialization.NoEncryption()))
+    with open(cert_path, 'wb') as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
@@ -0,0 +1,559 @@
+import asyncio
+import base64
+import io
+import json
+import random
+import secrets
+import ssl
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+from .certs import generate_self_signed_certificate
+
+_PRIVILEGE_RANKS: dict[str, int] = {
+    'NotAuthenticated': 0,
+    'Client': 1,
+    'Administrator': 2,
+    'APIToken': 2,
+}
+
+_PUBLIC_FUNCTIONS = frozenset({'HealthCheck', 'PasswordlessLogin', 'PasswordLogin'})
+
+_REQUIRED_PRIVILEGE: dict[str, str] = {
+    'VerifyAuthenticationToken': 'NotAuthenticated',
+    'QueryServerState': 'Client',
+    'ClaimServer': 'InitialAdmin',
+}
+"""The privilege level needed by authenticated functions other than those needing ``Administrator``."""
+
+_STREAMED_FUNCTIONS = frozenset({'DownloadSaveGame', 'UploadSaveGame'})
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_default_certificate: tuple[tempfile.TemporaryDirectory, str, str] | None = None
+_default_certificate_lock = threading.Lock()
+
+
+def _get_default_certificate() -> tuple[str, str]:
+    """Generate one certificate per process and share it between servers, as generating a key takes a while."""
+    global _default_certificate
+    with _default_certificate_lock:
+        if _default_certificate is None:
+            directory = tempfile.TemporaryDirectory(prefix='satisfactory-fake-server-')
+            _default_certificate = (directory, *generate_self_signed_certificate(directory.name))
+        return _default_certificate[1], _default_certificate[2]
+
+
+@dataclass
+class Faults:
+    """
+    Misbehaviour injected into the answers of a `FakeSatisfactoryServer`.
+
+    Every probability is checked independently per request, so the faults can be combined. Assign a new instance to
+    ``server.faults`` at any time to change them while the server runs.
+
+    Attributes
+    ----------
+    latency : float
+        Seconds to wait before answering.
+    latency_jitter : float
+        Up to this many extra seconds, drawn uniformly, are added to ``latency``.
+    error_rate : float
+        The probability of answering with a ``500`` ``internal_server_error``.
+    drop_rate : float
+        The probability of closing the connection without an answer. Save downloads are cut off halfway through
+        the body instead.
+    body_rate : float | None
+        The number of bytes per second save download bodies are sent at. None sends them as fast as possible.
+    functions : frozenset[str] | None
+        The API functions the faults apply to. None applies them to every function.
+    """
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    drop_rate: float = 0.0
+    body_rate: float | None = None
+    functions: frozenset[str] | None = None
+
+    def applies_to(self, func: str) -> bool:
+        """Whether the faults apply to calls of ``func``."""
+        return self.functions is None or func in self.functions
+
+
+@dataclass
+class FakeSave:
+    """
+    A save file held by a `FakeSatisfactoryServer`.
+
+    Attributes
+    ----------
+    name : str
+        The name of the save, without the ``.sav`` extension.
+    session_name : str
+        The session the save belongs to.
+    data : bytes
+        The contents of the save file.
+    saved_at : datetime
+        When the save was made.
+    play_duration_seconds : int
+        The play time recorded in the save.
+    """
+    name: str
+    session_name: str
+    data: bytes = b''
+    saved_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    play_duration_seconds: int = 0
+
+    def header(self) -> dict:
+        """The save header reported by ``EnumerateSessions``."""
+        return {
+            'saveVersion': 46,
+            'buildVersion': 365306,
+            'saveName': self.name,
+            'saveLocationInfo': 'Server',
+            'mapName': 'Persistent_Level',
+            'mapOptions': '',
+            'sessionName': self.session_name,
+            'playDurationSeconds': self.play_duration_seconds,
+            'saveDateTime': self.saved_at.strftime('%Y.%m.%d-%H.%M.%S'),
+            'isModdedSave': False,
+            'isEditedSave': False,
+            'isCreativeModeEnabled': False,
+        }
+
+
+class _APIFailure(Exception):
+    def __init__(self, status: int, error_code: str, message: str):
+        self.status = status
+        self.error_code = error_code
+        self.message = message
+        super().__init__(message)
+
+
+def _param(data: dict, name: str):
+    if name not in data:
+        raise _APIFailure(400, 'missing_params', f'Missing required parameter: {name}')
+    return data[name]
+
+
+def _json_response(status: int, body: dict) -> web.Response:
+    return web.Response(status=status, body=json.dumps(body).encode(),
+                        headers={'Content-Type': 'application/json;charset=utf-8'})
+
+
+class FakeSatisfactoryServer:
+    """
+    An in-memory stand-in for a dedicated server's HTTPS API, for testing and load testing code built on this
+    package without running the game.
+
+    Every API function the clients send is implemented on top of in-memory state: authentication tokens and
+    privilege levels, server options, advanced game settings, the game state, sessions and save files, including
+    streamed uploads and downloads. Latency, errors, dropped connections and slow bodies can be injected with
+    `Faults`.
+
+    Use ``async with FakeSatisfactoryServer() as server`` to run it on the current event loop, or
+    ``with FakeSatisfactoryServer() as server`` to run it on its own thread for synchronous code. Connect with
+    ``skip_ssl_verification=True``, or verify against ``server.cert_path``.
+
+    The state is exposed as plain attributes (``saves``, ``game_state``, ``server_options``, ``tokens``, ...) that
+    tests can set up and inspect directly. ``calls`` counts the requests received per API function, including those
+    hit by faults.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, server_name: str = 'Fake Server',
+                 admin_password: str | None = None, client_password: str | None = None, faults: Faults | None = None,
+                 certfile: str | None = None, keyfile: str | None = None, seed: int | None = None):
+        """
+        Parameters
+        ----------
+        host : str, optional
+            The address to listen on, by default '127.0.0.1'.
+        port : int, optional
+            The port to listen on, by default 0 (any free port). The actual port is in ``port`` once started.
+        server_name : str, optional
+            The name of the server, by default 'Fake Server'.
+        admin_password : str, optional
+            The admin password. When None the server is unclaimed and passwordless logins get ``InitialAdmin``
+            privileges, so ``ClaimServer`` can be called.
+        client_password : str, optional
+            The client password. When None, claimed servers allow passwordless ``Client`` logins.
+        faults : Faults, optional
+            The faults to inject, by default none.
+        certfile : str, optional
+            The certificate to serve. A self-signed certificate for localhost is generated when omitted.
+        keyfile : str, optional
+            The private key of ``certfile``.
+        seed : int, optional
+            Seeds the random number generator deciding which requests faults hit, for reproducible runs.
+        """
+        self.host: str = host
+        self.port: int = port
+        self.server_name: str = server_name
+        self.admin_password: str | None = admin_password
+        self.client_password: str | None = client_password
+        self.faults: Faults = faults or Faults()
+        if certfile is None:
+            certfile, keyfile = _get_default_certificate()
+        self.cert_path: str = certfile
+        self._key_path: str | None = keyfile
+        self._random = random.Random(seed)
+
+        self.tokens: dict[str, str] = {}
+        self.saves: dict[str, FakeSave] = {}
+        self.server_options: dict[str, str] = {
+            'FG.DSAutoPause': 'True',
+            'FG.DSAutoSaveOnDisconnect': 'True',
+            'FG.AutosaveInterval': '300',
+            'FG.ServerRestartTimeSlot': '1440',
+            'FG.SendGameplayData': 'True',
+            'FG.NetworkQuality': '3',
+        }
+        self.advanced_game_settings: dict[str, str] = {}
+        self.game_state: dict = {
+            'activeSessionName': '',
+            'numConnectedPlayers': 0,
+            'playerLimit': 4,
+            'techTier': 0,
+            'activeSchematic': 'None',
+            'gamePhase': 'None',
+            'isGameRunning': False,
+            'totalGameDuration': 0,
+            'isGamePaused': False,
+            'averageTickRate': 30.0,
+            'autoLoadSessionName': '',
+        }
+        # The content of the saves SaveGame creates; real saves are the serialized world
+        self.save_data: bytes = b''
+        self.commands: list[str] = []
+        self.shutdown_requested: bool = False
+        self.calls: Counter[str] = Counter()
+
+        self._functions = {
+            'HealthCheck': self._health_check,
+            'VerifyAuthenticationToken': self._verify_authentication_token,
+            'PasswordlessLogin': self._passwordless_login,
+            'PasswordLogin': self._password_login,
+            'QueryServerState': self._query_server_state,
+            'GetServerOptions': self._get_server_options,
+            'GetAdvancedGameSettings': self._get_advanced_game_settings,
+            'ApplyAdvancedGameSettings': self._apply_advanced_game_settings,
+            'ClaimServer': self._claim_server,
+            'RenameServer': self._rename_server,
+            'SetClientPassword': self._set_client_password,
+            'SetAdminPassword': self._set_admin_password,
+            'SetAutoLoadSessionName': self._set_auto_load_session_name,
+            'RunCommand': self._run_command,
+            'Shutdown': self._shutdown,
+            'ApplyServerOptions': self._apply_server_options,
+            'CreateNewGame': self._create_new_game,
+            'SaveGame': self._save_game,
+            'DeleteSaveFile': self._delete_save_file,
+            'DeleteSaveSession': self._delete_save_session,
+            'EnumerateSessions': self._enumerate_sessions,
+            'LoadGame': self._load_game,
+        }
+        self._runner: web.AppRunner | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    async def start(self) -> None:
+        """Start listening on the current event loop."""
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.cert_path, self._key_path)
+        app = web.Application()
+        app.router.add_post('/api/v1', self._handle)
+        self._runner = web.AppRunner(app, access_log=None, handle_signals=False)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port, ssl_context=context, backlog=1024).start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop listening and close every connection."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'FakeSatisfactoryServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def __enter__(self) -> 'FakeSatisfactoryServer':
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='FakeSatisfactoryServer', daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), self._loop).result()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def issue_token(self, privilege: str = 'Administrator') -> str:
+        """
+        Issue an authentication token, like the ``server.GenerateAPIToken`` console command.
+
+        Parameters
+        ----------
+        privilege : str, optional
+            The privilege level of the token, by default 'Administrator'.
+
+        Returns
+        -------
+        str
+            The token.
+        """
+        claims = base64.urlsafe_b64encode(json.dumps({'pl': privilege}).encode()).decode().rstrip('=')
+        token = f'{claims}.{secrets.token_hex(32)}'
+        self.tokens[token] = privilege
+        return token
+
+    def add_save(self, name: str, session_name: str, data: bytes = b'', play_duration_seconds: int = 0) -> FakeSave:
+        """
+        Put a save file on the server.
+
+        Parameters
+        ----------
+        name : str
+            The name of the save.
+        session_name : str
+            The session the save belongs to.
+        data : bytes, optional
+            The contents of the save file, by default empty.
+        play_duration_seconds : int, optional
+            The play time recorded in the save, by default 0.
+
+        Returns
+        -------
+        FakeSave
+            The stored save.
+        """
+        save = FakeSave(name, session_name, data, play_duration_seconds=play_duration_seconds)
+        self.saves[name] = save
+        return save
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        multipart = request.content_type == 'multipart/form-data'
+        try:
+            if multipart:
+                reader = await request.multipart()
+                part = await reader.next()
+                body = await part.json()
+            else:
+                body = await request.json()
+            func = body['function']
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return _json_response(400, {'errorCode': 'invalid_request', 'errorMessage': 'Malformed API request'})
+        data = body.get('data') or {}
+        self.calls[func] += 1
+
+        faults = self.faults
+        applies = faults.applies_to(func)
+        if applies and (faults.latency or faults.latency_jitter):
+            await asyncio.sleep(faults.latency + self._random.uniform(0, faults.latency_jitter))
+        drop = applies and self._random.random() < faults.drop_rate
+        if drop and func != 'DownloadSaveGame':
+            request.transport.abort()
+            return web.Response()
+        if applies and self._random.random() < faults.error_rate:
+            return _json_response(500, {'errorCode': 'internal_server_error', 'errorMessage': 'Injected failure'})
+
+        try:
+            if func not in self._functions and func not in _STREAMED_FUNCTIONS:
+                raise _APIFailure(400, 'unknown_function', f'Unknown API function: {func}')
+            self._authorize(request, func)
+            if func == 'DownloadSaveGame':
+                return await self._download_save_game(request, data, faults if applies else Faults(), drop)
+            if func == 'UploadSaveGame':
+                if not multipart:
+                    raise _APIFailure(400, 'invalid_request', 'UploadSaveGame must be sent as multipart/form-data')
+                result = await self._upload_save_game(reader, data)
+            else:
+                result = self._functions[func](data)
+        except _APIFailure as e:
+            return _json_response(e.status, {'errorCode': e.error_code, 'errorMessage': e.message})
+
+        if result is None:
+            return web.Response(status=204)
+        return _json_response(200, {'data': result})
+
+    def _authorize(self, request: web.Request, func: str) -> None:
+        if func in _PUBLIC_FUNCTIONS:
+            return
+        authorization = request.headers.get('Authorization', '')
+        if not authorization.startswith('Bearer '):
+            raise _APIFailure(401, 'invalid_token', 'Missing authentication token')
+        privilege = self.tokens.get(authorization[len('Bearer '):])
+        if privilege is None:
+            raise _APIFailure(401, 'invalid_token', 'Invalid authentication token')
+
+        required = _REQUIRED_PRIVILEGE.get(func, 'Administrator')
+        if required == 'InitialAdmin':
+            allowed = privilege == 'InitialAdmin'
+        elif privilege == 'InitialAdmin':
+            # The initial admin may only claim the server and use what clients can
+            allowed = _PRIVILEGE_RANKS[required] <= _PRIVILEGE_RANKS['Client']
+        else:
+            allowed = _PRIVILEGE_RANKS[privilege] >= _PRIVILEGE_RANKS[required]
+        if not allowed:
+            raise _APIFailure(403, 'insufficient_scope', f'{func} requires {required} privileges')
+
+    def _health_check(self, data: dict) -> dict:
+        return {'health': 'healthy', 'serverCustomData': ''}
+
+    def _verify_authentication_token(self, data: dict) -> None:
+        return None
+
+    def _passwordless_login(self, data: dict) -> dict:
+        level = _param(data, 'MinimumPrivilegeLevel')
+        if self.admin_password is None:
+            return {'authenticationToken': self.issue_token('InitialAdmin')}
+        if level in ('NotAuthenticated', 'Client') and self.client_password is None:
+            return {'authenticationToken': self.issue_token('Client')}
+        raise _APIFailure(401, 'passwordless_login_not_possible', 'Passwordless login is not possible')
+
+    def _password_login(self, data: dict) -> dict:
+        level = _param(data, 'MinimumPrivilegeLevel')
+        password = _param(data, 'Password')
+        if self.admin_password is not None and password == self.admin_password:
+            return {'authenticationToken': self.issue_token('Administrator')}
+        if level == 'Client' and self.client_password is not None and password == self.client_password:
+            return {'authenticationToken': self.issue_token('Client')}
+        raise _APIFailure(401, 'wrong_password', 'Wrong password')
+
+    def _query_server_state(self, data: dict) -> dict:
+        return {'serverGameState': dict(self.game_state)}
+
+    def _get_server_options(self, data: dict) -> dict:
+        return {'serverOptions': dict(self.server_options), 'pendingServerOptions': {}}
+
+    def _get_advanced_game_settings(self, data: dict) -> dict:
+        return {
+            'creativeModeEnabled': bool(self.advanced_game_settings),
+            'advancedGameSettings': dict(self.advanced_game_settings),
+        }
+
+    def _apply_advanced_game_settings(self, data: dict) -> None:
+        self.advanced_game_settings.update(_param(data, 'AdvancedGameSettings'))
+
+    def _claim_server(self, data: dict) -> dict:
+        self.server_name = _param(data, 'ServerName')
+        self.admin_password = _param(data, 'AdminPassword')
+        # The initial admin tokens are revoked once the server is claimed
+        self.tokens = {token: level for token, level in self.tokens.items() if level != 'InitialAdmin'}
+        return {'authenticationToken': self.issue_token('Administrator')}
+
+    def _rename_server(self, data: dict) -> None:
+        self.server_name = _param(data, 'ServerName')
+
+    def _set_client_password(self, data: dict) -> None:
+        self.client_password = _param(data, 'Password') or None
+
+    def _set_admin_password(self, data: dict) -> None:
+        self.admin_password = _param(data, 'Password')
+
+    def _set_auto_load_session_name(self, data: dict) -> None:
+        self.game_state['autoLoadSessionName'] = _param(data, 'SessionName')
+
+    def _run_command(self, data: dict) -> dict:
+        self.commands.append(_param(data, 'Command'))
+        return {'commandResult': ''}
+
+    def _shutdown(self, data: dict) -> None:
+        self.shutdown_requested = True
+
+    def _apply_server_options(self, data: dict) -> None:
+        self.server_options.update(_param(data, 'UpdatedServerOptions'))
+
+    def _create_new_game(self, data: dict) -> None:
+        new_game = _param(data, 'NewGameData')
+        self._start_session(_param(new_game, 'SessionName'))
+
+    def _start_session(self, session_name: str) -> None:
+        self.game_state.update(activeSessionName=session_name, isGameRunning=True, isGamePaused=False)
+
+    def _save_game(self, data: dict) -> None:
+        session_name = self.game_state['activeSessionName']
+        if not session_name:
+            raise _APIFailure(400, 'save_game_failed', 'No game is running')
+        self.add_save(_param(data, 'SaveName'), session_name, self.save_data,
+                      play_duration_seconds=self.game_state['totalGameDuration'])
+
+    def _delete_save_file(self, data: dict) -> None:
+        if self.saves.pop(_param(data, 'SaveName'), None) is None:
+            raise _APIFailure(404, 'file_not_found', 'Save file not found')
+
+    def _delete_save_session(self, data: dict) -> None:
+        session_name = _param(data, 'SessionName')
+        names = [name for name, save in self.saves.items() if save.session_name == session_name]
+        if not names:
+            raise _APIFailure(404, 'session_not_found', 'Save session not found')
+        for name in names:
+            del self.saves[name]
+
+    def _enumerate_sessions(self, data: dict) -> dict:
+        sessions: dict[str, list[dict]] = {}
+        active = self.game_state['activeSessionName']
+        if active:
+            sessions[active] = []
+        for save in self.saves.values():
+            sessions.setdefault(save.session_name, []).append(save.header())
+        return {
+            'sessions': [{'sessionName': name, 'saveHeaders': headers} for name, headers in sessions.items()],
+            'currentSessionIndex': list(sessions).index(active) if active else -1,
+        }
+
+    def _load_game(self, data: dict) -> None:
+        save = self.saves.get(_param(data, 'SaveName'))
+        if save is None:
+            raise _APIFailure(404, 'file_not_found', 'Save file not found')
+        self._start_session(save.session_name)
+
+    async def _upload_save_game(self, reader, data: dict) -> None:
+        save_name = _param(data, 'SaveName')
+        part = await reader.next()
+        if part is None or part.name != 'saveGameFile':
+            raise _APIFailure(400, 'missing_params', 'Missing save game file')
+        buffer = io.BytesIO()
+        while chunk := await part.read_chunk(_STREAM_CHUNK_SIZE):
+            buffer.write(chunk)
+        existing = self.saves.get(save_name)
+        self.add_save(save_name, existing.session_name if existing else save_name, buffer.getvalue())
+        if data.get('LoadSaveGame'):
+            self._start_session(self.saves[save_name].session_name)
+
+    async def _download_save_game(self, request: web.Request, data: dict, faults: Faults,
+                                  drop: bool) -> web.StreamResponse:
+        save = self.saves.get(_param(data, 'SaveName'))
+        if save is None:
+            raise _APIFailure(404, 'file_not_found', 'Save file not found')
+
+        response = web.StreamResponse(headers={
+            'Content-Type': 'application/octet-stream',
+            'Content-Disposition': f'attachment; filename="{save.name}.sav"',
+        })
+        response.content_length = len(save.data)
+        await response.prepare(request)
+        body = memoryview(save.data)
+        end = len(body) // 2 if drop else len(body)
+        for offset in range(0, end, _STREAM_CHUNK_SIZE):
+            chunk = body[offset:min(offset + _STREAM_CHUNK_SIZE, end)]
+            await response.write(chunk)
+            if faults.body_rate:
+                await asyncio.sleep(len(chunk) / faults.body_rate)
+        if drop:
+            request.transport.abort()
+            return response
+        await response.write_eof()
+        return response
@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+import threading
+
+from .data.minimum_privilege_level import MinimumPrivilegeLevel
+
+_PRIVILEGE_RANKS: dict[str, int] = {
+    MinimumPrivilegeLevel.NOT_AUTHENTICATED.value: 0,
+    MinimumPrivilegeLevel.CLIENT.value: 1,
+    MinimumPrivilegeLevel.INITIAL_ADMIN.value: 2,
+    MinimumPrivilegeLevel.ADMINISTRATOR.value: 3,
+    MinimumPrivilegeLevel.API_TOKEN.value: 3,
+}
+
+Credentials = tuple[MinimumPrivilegeLevel, str | None]
+"""A privilege level and the password to log in with, or None for a passwordless login."""
+
+
+class TokenManager:
+    """
+    Keeps authentication tokens per server and privilege level, and the credentials to renew them.
+
+    Clients given a manager with ``token_manager=...`` start with its best token for their server instead of needing
+    a login, store the tokens of their logins in it, and log in again when the server rejects a token as invalid. With
+    a ``path`` the tokens are also kept in a JSON file, so later runs reuse them. Credentials are only kept in memory.
+
+    A manager is safe to share between threads and between the clients of many servers.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        """
+        Parameters
+        ----------
+        path : str | os.PathLike, optional
+            The JSON file to load tokens from and save them to, by default None (tokens are only kept in memory).
+            It is created when the first token is stored, readable by the current user only.
+        """
+        self.path: str | None = os.path.expanduser(os.fspath(path)) if path is not None else None
+        self._tokens: dict[str, dict[str, str]] = {}
+        self._credentials: dict[str, Credentials] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and os.path.exists(self.path):
+            with open(self.path) as f:
+                self._tokens = json.load(f)
+
+    def get(self, host: str, port: int = 7777, privilege: MinimumPrivilegeLevel | None = None) -> str | None:
+        """
+        Look up a stored token.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server.
+        port : int, optional
+            The port of the server, by default 7777.
+        privilege : MinimumPrivilegeLevel, optional
+            The privilege level of the token, by default None (the token with the highest privilege level).
+
+        Returns
+        -------
+        str | None
+            The token, or None if there is none.
+        """
+        with self._lock:
+            tokens = self._tokens.get(f'{host}:{port}')
+            if not tokens:
+                return None
+            if privilege is not None:
+                return tokens.get(privilege.value)
+            return tokens[max(tokens, key=lambda level: _PRIVILEGE_RANKS.get(level, 0))]
+
+    def put(self, host: str, port: int, privilege: MinimumPrivilegeLevel, token: str) -> None:
+        """
+        Store a token, replacing the server's previous token of the same privilege level.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server.
+        port : int
+            The port of the server.
+        privilege : MinimumPrivilegeLevel
+            The privilege level the token was requested with.
+        token : str
+            The token.
+        """
+        with self._lock:
+            self._tokens.setdefault(f'{host}:{port}', {})[privilege.value] = token
+            self._save()
+
+    def discard(self, host: str, port: int, token: str) -> None:
+        """
+        Forget a token the server rejected.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server.
+        port : int
+            The port of the server.
+        token : str
+            The token.
+        """
+        with self._lock:
+            tokens = self._tokens.get(f'{host}:{port}', {})
+            stale = [level for level, value in tokens.items() if value == token]
+            if stale:
+                for level in stale:
+                    del tokens[level]
+                self._save()
+
+    def set_credentials(self, host: str, port: int, privilege: MinimumPrivilegeLevel, password: str | None = None
+                        ) -> None:
+        """
+        Set how clients of a server log in when they have no valid token.
+
+        Clients also remember the credentials of their own last login, which take precedence.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server.
+        port : int
+            The port of the server.
+        privilege : MinimumPrivilegeLevel
+            The privilege level to log in with.
+        password : str, optional
+            The password to log in with, by default None (a passwordless login).
+        """
+        with self._lock:
+            self._credentials[f'{host}:{port}'] = (privilege, password)
+
+    def credentials(self, host: str, port: int = 7777) -> Credentials | None:
+        """
+        Get the credentials set for a server with `set_credentials`.
+
+        Parameters
+        ----------
+        host : str
+            The hostname or IP address of the server.
+        port : int, optional
+            The port of the server, by default 7777.
+
+        Returns
+        -------
+        tuple[MinimumPrivilegeLevel, str | None] | None
+            The privilege level and password, or None if none were set.
+        """
+        with self._lock:
+            return self._credentials.get(f'{host}:{port}')
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Write a private temporary file and rename it over the cache, so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tokens-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._tokens, f, indent=2)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -0,0 +1,178 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from .data.server_state_change import ServerStateChange
+
+if TYPE_CHECKING:
+    from .api_client import SatisfactoryAPI
+
+DEFAULT_WATCHED_FIELDS: tuple[str, ...] = (
+    'numConnectedPlayers',
+    'averageTickRate',
+    'isGamePaused',
+    'activeSessionName',
+)
+"""The ``serverGameState`` fields the watch methods report changes for by default."""
+
+
+def diff_server_state(previous: dict | None, current: dict, fields: Iterable[str] = DEFAULT_WATCHED_FIELDS,
+                      tick_rate_tolerance: float = 0.5) -> dict:
+    """
+    Compare two ``serverGameState`` dictionaries.
+
+    Parameters
+    ----------
+    previous : dict | None
+        The previously seen state, or None if there is none yet.
+    current : dict
+        The newly received state.
+    fields : Iterable[str], optional
+        The fields to compare, by default `DEFAULT_WATCHED_FIELDS`.
+    tick_rate_tolerance : float, optional
+        The smallest change of ``averageTickRate`` that is reported, by default 0.5, so normal jitter is ignored.
+
+    Returns
+    -------
+    dict
+        The fields whose value changed, mapped to their new value. Every field when ``previous`` is None.
+    """
+    if previous is None:
+        return {field: current.get(field) for field in fields}
+
+    changes = {}
+    for field in fields:
+        old, new = previous.get(field), current.get(field)
+        if field == 'averageTickRate' and old is not None and new is not None:
+            if abs(new - old) >= tick_rate_tolerance:
+                changes[field] = new
+        elif old != new:
+            changes[field] = new
+    return changes
+
+
+class AdaptiveInterval:
+    """
+    The delay between two polls of a watch.
+
+    The delay grows by ``backoff`` after every poll that finds the server paused or empty, up to ``max_interval``,
+    and drops back to ``min_interval`` as soon as players are connected and the game is running.
+    """
+
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 30.0, backoff: float = 2.0):
+        """
+        Parameters
+        ----------
+        min_interval : float, optional
+            The delay in seconds while the server is busy, by default 1.0.
+        max_interval : float, optional
+            The longest delay in seconds while the server is idle, by default 30.0.
+        backoff : float, optional
+            The factor the delay grows by per idle poll, by default 2.0.
+        """
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.backoff: float = backoff
+        self.current: float = min_interval
+
+    def update(self, state: dict) -> float:
+        """
+        Adjust the delay to a newly received state.
+
+        Parameters
+        ----------
+        state : dict
+            The ``serverGameState`` of the last poll.
+
+        Returns
+        -------
+        float
+            The number of seconds to wait before the next poll.
+        """
+        if state.get('isGamePaused') or not state.get('numConnectedPlayers'):
+            self.current = min(self.current * self.backoff, self.max_interval)
+        else:
+            self.current = self.min_interval
+        return self.current
+
+
+class ServerStateWatcher(threading.Thread):
+    """
+    A background thread that polls a `SatisfactoryAPI` and calls a callback with every `ServerStateChange`.
+
+    Created and started by `SatisfactoryAPI.watch_server_state`. Call `stop` to end it.
+    """
+
+    def __init__(self, api: 'SatisfactoryAPI', callback: Callable[[ServerStateChange], None],
+                 fields: Iterable[str] = DEFAULT_WATCHED_FIELDS, interval: AdaptiveInterval | None = None,
+                 tick_rate_tolerance: float = 0.5,
+                 on_error: Callable[[Exception], None] | None = None):
+        """
+        Parameters
+        ----------
+        api : SatisfactoryAPI
+            The client to poll.
+        callback : Callable[[ServerStateChange], None]
+            Called from the watcher thread with every change.
+        fields : Iterable[str], optional
+            The ``serverGameState`` fields to watch, by default `DEFAULT_WATCHED_FIELDS`.
+        interval : AdaptiveInterval, optional
+            The polling schedule, by default ``AdaptiveInterval()``.
+        tick_rate_tolerance : float, optional
+            The smallest change of ``averageTickRate`` that is reported, by default 0.5.
+        on_error : Callable[[Exception], None], optional
+            Called when a poll or the callback fails; the watcher keeps polling afterwards. Without it, the watcher
+            stores the exception in ``error`` and stops.
+        """
+        super().__init__(name=f'satisfactory-watch-{api.host}:{api.port}', daemon=True)
+        self.api = api
+        self.callback = callback
+        self.fields: tuple[str, ...] = tuple(fields)
+        self.interval: AdaptiveInterval = interval or AdaptiveInterval()
+        self.tick_rate_tolerance: float = tick_rate_tolerance
+        self.on_error = on_error
+        self.error: Exception | None = None
+        self._stopped = threading.Event()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop the watcher.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for a poll that is in progress to finish, by default True.
+        """
+        self._stopped.set()
+        if wait and self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+    def run(self) -> None:
+        reported = None
+        while not self._stopped.is_set():
+            try:
+                state = self.api.query_server_state().data['serverGameState']
+            except Exception as e:
+                if not self._handle_error(e):
+                    return
+                self._stopped.wait(self.interval.max_interval)
+                continue
+
+            changes = diff_server_state(reported, state, self.fields, self.tick_rate_tolerance)
+            if changes:
+                # Diff against the last reported values, so slow drift below the tolerance still gets reported
+                reported = {**(reported or {}), **changes}
+                try:
+                    self.callback(ServerStateChange(changes=changes, state=state, timestamp=time.time()))
+                except Exception as e:
+                    if not self._handle_error(e):
+                        return
+            self._stopped.wait(self.interval.update(state))
+
+    def _handle_error(self, error: Exception) -> bool:
+        """Pass an error to ``on_error``, or store it in ``error``. Returns whether the watcher should keep going."""
+        if self.on_error is None:
+            self.error = error
+            return False
+        self.on_error(error)
+        return True
@@ -9,12 +9,17 @@ readme_path = os.path.join(root_dir, 'README.md')
 setup(
     name='satisfactory_api_client',
     version='0.2.1',
-    packages=find_packages(exclude=['tests', 'examples']),
+    packages=find_packages(exclude=['tests', 'examples', 'benchmarks']),
     install_requires=[
         "python-dotenv~=1.0.1",
         "requests~=2.32",
         "aiohttp~=3.9",
     ],
+    extras_require={
+        'speedups': ["orjson>=3.8"],
+        'zstd': ["zstandard>=0.21"],
+        'testing': ["cryptography>=41"],
+    },
     description='A Python Package for interacting with the Satisfactory Dedicated Server API',
     long_description=open(readme_path).read(),
     long_description_content_type='text/markdown',
@@ -1,5 +1,8 @@
 import unittest
+from unittest.mock import patch
+
 from satisfactory_api_client.api_client import SatisfactoryAPI
+
 class TestAPIClient(unittest.TestCase):
     def test_initialization(self):
         client = SatisfactoryAPI("localhost")
@@ -10,6 +13,17 @@ class TestAPIClient(unittest.TestCase):
         client = SatisfactoryAPI("localhost", port=1234)
         self.assertEqual(client.port, 1234)
 
+    def test_session_pool_size(self):
+        client = SatisfactoryAPI("localhost", pool_maxsize=32)
+        adapter = client._session.get_adapter('https://localhost:7777/api/v1')
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    @patch('satisfactory_api_client.api_client.requests.Session.close')
+    def test_context_manager_closes_session(self, mock_close):
+        with SatisfactoryAPI("localhost") as client:
+            self.assertIsInstance(client, SatisfactoryAPI)
+        mock_close.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,11 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
-from satisfactory_api_client import SatisfactoryAPI
+from satisfactory_api_client import SatisfactoryAPI, APIError
 from satisfactory_api_client.data import Response, MinimumPrivilegeLevel, AdvancedGameSettings
 from satisfactory_api_client.data.server_options import ServerOptions
 
@@ -11,10 +16,10 @@ class TestApiFunctions(unittest.TestCase):
         # Create a mock response object
         self.mock_response = MagicMock()
         self.mock_response.status_code = 200  # Set status code to 200
-        self.mock_response.json.return_value = {"data": {"status": "ok"}}
+        self.mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         self.mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}  # Set the JSON response
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_health_check(self, mock_post):
         # Configure the mock to return the mock response
         mock_post.return_value = self.mock_response
@@ -28,18 +33,17 @@ class TestApiFunctions(unittest.TestCase):
         # Assert that requests.post was called with the correct arguments
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'HealthCheck', 'data': {'ClientCustomData': ''}},
+            data=api.json_backend.dumps({'function': 'HealthCheck', 'data': {'ClientCustomData': ''}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_passwordless_login(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"authenticationToken": "1234"}}
+        mock_response.content = json.dumps({"data": {"authenticationToken": "1234"}}).encode()
 
         mock_post.return_value = mock_response
 
@@ -51,18 +55,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'PasswordlessLogin', 'data': {'MinimumPrivilegeLevel': 'Client'}},
+            data=api.json_backend.dumps({'function': 'PasswordlessLogin', 'data': {'MinimumPrivilegeLevel': 'Client'}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_password_login(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"authenticationToken": "1234"}}
+        mock_response.content = json.dumps({"data": {"authenticationToken": "1234"}}).encode()
 
         mock_post.return_value = mock_response
 
@@ -74,18 +77,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'PasswordLogin', 'data': {'MinimumPrivilegeLevel': 'Administrator', 'Password': 'password'}},
+            data=api.json_backend.dumps({'function': 'PasswordLogin', 'data': {'MinimumPrivilegeLevel': 'Administrator', 'Password': 'password'}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_verify_authentication_token(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -97,18 +99,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'VerifyAuthenticationToken'},
+            data=api.json_backend.dumps({'function': 'VerifyAuthenticationToken'}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_query_server_state(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -120,18 +121,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'QueryServerState'},
+            data=api.json_backend.dumps({'function': 'QueryServerState'}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_get_server_options(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -143,18 +143,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'GetServerOptions'},
+            data=api.json_backend.dumps({'function': 'GetServerOptions'}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_get_advanced_game_settings(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -166,18 +165,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'GetAdvancedGameSettings'},
+            data=api.json_backend.dumps({'function': 'GetAdvancedGameSettings'}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_apply_advanced_game_settings(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -216,20 +214,19 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'ApplyAdvancedGameSettings',
+            data=api.json_backend.dumps({'function': 'ApplyAdvancedGameSettings',
                   'data': {'AdvancedGameSettings': advanced_game_settings.to_dict()}
-                  },
+                  }),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_claim_server(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -241,18 +238,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'ClaimServer', 'data': {'ServerName': 'server_name', 'AdminPassword': 'server_password'}},
+            data=api.json_backend.dumps({'function': 'ClaimServer', 'data': {'ServerName': 'server_name', 'AdminPassword': 'server_password'}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_rename_server(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -264,18 +260,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'RenameServer', 'data': {'ServerName': 'server_name'}},
+            data=api.json_backend.dumps({'function': 'RenameServer', 'data': {'ServerName': 'server_name'}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_set_client_password(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -287,18 +282,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'SetClientPassword', 'data': {'Password': 'password'}},
+            data=api.json_backend.dumps({'function': 'SetClientPassword', 'data': {'Password': 'password'}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_set_admin_password(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -310,20 +304,19 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'SetAdminPassword',
+            data=api.json_backend.dumps({'function': 'SetAdminPassword',
                   'data': {'Password': 'password', 'AuthenticationToken': 'new_admin_token'}
-                  },
+                  }),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_set_auto_load_session_name(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -335,18 +328,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'SetAutoLoadSessionName', 'data': {'SessionName': 'session_name'}},
+            data=api.json_backend.dumps({'function': 'SetAutoLoadSessionName', 'data': {'SessionName': 'session_name'}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_run_command(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -358,18 +350,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'RunCommand', 'data': {'Command': 'command'}},
+            data=api.json_backend.dumps({'function': 'RunCommand', 'data': {'Command': 'command'}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_shutdown(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -387,18 +378,17 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'Shutdown'},
+            data=api.json_backend.dumps({'function': 'Shutdown'}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-    @patch('satisfactory_api_client.api_client.requests.post')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
     def test_apply_server_options(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"status": "ok"}}
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
         mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
 
         mock_post.return_value = mock_response
@@ -422,14 +412,92 @@ class TestApiFunctions(unittest.TestCase):
 
         mock_post.assert_called_once_with(
             'https://localhost:7777/api/v1',
-            json={'function': 'ApplyServerOptions', 'data': {'UpdatedServerOptions': server_options.to_dict()}},
+            data=api.json_backend.dumps({'function': 'ApplyServerOptions', 'data': {'UpdatedServerOptions': server_options.to_dict()}}),
             headers={'Content-Type': 'application/json'},
-            files=None,
             verify=False,
             stream=True
         )
 
-#     TODO: add test for savegames
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_upload_save_game(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 204
+        mock_response.headers = {}
+
+        mock_post.return_value = mock_response
+
+        api = SatisfactoryAPI("localhost")
+        response = api.upload_save_game('save', io.BytesIO(b'savedata'), load_save_game=True)
+
+        self.assertEqual(response, Response(success=True, data={}))
+
+        upload = mock_post.call_args.kwargs['data']
+        self.assertEqual(mock_post.call_args.kwargs['headers'],
+                         {'Content-Type': f'multipart/form-data; boundary={upload.boundary}'})
+        body = b''.join(upload)
+        self.assertEqual(len(body), upload.len)
+        self.assertIn(b'{"function": "UploadSaveGame", "data": {"SaveName": "save", "LoadSaveGame": true, '
+                      b'"EnableAdvancedGameSettings": false}}', body)
+        self.assertIn(b'name="saveGameFile"; filename="save.sav"\r\nContent-Type: application/octet-stream\r\n\r\n'
+                      b'savedata\r\n', body)
+
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_iter_save_game(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'application/octet-stream', 'Content-Length': '6'}
+        mock_response.iter_content.return_value = iter([b'abc', b'def'])
+
+        mock_post.return_value = mock_response
+
+        api = SatisfactoryAPI("localhost")
+        chunks = list(api.iter_save_game('save', chunk_size=3))
+
+        self.assertEqual(chunks, [b'abc', b'def'])
+        mock_response.iter_content.assert_called_once_with(chunk_size=3)
+        mock_response.close.assert_called_once()
+
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_download_save_game_to(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'application/octet-stream', 'Content-Length': '6'}
+        mock_response.iter_content.return_value = iter([b'abc', b'def'])
+
+        mock_post.return_value = mock_response
+        progress = MagicMock()
+
+        api = SatisfactoryAPI("localhost")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'save.sav')
+            response = api.download_save_game_to('save', path, progress=progress)
+
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), b'abcdef')
+            self.assertFalse(os.path.exists(path + '.part'))
+
+        self.assertEqual(response, Response(success=True, data={
+            'save_name': 'save',
+            'size': 6,
+            'hash_algorithm': 'sha256',
+            'hash': hashlib.sha256(b'abcdef').hexdigest()
+        }))
+        progress.assert_called_with(6, 6)
+
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_download_save_game_to_error(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
+        mock_response.content = json.dumps({'errorCode': 'file_not_found', 'errorMessage': 'Save not found'}).encode()
+
+        mock_post.return_value = mock_response
+
+        api = SatisfactoryAPI("localhost")
+        with self.assertRaises(APIError) as context:
+            api.download_save_game_to('missing', io.BytesIO())
+        self.assertEqual(context.exception.error_code, 'file_not_found')
+
 
 if __name__ == "__main__":
     unittest.main()
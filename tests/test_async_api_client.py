@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import aiohttp
+
+from satisfactory_api_client import APIError
+from satisfactory_api_client.async_api_client import AsyncSatisfactoryAPI
+from satisfactory_api_client.data import Response
+
+
+class TestAsyncAPIClient(unittest.IsolatedAsyncioTestCase):
+    async def test_initialization(self):
+        client = AsyncSatisfactoryAPI("localhost")
+        self.assertEqual(client.host, "localhost")
+        self.assertEqual(client.port, 7777)
+
+    async def test_session_is_reused(self):
+        async with AsyncSatisfactoryAPI("localhost", limit_per_host=3) as client:
+            session = client._get_session()
+            self.assertIs(client._get_session(), session)
+            self.assertEqual(session.connector.limit_per_host, 3)
+        self.assertTrue(session.closed)
+
+    async def test_injected_session_is_not_closed(self):
+        async with aiohttp.ClientSession() as session:
+            first = AsyncSatisfactoryAPI("localhost", session=session)
+            second = AsyncSatisfactoryAPI("otherhost", session=session)
+            self.assertIs(first._get_session(), second._get_session())
+
+            await first.close()
+            self.assertFalse(session.closed)
+
+
+class TestRequestCoalescing(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+        async def send(api, func, data=None, files=None, upload=None):
+            self.calls.append(func)
+            await self.release.wait()
+            if func == 'GetServerOptions':
+                raise APIError('server_error', 'Something went wrong')
+            return {'function': func}
+
+        patcher = patch('satisfactory_api_client.async_api_client.AsyncSatisfactoryAPI._send', new=send)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_identical_reads_share_one_request(self):
+        api = AsyncSatisfactoryAPI("localhost")
+        waiters = [asyncio.create_task(api.query_server_state()) for _ in range(5)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*waiters)
+
+        self.assertEqual(self.calls, ['QueryServerState'])
+        self.assertTrue(all(result == Response(success=True, data={'function': 'QueryServerState'})
+                            for result in results))
+        self.assertEqual(api._in_flight, {})
+
+    async def test_different_payloads_are_not_coalesced(self):
+        api = AsyncSatisfactoryAPI("localhost")
+        waiters = [asyncio.create_task(api.health_check('a')), asyncio.create_task(api.health_check('b'))]
+        await asyncio.sleep(0)
+        self.release.set()
+        await asyncio.gather(*waiters)
+
+        self.assertEqual(self.calls, ['HealthCheck', 'HealthCheck'])
+
+    async def test_writes_are_not_coalesced(self):
+        api = AsyncSatisfactoryAPI("localhost")
+        self.release.set()
+        await asyncio.gather(api.save_game('save'), api.save_game('save'))
+
+        self.assertEqual(self.calls, ['SaveGame', 'SaveGame'])
+
+    async def test_exception_reaches_every_awaiter(self):
+        api = AsyncSatisfactoryAPI("localhost")
+        waiters = [asyncio.create_task(api.get_server_options()) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        self.assertEqual(self.calls, ['GetServerOptions'])
+        self.assertTrue(all(isinstance(result, APIError) for result in results))
+
+    async def test_cancelling_one_awaiter_keeps_the_request(self):
+        api = AsyncSatisfactoryAPI("localhost")
+        cancelled = asyncio.create_task(api.query_server_state())
+        kept = asyncio.create_task(api.query_server_state())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertEqual(await kept, Response(success=True, data={'function': 'QueryServerState'}))
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(self.calls, ['QueryServerState'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from satisfactory_api_client import AsyncSatisfactoryFleet, APIError
+from satisfactory_api_client.data import Response
+
+
+class TestAsyncFleet(unittest.IsolatedAsyncioTestCase):
+    async def test_initialization(self):
+        fleet = AsyncSatisfactoryFleet(['one', ('two', 8888)], auth_token='token')
+        self.assertEqual(list(fleet.clients), [('one', 7777), ('two', 8888)])
+        self.assertEqual(fleet.clients[('two', 8888)].auth_token, 'token')
+
+    async def test_results_stream_in_completion_order(self):
+        async def health_check(api, client_custom_data=''):
+            await asyncio.sleep(0.05 if api.host == 'slow' else 0)
+            return Response(success=True, data={'health': 'healthy', 'host': api.host})
+
+        with patch('satisfactory_api_client.async_api_client.AsyncSatisfactoryAPI.health_check',
+                   new=health_check):
+            async with AsyncSatisfactoryFleet(['slow', 'fast']) as fleet:
+                results = [result async for result in fleet.call('health_check')]
+
+        self.assertEqual([result.host for result in results], ['fast', 'slow'])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(results[0].response.data['host'], 'fast')
+
+    async def test_errors_and_timeouts_are_reported_per_server(self):
+        async def query_server_state(api):
+            if api.host == 'broken':
+                raise APIError('server_error', 'Something went wrong')
+            if api.host == 'hanging':
+                await asyncio.sleep(10)
+            return Response(success=True, data={})
+
+        with patch('satisfactory_api_client.async_api_client.AsyncSatisfactoryAPI.query_server_state',
+                   new=query_server_state):
+            async with AsyncSatisfactoryFleet(['ok', 'broken', 'hanging'], timeout=0.05) as fleet:
+                results = {result.host: result async for result in fleet.call('query_server_state')}
+
+        self.assertTrue(results['ok'].success)
+        self.assertIsInstance(results['broken'].error, APIError)
+        self.assertIsInstance(results['hanging'].error, asyncio.TimeoutError)
+
+    async def test_concurrency_cap(self):
+        running = 0
+        peak = 0
+
+        async def call(api):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return Response(success=True, data={})
+
+        async with AsyncSatisfactoryFleet([f'server{i}' for i in range(10)], concurrency=3) as fleet:
+            results = [result async for result in fleet.call(call)]
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual(peak, 3)
+
+    async def test_unknown_method(self):
+        fleet = AsyncSatisfactoryFleet(['one'])
+        with self.assertRaises(AttributeError):
+            fleet.call('not_a_method')
+
+    async def test_clients_share_one_session(self):
+        with patch('satisfactory_api_client.async_api_client.AsyncSatisfactoryAPI.health_check',
+                   new=AsyncMock(return_value=Response(success=True, data={}))):
+            async with AsyncSatisfactoryFleet(['one', 'two']) as fleet:
+                async for _ in fleet.call('health_check'):
+                    pass
+                sessions = {id(client._get_session()) for client in fleet.clients.values()}
+                self.assertEqual(len(sessions), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
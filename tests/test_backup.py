@@ -0,0 +1,115 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from satisfactory_api_client import AsyncSatisfactoryAPI, BackupStore, CorruptBackupError, SatisfactoryAPI
+from satisfactory_api_client.backup import SAVE_CHUNK_TAG, AnchorChunker
+from satisfactory_api_client.testing import FakeSatisfactoryServer
+
+
+def make_save(seed: int, blocks: int = 40, block_size: int = 100_000) -> list[bytes]:
+    rng = random.Random(seed)
+    return [SAVE_CHUNK_TAG + rng.randbytes(block_size) for _ in range(blocks)]
+
+
+class TestAnchorChunker(unittest.TestCase):
+    def chunk(self, data: bytes, step: int, **kwargs) -> list[bytes]:
+        chunker = AnchorChunker(**kwargs)
+        chunks = []
+        for i in range(0, len(data), step):
+            chunks.extend(chunker.feed(data[i:i + step]))
+        chunks.extend(chunker.finish())
+        return chunks
+
+    def test_cuts_do_not_depend_on_feed_sizes(self):
+        data = b''.join(make_save(1))
+        expected = self.chunk(data, len(data), min_size=150_000, max_size=250_000)
+        self.assertEqual(b''.join(expected), data)
+        self.assertEqual(self.chunk(data, 4099, min_size=150_000, max_size=250_000), expected)
+        self.assertTrue(all(150_000 <= len(chunk) <= 250_000 for chunk in expected[:-1]))
+
+    def test_cuts_at_anchors_and_max_size(self):
+        blocks = make_save(2, blocks=5)
+        self.assertEqual(self.chunk(b''.join(blocks), 1 << 20, min_size=1000, max_size=1 << 20), blocks)
+        self.assertEqual([len(chunk) for chunk in self.chunk(b'x' * 2500, 1000, min_size=10, max_size=1000)],
+                         [1000, 1000, 500])
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            AnchorChunker(min_size=10, max_size=5)
+
+
+class TestBackupStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = BackupStore(directory.name)
+
+    def test_dedup_and_restore(self):
+        first = make_save(3)
+        second = first[:10] + make_save(4, blocks=2) + first[10:]
+
+        result = self.store.write('Factory', iter(first), created=1000.0)
+        self.assertEqual(result.new_bytes, result.manifest.size)
+        self.assertEqual(result.dedup_ratio, 0.0)
+
+        result = self.store.write('Factory', iter(second), created=2000.0)
+        self.assertEqual(result.new_chunks, 2)
+        self.assertGreater(result.dedup_ratio, 0.9)
+
+        restored = io.BytesIO()
+        self.store.restore('Factory', restored, created=1500.0)
+        self.assertEqual(restored.getvalue(), b''.join(first))
+        self.assertEqual(b''.join(self.store.iter_save(self.store.manifest('Factory'))), b''.join(second))
+        self.assertEqual([manifest.created for manifest in self.store.manifests()], [1000.0, 2000.0])
+
+        stats = self.store.stats()
+        self.assertEqual(stats['backups'], 2)
+        self.assertEqual(stats['logical_bytes'], len(b''.join(first)) + len(b''.join(second)))
+        self.assertGreater(stats['dedup_ratio'], 0.45)
+
+    def test_missing_and_corrupt_backups(self):
+        with self.assertRaises(FileNotFoundError):
+            self.store.manifest('Factory')
+
+        manifest = self.store.write('../Factory', iter(make_save(5, blocks=2)), created=1000.0).manifest
+        self.assertTrue(os.path.abspath(self.store.manifest_path('../Factory', 1000.0)).startswith(
+            os.path.abspath(self.store.root)))
+        with open(self.store.chunk_path(manifest.chunks[0]), 'r+b') as f:
+            f.write(b'corrupt')
+
+        destination = os.path.join(self.store.root, 'restored.sav')
+        with self.assertRaises(CorruptBackupError):
+            self.store.restore('../Factory', destination)
+        self.assertFalse(os.path.exists(destination))
+        self.assertFalse(os.path.exists(destination + '.part'))
+
+
+class TestBackupFromServer(unittest.IsolatedAsyncioTestCase):
+    async def test_backup_sync_and_async(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = BackupStore(directory)
+            save = b''.join(make_save(6))
+            async with FakeSatisfactoryServer() as server:
+                server.add_save('Factory_autosave', 'Factory', save)
+                async with AsyncSatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True,
+                                                auth_token=server.issue_token()) as api:
+                    result = await store.backup_async(api, 'Factory_autosave', chunk_size=64 * 1024)
+                self.assertEqual(result.manifest.server, f'127.0.0.1:{server.port}')
+                self.assertEqual(result.manifest.size, len(save))
+                self.assertGreater(result.throughput, 0)
+
+            with FakeSatisfactoryServer() as server:
+                server.add_save('Factory_autosave', 'Factory', save)
+                with SatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True,
+                                     auth_token=server.issue_token(), verify_token=False) as api:
+                    result = store.backup(api, 'Factory_autosave')
+            self.assertEqual(result.new_chunks, 0)
+            self.assertEqual(result.dedup_ratio, 1.0)
+            self.assertEqual(len(store.manifests('Factory_autosave')), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
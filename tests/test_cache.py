@@ -0,0 +1,103 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from satisfactory_api_client import SatisfactoryAPI, ResponseCache
+from satisfactory_api_client.cache import MISSING
+from satisfactory_api_client.data import Response, ServerOptions
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = ResponseCache()
+        self.assertIs(cache.get('QueryServerState'), MISSING)
+        cache.put('QueryServerState', None, {'state': 1}, cache.generation)
+        self.assertEqual(cache.get('QueryServerState'), {'state': 1})
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1})
+
+    def test_uncached_functions_are_ignored(self):
+        cache = ResponseCache(ttls={'QueryServerState': None})
+        cache.put('QueryServerState', None, {'state': 1}, cache.generation)
+        cache.put('HealthCheck', {'ClientCustomData': ''}, {'health': 'healthy'}, cache.generation)
+        self.assertIs(cache.get('QueryServerState'), MISSING)
+        self.assertIs(cache.get('HealthCheck', {'ClientCustomData': ''}), MISSING)
+        self.assertEqual(cache.stats()['misses'], 0)
+
+    @patch('satisfactory_api_client.cache.time.monotonic')
+    def test_expiry(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        cache = ResponseCache(ttls={'QueryServerState': 5})
+        cache.put('QueryServerState', None, {'state': 1}, cache.generation)
+        mock_monotonic.return_value = 104.0
+        self.assertEqual(cache.get('QueryServerState'), {'state': 1})
+        mock_monotonic.return_value = 106.0
+        self.assertIs(cache.get('QueryServerState'), MISSING)
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(maxsize=2)
+        cache.put('QueryServerState', None, 1, cache.generation)
+        cache.put('GetServerOptions', None, 2, cache.generation)
+        cache.get('QueryServerState')
+        cache.put('EnumerateSessions', None, 3, cache.generation)
+        self.assertIs(cache.get('GetServerOptions'), MISSING)
+        self.assertEqual(cache.get('QueryServerState'), 1)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_invalidation(self):
+        cache = ResponseCache()
+        cache.put('GetServerOptions', None, 1, cache.generation)
+        cache.put('EnumerateSessions', None, 2, cache.generation)
+        cache.invalidate('SaveGame')
+        self.assertEqual(cache.get('GetServerOptions'), 1)
+        self.assertIs(cache.get('EnumerateSessions'), MISSING)
+
+    def test_stale_result_is_not_stored(self):
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate('ApplyServerOptions')
+        cache.put('GetServerOptions', None, 1, generation)
+        self.assertIs(cache.get('GetServerOptions'), MISSING)
+
+
+class TestClientCache(unittest.TestCase):
+    def setUp(self):
+        self.mock_response = MagicMock()
+        self.mock_response.status_code = 200
+        self.mock_response.content = json.dumps({"data": {"serverOptions": {}}}).encode()
+        self.mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
+
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_reads_are_cached_and_writes_invalidate(self, mock_post):
+        mock_post.return_value = self.mock_response
+        cache = ResponseCache()
+        api = SatisfactoryAPI("localhost", cache=cache)
+
+        first = api.get_server_options()
+        second = api.get_server_options()
+        self.assertEqual(first, second)
+        self.assertEqual(mock_post.call_count, 1)
+
+        api.apply_server_options(ServerOptions(DSAutoPause=True))
+        self.assertEqual(api.get_server_options(), Response(success=True, data={"serverOptions": {}}))
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_results_are_kept_per_server_and_token(self, mock_post):
+        mock_post.return_value = self.mock_response
+        cache = ResponseCache()
+        clients = [SatisfactoryAPI('10.0.0.1', cache=cache), SatisfactoryAPI('10.0.0.2', cache=cache),
+                   SatisfactoryAPI('10.0.0.1', cache=cache, auth_token='admin', verify_token=False)]
+        for api in clients * 2:
+            api.get_server_options()
+        self.assertEqual(mock_post.call_count, 3)
+
+        # A write drops the results of its server for every token, and only of its server
+        clients[0].apply_server_options(ServerOptions(DSAutoPause=True))
+        for api in clients:
+            api.get_server_options()
+        self.assertEqual(mock_post.call_count, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
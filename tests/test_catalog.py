@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+
+from satisfactory_api_client import RetentionPolicy, SaveCatalog
+from satisfactory_api_client.data import CatalogEntry
+
+from .test_savefile import build_header
+
+HOUR = 3600
+DAY = 24 * HOUR
+# A Monday, 00:00 UTC
+START = 1_760_313_600.0
+
+
+class TestRetentionPolicy(unittest.TestCase):
+    def entries(self, times: list[float]) -> list[CatalogEntry]:
+        return [CatalogEntry(f'/saves/{i}.sav', 'a', 'Factory', str(i), created, 0)
+                for i, created in enumerate(sorted(times, reverse=True))]
+
+    def test_periods(self):
+        # Two saves an hour for three days
+        entries = self.entries([START + i * HOUR / 2 for i in range(144)])
+        self.assertEqual(len(RetentionPolicy(last=5).select(entries)), 5)
+        self.assertEqual(len(RetentionPolicy(hourly=10).select(entries)), 10)
+        kept = RetentionPolicy(daily=7).select(entries)
+        self.assertEqual([entry.created for entry in kept], [START + 3 * DAY - HOUR / 2, START + 2 * DAY - HOUR / 2,
+                                                             START + DAY - HOUR / 2])
+        # The newest two, the newest of the hour before, and the newest of the two days before
+        self.assertEqual(len(RetentionPolicy(last=2, hourly=2, daily=3, weekly=1).select(entries)), 5)
+
+
+class TestSaveCatalog(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.catalog = SaveCatalog(os.path.join(self.directory, 'catalog.db'))
+        self.addCleanup(self.catalog.close)
+
+    def write(self, server: str, name: str, session_name: str, created: float) -> str:
+        os.makedirs(os.path.join(self.directory, server), exist_ok=True)
+        path = os.path.join(self.directory, server, f'{name}.sav')
+        with open(path, 'wb') as f:
+            f.write(build_header(session_name=session_name, body=name.encode()))
+        os.utime(path, (created, created))
+        return path
+
+    def test_scan_and_query(self):
+        for server in ('10.0.0.1_7777', '10.0.0.2_7777'):
+            for i in range(6):
+                self.write(server, f'Factory_{i}', 'Factory', START + i * HOUR)
+            self.write(server, 'Moon_0', 'Moon', START)
+        with open(os.path.join(self.directory, 'notes.sav'), 'w') as f:
+            f.write('not a save')
+
+        self.assertEqual(self.catalog.scan(self.directory), 14)
+        self.assertEqual(self.catalog.scan(self.directory), 0)
+        self.assertEqual(len(self.catalog), 14)
+
+        latest = self.catalog.latest()
+        self.assertEqual([(entry.server, entry.session_name) for entry in latest],
+                         [('10.0.0.1:7777', 'Factory'), ('10.0.0.1:7777', 'Moon'),
+                          ('10.0.0.2:7777', 'Factory'), ('10.0.0.2:7777', 'Moon')])
+        self.assertEqual(latest[0].created, START + 5 * HOUR)
+        self.assertEqual(latest[0].path, os.path.join(self.directory, '10.0.0.1_7777', 'Factory_5.sav'))
+        self.assertEqual(len(self.catalog.latest('10.0.0.2:7777')), 2)
+
+        found = self.catalog.find(server='10.0.0.1:7777', session_name='Factory', since=START + HOUR, limit=3)
+        self.assertEqual([entry.created for entry in found], [START + 5 * HOUR, START + 4 * HOUR, START + 3 * HOUR])
+        self.assertEqual(len(self.catalog.find(hash=found[0].hash)), 2)
+
+        entry = self.catalog.get(found[0].path)
+        self.assertEqual(entry.size, os.path.getsize(found[0].path))
+        self.assertEqual(entry.save_name, 'Factory_autosave_0')
+
+    def test_add_and_prune(self):
+        path = self.write('server', 'Factory_0', 'Factory', START)
+        entry = self.catalog.add(path, server='10.0.0.1:7777', save_name='Factory_0', created=START + 1, hash='abc')
+        self.assertEqual(self.catalog.get(path), entry)
+        self.assertEqual((entry.session_name, entry.hash, entry.created), ('Factory', 'abc', START + 1))
+
+        os.remove(path)
+        self.assertEqual(self.catalog.prune_missing(), 1)
+        self.assertEqual(len(self.catalog), 0)
+
+    def test_apply_retention(self):
+        paths = [self.write('a', f'Factory_{i}', 'Factory', START + i * HOUR / 2) for i in range(10)]
+        paths.append(self.write('a', 'Moon_0', 'Moon', START))
+        self.catalog.scan(self.directory, server='a', compute_hash=False)
+
+        with self.assertRaises(ValueError):
+            self.catalog.apply_retention(RetentionPolicy())
+        policy = RetentionPolicy(last=1, hourly=3)
+        self.assertEqual(len(self.catalog.apply_retention(policy, dry_run=True)), 7)
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+        deleted = self.catalog.apply_retention(policy)
+        self.assertEqual(sorted(entry.path for entry in deleted),
+                         sorted(paths[i] for i in (0, 1, 2, 3, 4, 6, 8)))
+        self.assertEqual(sorted(os.listdir(os.path.join(self.directory, 'a'))),
+                         ['Factory_5.sav', 'Factory_7.sav', 'Factory_9.sav', 'Moon_0.sav'])
+        self.assertEqual(len(self.catalog), 4)
+        self.assertEqual(self.catalog.apply_retention(policy), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
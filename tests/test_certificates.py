@@ -0,0 +1,109 @@
+import os
+import ssl
+import tempfile
+import unittest
+
+import requests
+
+from satisfactory_api_client import (AsyncSatisfactoryAPI, AsyncSatisfactoryFleet, CertificateMismatchError,
+                                     CertificateStore, DirectoryCertificateStore, SatisfactoryAPI, SatisfactoryFleet)
+from satisfactory_api_client.certificates import fingerprint
+from satisfactory_api_client.testing import FakeSatisfactoryServer
+from satisfactory_api_client.testing.certs import generate_self_signed_certificate
+
+
+class TestCertificateStore(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSatisfactoryServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        with open(self.server.cert_path) as f:
+            self.pem = f.read()
+
+    def client(self, store: CertificateStore, port: int | None = None) -> SatisfactoryAPI:
+        api = SatisfactoryAPI('127.0.0.1', port=port or self.server.port, certificate_store=store)
+        self.addCleanup(api.close)
+        return api
+
+    def test_verified_requests_share_one_context(self):
+        store = CertificateStore()
+        first, second = self.client(store), self.client(store)
+        first.init_certificate()
+        second.init_certificate()
+
+        self.assertIs(first._ssl_context, second._ssl_context)
+        self.assertEqual(first._ssl_context.verify_mode, ssl.CERT_REQUIRED)
+        self.assertEqual(first.health_check().data['health'], 'healthy')
+        self.assertEqual(second.health_check().data['health'], 'healthy')
+        self.assertEqual(fingerprint(store.get('127.0.0.1', self.server.port)), fingerprint(self.pem))
+
+    def test_request_with_another_servers_certificate_fails(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(generate_self_signed_certificate(directory)[0]) as f:
+                other_pem = f.read()
+            # The store trusts (and is pinned to) a certificate this server does not present
+            store = DirectoryCertificateStore(directory, pins={f'127.0.0.1:{self.server.port}': fingerprint(other_pem)})
+            with open(store.path('127.0.0.1', self.server.port), 'w') as f:
+                f.write(other_pem)
+            api = self.client(store)
+            api.init_certificate()
+            with self.assertRaises(requests.exceptions.SSLError):
+                api.health_check()
+
+    def test_pins(self):
+        port = self.server.port
+        pinned = CertificateStore(pins={f'127.0.0.1:{port}': fingerprint(self.pem).upper()})
+        self.client(pinned).init_certificate()
+
+        wrong = CertificateStore(pins={f'127.0.0.1:{port}': '00' * 32})
+        with self.assertRaises(CertificateMismatchError) as context:
+            self.client(wrong).init_certificate()
+        self.assertEqual(context.exception.actual, fingerprint(self.pem))
+        self.assertIsInstance(context.exception, ssl.SSLError)
+
+    def test_directory_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = DirectoryCertificateStore(directory)
+            api = self.client(store)
+            api.init_certificate()
+            self.assertEqual(api.cert_path, os.path.join(directory, f'127_0_0_1_{self.server.port}.pem'))
+            with open(api.cert_path) as f:
+                self.assertEqual(f.read(), store.get('127.0.0.1', self.server.port))
+
+            # A later run reads the file instead of contacting the server
+            self.assertEqual(DirectoryCertificateStore(directory)._load('127.0.0.1', self.server.port), store.get(
+                '127.0.0.1', self.server.port))
+
+    def test_fleet_reports_unreachable_servers(self):
+        with FakeSatisfactoryServer() as other:
+            unreachable = other.port
+        fleet = SatisfactoryFleet(certificate_store=CertificateStore())
+        self.addCleanup(fleet.close)
+        fleet.add_server('127.0.0.1', self.server.port)
+        fleet.add_server('127.0.0.1', unreachable)
+
+        errors = fleet.init_certificates()
+        self.assertEqual(list(errors), [('127.0.0.1', unreachable)])
+        self.assertIsNotNone(fleet.clients[('127.0.0.1', self.server.port)]._ssl_context)
+        self.assertIsNone(fleet.clients[('127.0.0.1', unreachable)]._ssl_context)
+
+
+class TestCertificateStoreAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_verified_requests(self):
+        store = CertificateStore()
+        async with FakeSatisfactoryServer() as server, \
+                AsyncSatisfactoryAPI('127.0.0.1', port=server.port, certificate_store=store) as api:
+            await api.init_certificate()
+            self.assertIs(api._ssl_context, store.ssl_context('127.0.0.1', server.port))
+            self.assertEqual((await api.health_check()).data['health'], 'healthy')
+
+    async def test_fleet(self):
+        async with FakeSatisfactoryServer() as server, \
+                AsyncSatisfactoryFleet(certificate_store=CertificateStore()) as fleet:
+            fleet.add_server('127.0.0.1', server.port)
+            self.assertEqual(await fleet.init_certificates(), {})
+            results = [result async for result in fleet.call('health_check')]
+            self.assertTrue(all(result.success for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
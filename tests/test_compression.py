@@ -0,0 +1,136 @@
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+from satisfactory_api_client import AsyncSatisfactoryAPI, SatisfactoryAPI
+from satisfactory_api_client.compression import DecompressingReader, get_codec, uncompressed_size
+from satisfactory_api_client.testing import FakeSatisfactoryServer
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def make_save(size: int = 300_000) -> bytes:
+    # Half random, half repeated, so the save compresses like a real one but not to nothing
+    return os.urandom(size // 2) + b'Factory' * (size // 14)
+
+
+class TestCodecs(unittest.TestCase):
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            get_codec('lzma')
+        with self.assertRaises(ValueError):
+            DecompressingReader(io.BytesIO(b'not compressed')).read()
+
+    def test_auto_codec(self):
+        self.assertEqual(get_codec().name, 'zstd' if zstandard is not None else 'gzip')
+
+    def test_uncompressed_size(self):
+        save = make_save()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'Factory.sav.gz')
+            for data, expected in ((gzip.compress(save), len(save)),
+                                   (gzip.compress(save[:1000]) + gzip.compress(save[1000:]), None),
+                                   (gzip.compress(save[:1000] + os.urandom(1000)), 2000)):
+                with open(path, 'wb') as f:
+                    f.write(data)
+                self.assertEqual(uncompressed_size(path), expected)
+
+    def test_reader_concatenated_members(self):
+        save = make_save()
+        for chunk_size in (1000, len(gzip.compress(save[:1000])), 1 << 20):
+            data = gzip.compress(save[:1000]) + gzip.compress(save[1000:])
+            self.assertEqual(DecompressingReader(io.BytesIO(data), chunk_size=chunk_size).read(), save)
+        with self.assertRaises(ValueError):
+            DecompressingReader(io.BytesIO(gzip.compress(save)[:-100])).read()
+
+    @unittest.skipIf(zstandard is None, 'zstandard is not installed')
+    def test_reader_detects_split_magic(self):
+        save = make_save()
+        compressor = zstandard.ZstdCompressor()
+        data = compressor.compress(save[:1000]) + compressor.compress(save[1000:])
+        reader = DecompressingReader([data[:2], data[2:3], data[3:]])
+        self.assertEqual(reader.read(), save)
+        self.assertEqual(reader.codec.name, 'zstd')
+        with self.assertRaises(ValueError):
+            DecompressingReader([b'\x28\xb5']).read()
+
+    def test_reader_small_reads(self):
+        save = make_save()
+        reader = DecompressingReader(io.BytesIO(gzip.compress(save)), chunk_size=1000)
+        parts = []
+        while part := reader.read(777):
+            parts.append(part)
+        self.assertEqual(b''.join(parts), save)
+        self.assertTrue(all(len(part) == 777 for part in parts[:-1]))
+        self.assertEqual(reader.codec.name, 'gzip')
+        self.assertEqual(reader.compressed_size, len(gzip.compress(save)))
+
+
+class TestCompressedTransfers(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.save = make_save()
+
+    def test_download_and_upload_sync(self):
+        path = os.path.join(self.directory, 'Factory.sav.gz')
+        with FakeSatisfactoryServer() as server:
+            server.add_save('Factory', 'Factory', self.save)
+            with SatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True,
+                                 auth_token=server.issue_token(), verify_token=False) as api:
+                result = api.download_save_game_to('Factory', path, chunk_size=16 * 1024, compression='gzip',
+                                                   compression_level=1, threaded=True).data
+                self.assertEqual(uncompressed_size(path), len(self.save))
+                api.upload_save_game('Restored', path, compression='auto')
+            self.assertEqual(server.saves['Restored'].data, self.save)
+
+        with open(path, 'rb') as f:
+            self.assertEqual(gzip.decompress(f.read()), self.save)
+        self.assertEqual(result['size'], len(self.save))
+        self.assertEqual(result['compression'], 'gzip')
+        self.assertEqual(result['compressed_size'], os.path.getsize(path))
+        self.assertGreater(result['ratio'], 1.5)
+        self.assertGreater(result['throughput'], 0)
+
+    async def test_download_and_upload_async(self):
+        path = os.path.join(self.directory, 'Factory.sav.gz')
+        async with FakeSatisfactoryServer() as server:
+            server.add_save('Factory', 'Factory', self.save)
+            async with AsyncSatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True,
+                                            auth_token=server.issue_token()) as api:
+                for threaded in (False, True):
+                    progress = []
+                    result = (await api.download_save_game_to(
+                        'Factory', path, chunk_size=16 * 1024, compression='gzip', threaded=threaded,
+                        progress=lambda done, total: progress.append(done))).data
+                    self.assertEqual(result['size'], len(self.save))
+                    self.assertEqual(progress[-1], len(self.save))
+                    with open(path, 'rb') as f:
+                        self.assertEqual(gzip.decompress(f.read()), self.save)
+
+                with open(path, 'rb') as f:
+                    await api.upload_save_game('Restored', f, compression='gzip', size=len(self.save))
+            self.assertEqual(server.saves['Restored'].data, self.save)
+
+    @unittest.skipIf(zstandard is None, 'zstandard is not installed')
+    async def test_zstd_round_trip(self):
+        path = os.path.join(self.directory, 'Factory.sav.zst')
+        async with FakeSatisfactoryServer() as server:
+            server.add_save('Factory', 'Factory', self.save)
+            async with AsyncSatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True,
+                                            auth_token=server.issue_token()) as api:
+                result = (await api.download_save_game_to('Factory', path, compression='zstd')).data
+                self.assertIsNone(uncompressed_size(path))
+                await api.upload_save_game('Restored', path, compression='detect')
+            self.assertEqual(server.saves['Restored'].data, self.save)
+        self.assertEqual(result['compression'], 'zstd')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import io
+import unittest
+
+import aiohttp
+import requests
+
+from satisfactory_api_client import APIError, AsyncSatisfactoryAPI, SatisfactoryAPI
+from satisfactory_api_client.data import MinimumPrivilegeLevel
+from satisfactory_api_client.testing import FakeSatisfactoryServer, Faults
+
+
+class TestFakeServerSync(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSatisfactoryServer(admin_password='admin').__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.api = SatisfactoryAPI('127.0.0.1', port=self.server.port, skip_ssl_verification=True)
+        self.addCleanup(self.api.close)
+
+    def test_authentication(self):
+        with self.assertRaises(APIError) as context:
+            self.api.query_server_state()
+        self.assertEqual(context.exception.error_code, 'invalid_token')
+
+        with self.assertRaises(APIError) as context:
+            self.api.password_login(MinimumPrivilegeLevel.ADMINISTRATOR, 'wrong')
+        self.assertEqual(context.exception.error_code, 'wrong_password')
+
+        self.api.passwordless_login(MinimumPrivilegeLevel.CLIENT)
+        self.assertTrue(self.api.query_server_state().success)
+        with self.assertRaises(APIError) as context:
+            self.api.get_server_options()
+        self.assertEqual(context.exception.error_code, 'insufficient_scope')
+
+        self.api.password_login(MinimumPrivilegeLevel.ADMINISTRATOR, 'admin')
+        self.assertEqual(self.api.get_server_options().data['serverOptions']['FG.NetworkQuality'], '3')
+
+    def test_sessions_and_saves_round_trip(self):
+        self.api.auth_token = self.server.issue_token()
+        self.server.add_save('old', 'Factory', b'old save')
+        self.api.load_game('old')
+        self.assertEqual(self.api.query_server_state().data['serverGameState']['activeSessionName'], 'Factory')
+
+        self.api.save_game('new')
+        self.api.upload_save_game('uploaded', io.BytesIO(b'x' * 200_000))
+        sessions = self.api.enumerate_sessions().data['sessions']
+        self.assertEqual([session['sessionName'] for session in sessions], ['Factory', 'uploaded'])
+        self.assertEqual([header['saveName'] for header in sessions[0]['saveHeaders']], ['old', 'new'])
+
+        self.assertEqual(self.api.download_save_game('uploaded').data, b'x' * 200_000)
+        self.api.delete_save_file('uploaded')
+        with self.assertRaises(APIError) as context:
+            self.api.download_save_game('uploaded')
+        self.assertEqual(context.exception.error_code, 'file_not_found')
+        self.assertEqual(self.server.calls['DownloadSaveGame'], 2)
+
+    def test_injected_errors_and_drops(self):
+        self.server.faults = Faults(error_rate=1.0, functions=frozenset({'HealthCheck'}))
+        with self.assertRaises(APIError) as context:
+            self.api.health_check()
+        self.assertEqual(context.exception.error_code, 'internal_server_error')
+
+        self.server.faults = Faults(drop_rate=1.0)
+        with self.assertRaises(requests.ConnectionError):
+            self.api.health_check()
+
+        self.server.faults = Faults()
+        self.assertEqual(self.api.health_check().data['health'], 'healthy')
+
+
+class TestFakeServerAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_claim_and_dropped_download(self):
+        async with FakeSatisfactoryServer() as server, \
+                AsyncSatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True) as api:
+            await api.passwordless_login(MinimumPrivilegeLevel.INITIAL_ADMIN)
+            await api.claim_server('Claimed', 'secret')
+            self.assertEqual(server.server_name, 'Claimed')
+            self.assertEqual(server.admin_password, 'secret')
+
+            await api.password_login(MinimumPrivilegeLevel.ADMINISTRATOR, 'secret')
+            server.add_save('big', 'Factory', b'y' * 1_000_000)
+            server.faults = Faults(drop_rate=1.0, functions=frozenset({'DownloadSaveGame'}))
+            with self.assertRaises(aiohttp.ClientPayloadError):
+                await api.download_save_game('big')
+
+            server.faults = Faults(body_rate=20_000_000)
+            self.assertEqual((await api.download_save_game('big')).data, b'y' * 1_000_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
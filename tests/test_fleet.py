@@ -0,0 +1,61 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from satisfactory_api_client import SatisfactoryFleet, APIError
+from satisfactory_api_client.data import Response
+
+
+class TestFleet(unittest.TestCase):
+    def test_initialization(self):
+        with SatisfactoryFleet(['one', ('two', 8888)], pool_maxsize=3) as fleet:
+            self.assertEqual(list(fleet.clients), [('one', 7777), ('two', 8888)])
+            adapter = fleet.clients[('one', 7777)]._session.get_adapter('https://one:7777/api/v1')
+            self.assertEqual(adapter._pool_maxsize, 3)
+
+    def test_results_in_completion_order_with_errors(self):
+        def health_check(api, client_custom_data=''):
+            if api.host == 'broken':
+                raise APIError('server_error', 'Something went wrong')
+            time.sleep(0.1 if api.host == 'slow' else 0)
+            return Response(success=True, data={'host': api.host})
+
+        with patch('satisfactory_api_client.api_client.SatisfactoryAPI.health_check', new=health_check):
+            with SatisfactoryFleet(['slow', 'broken', 'fast'], max_workers=3) as fleet:
+                results = list(fleet.call('health_check'))
+
+        self.assertEqual(results[-1].host, 'slow')
+        by_host = {result.host: result for result in results}
+        self.assertTrue(by_host['fast'].success)
+        self.assertIsInstance(by_host['broken'].error, APIError)
+
+    def test_thread_pool_is_bounded(self):
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def call(api):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return Response(success=True, data={})
+
+        with SatisfactoryFleet([f'server{i}' for i in range(8)], max_workers=2) as fleet:
+            results = list(fleet.call(call))
+
+        self.assertEqual(len(results), 8)
+        self.assertEqual(peak, 2)
+
+    def test_unknown_method(self):
+        with SatisfactoryFleet(['one']) as fleet:
+            with self.assertRaises(AttributeError):
+                fleet.call('not_a_method')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+import unittest
+
+
+def _loaded_modules(code: str, modules: tuple[str, ...] = ('aiohttp', 'requests')) -> list[str]:
+    """Run ``code`` in a fresh interpreter and list which of ``modules`` it imported."""
+    result = subprocess.run(
+        [sys.executable, '-c', f'import sys\n{code}\nprint(*[m for m in {modules!r} if m in sys.modules])'],
+        check=True, capture_output=True, text=True
+    )
+    return result.stdout.split()
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_package_import_loads_no_http_library(self):
+        self.assertEqual(_loaded_modules('import satisfactory_api_client'), [])
+
+    def test_sync_client_does_not_load_aiohttp(self):
+        self.assertEqual(_loaded_modules('from satisfactory_api_client import SatisfactoryAPI, APIError'),
+                         ['requests'])
+
+    def test_async_client_does_not_load_requests(self):
+        self.assertEqual(_loaded_modules('from satisfactory_api_client import AsyncSatisfactoryAPI'), ['aiohttp'])
+
+    def test_data_classes_load_no_http_library(self):
+        self.assertEqual(_loaded_modules('from satisfactory_api_client.data import Response, ServerOptions'), [])
+
+    def test_unknown_attribute(self):
+        import satisfactory_api_client
+        with self.assertRaises(AttributeError):
+            satisfactory_api_client.DoesNotExist
+        with self.assertRaises(ImportError):
+            exec('from satisfactory_api_client import DoesNotExist')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from satisfactory_api_client import SatisfactoryAPI, APIError
+from satisfactory_api_client.json_backend import (STDLIB_BACKEND, JSONBackend, decode_response, error_from_response,
+                                                  get_json_backend)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class TestJSONBackend(unittest.TestCase):
+    def test_lookup(self):
+        self.assertIs(get_json_backend('json'), STDLIB_BACKEND)
+        custom = JSONBackend('custom', STDLIB_BACKEND.dumps, STDLIB_BACKEND.loads)
+        self.assertIs(get_json_backend(custom), custom)
+        self.assertEqual(get_json_backend().name, 'orjson' if orjson else 'json')
+        with self.assertRaises(ValueError):
+            get_json_backend('yaml')
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_backends_agree(self):
+        payload = {'function': 'HealthCheck', 'data': {'ClientCustomData': 'ünïcode'}}
+        for backend in (STDLIB_BACKEND, get_json_backend('orjson')):
+            self.assertEqual(backend.loads(backend.dumps(payload)), payload)
+            self.assertEqual(STDLIB_BACKEND.loads(backend.dumps(payload)), payload)
+
+    def test_decode_response(self):
+        self.assertEqual(decode_response(STDLIB_BACKEND, b'{"data": {"health": "healthy"}}'), {'health': 'healthy'})
+        with self.assertRaises(APIError) as context:
+            decode_response(STDLIB_BACKEND, b'{"errorCode": "invalid_token", "errorMessage": "Bad token"}')
+        self.assertEqual(context.exception.error_code, 'invalid_token')
+        self.assertEqual(context.exception.message, 'Bad token')
+        for body in (b'[1, 2]', b'"ok"', b'null'):
+            with self.assertRaises(APIError) as context:
+                decode_response(STDLIB_BACKEND, body)
+            self.assertEqual(context.exception.error_code, 'invalid_response')
+
+    def test_error_from_non_json_body(self):
+        error = error_from_response(STDLIB_BACKEND, b'<html>Bad Gateway</html>', 502)
+        self.assertEqual(error.error_code, 'http_502')
+        self.assertEqual(error.message, '<html>Bad Gateway</html>')
+
+
+class TestClientDecoding(unittest.TestCase):
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_error_in_successful_response(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
+        mock_response.content = b'{"errorCode": "insufficient_scope", "errorMessage": "Admin required"}'
+        mock_post.return_value = mock_response
+
+        api = SatisfactoryAPI("localhost", json_backend='json')
+        with self.assertRaises(APIError) as context:
+            api.get_server_options()
+        self.assertEqual(context.exception.error_code, 'insufficient_scope')
+        self.assertEqual(mock_post.call_args.kwargs['data'], b'{"function": "GetServerOptions"}')
+
+
+if __name__ == '__main__':
+    unittest.main()
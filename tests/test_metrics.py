@@ -0,0 +1,75 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from satisfactory_api_client import SatisfactoryAPI, APIError, MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_tracks_latency_status_and_bytes(self):
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        with patch('satisfactory_api_client.metrics.time.perf_counter', side_effect=[0.0, 0.05, 0.0, 0.5]):
+            with metrics.track('host:7777', 'QueryServerState') as tracker:
+                tracker.bytes_sent = 10
+                tracker.bytes_received = 100
+            with self.assertRaises(APIError):
+                with metrics.track('host:7777', 'QueryServerState'):
+                    raise APIError('insufficient_scope', 'Not allowed')
+
+        snapshot = metrics.snapshot()['host:7777']
+        self.assertEqual(snapshot['in_flight'], 0)
+        series = snapshot['functions']['QueryServerState']
+        self.assertEqual(series['count'], 2)
+        self.assertEqual(series['sum'], 0.55)
+        self.assertEqual(series['buckets'], [[0.1, 1], [1.0, 2], [float('inf'), 2]])
+        self.assertEqual(series['statuses'], {'ok': 1, 'insufficient_scope': 1})
+        self.assertEqual((series['bytes_sent'], series['bytes_received']), (10, 100))
+        self.assertEqual(series['p50'], 0.1)
+
+    def test_in_flight_gauge(self):
+        metrics = MetricsRegistry()
+        with metrics.track('host:7777', 'HealthCheck'):
+            self.assertEqual(metrics.snapshot()['host:7777']['in_flight'], 1)
+        self.assertEqual(metrics.snapshot()['host:7777']['in_flight'], 0)
+
+    def test_prometheus_exposition(self):
+        metrics = MetricsRegistry(buckets=(1.0,))
+        with patch('satisfactory_api_client.metrics.time.perf_counter', side_effect=[0.0, 0.25]):
+            with metrics.track('host:7777', 'HealthCheck'):
+                pass
+
+        text = metrics.to_prometheus()
+        labels = 'server="host:7777",function="HealthCheck"'
+        self.assertIn('# TYPE satisfactory_api_request_duration_seconds histogram\n', text)
+        self.assertIn(f'satisfactory_api_request_duration_seconds_bucket{{{labels},le="1.0"}} 1\n', text)
+        self.assertIn(f'satisfactory_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n', text)
+        self.assertIn(f'satisfactory_api_request_duration_seconds_sum{{{labels}}} 0.25\n', text)
+        self.assertIn(f'satisfactory_api_requests_total{{{labels},status="ok"}} 1\n', text)
+        self.assertIn('satisfactory_api_requests_in_flight{server="host:7777"} 0\n', text)
+
+
+class TestClientMetrics(unittest.TestCase):
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_client_records_requests(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
+        mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
+        mock_response.request.body = b'{"function": "QueryServerState"}'
+        mock_response.raw.tell.return_value = 42
+
+        mock_post.return_value = mock_response
+
+        metrics = MetricsRegistry()
+        api = SatisfactoryAPI("localhost", metrics=metrics)
+        api.query_server_state()
+
+        series = metrics.snapshot()['localhost:7777']['functions']['QueryServerState']
+        self.assertEqual(series['count'], 1)
+        self.assertEqual(series['statuses'], {'ok': 1})
+        self.assertEqual(series['bytes_sent'], 32)
+        self.assertEqual(series['bytes_received'], 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import hashlib
+import os
+import unittest
+
+import aiohttp
+import requests
+
+from satisfactory_api_client import (APIError, AsyncSatisfactoryAPI, SatisfactoryAPI, migrate_save,
+                                     migrate_save_async)
+from satisfactory_api_client.testing import FakeSatisfactoryServer, Faults
+
+SAVE_SIZE = 2_000_000
+CHUNK_SIZE = 64 * 1024
+
+
+class TestMigrateSave(unittest.TestCase):
+    def setUp(self):
+        self.save = os.urandom(SAVE_SIZE)
+        self.source = FakeSatisfactoryServer()
+        self.target = FakeSatisfactoryServer()
+        for server in (self.source, self.target):
+            server.__enter__()
+            self.addCleanup(server.__exit__, None, None, None)
+        self.source.add_save('Factory_autosave', 'Factory', self.save)
+        self.source_api = SatisfactoryAPI('127.0.0.1', port=self.source.port, skip_ssl_verification=True,
+                                          auth_token=self.source.issue_token(), verify_token=False)
+        self.target_api = SatisfactoryAPI('127.0.0.1', port=self.target.port, skip_ssl_verification=True,
+                                          auth_token=self.target.issue_token(), verify_token=False)
+        self.addCleanup(self.source_api.close)
+        self.addCleanup(self.target_api.close)
+
+    def test_migrate_and_load(self):
+        progress = []
+        result = migrate_save(self.source_api, self.target_api, 'Factory_autosave', 'Moved', load_game=True,
+                              max_buffered_chunks=2, chunk_size=CHUNK_SIZE, poll_interval=0.01,
+                              progress=lambda done, total: progress.append((done, total)))
+
+        self.assertEqual(self.target.saves['Moved'].data, self.save)
+        self.assertEqual(result.size, SAVE_SIZE)
+        self.assertEqual(result.hash, hashlib.sha256(self.save).hexdigest())
+        self.assertEqual(result.session_name, 'Moved')
+        self.assertTrue(result.loaded)
+        self.assertEqual(result.health, 'healthy')
+        self.assertEqual(self.target.game_state['activeSessionName'], 'Moved')
+        self.assertEqual(set(result.stages), {'transfer', 'verify', 'load'})
+        self.assertEqual(progress[-1], (SAVE_SIZE, SAVE_SIZE))
+
+    def test_failed_download_aborts_upload(self):
+        self.source.faults = Faults(drop_rate=1.0, functions=frozenset({'DownloadSaveGame'}))
+        # The download's error is raised, not the one of the aborted upload
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            migrate_save(self.source_api, self.target_api, 'Factory_autosave', chunk_size=CHUNK_SIZE)
+        self.assertNotIn('Factory_autosave', self.target.saves)
+
+        with self.assertRaises(APIError) as context:
+            migrate_save(self.source_api, self.target_api, 'Missing')
+        self.assertEqual(context.exception.error_code, 'file_not_found')
+
+
+class TestMigrateSaveAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_migrate(self):
+        save = os.urandom(SAVE_SIZE)
+        async with FakeSatisfactoryServer() as source, FakeSatisfactoryServer() as target:
+            source.add_save('Factory_autosave', 'Factory', save)
+            async with AsyncSatisfactoryAPI('127.0.0.1', port=source.port, skip_ssl_verification=True,
+                                            auth_token=source.issue_token()) as source_api, \
+                    AsyncSatisfactoryAPI('127.0.0.1', port=target.port, skip_ssl_verification=True,
+                                         auth_token=target.issue_token()) as target_api:
+                result = await migrate_save_async(source_api, target_api, 'Factory_autosave', max_buffered_chunks=2,
+                                                  chunk_size=CHUNK_SIZE, poll_interval=0.01)
+                self.assertEqual(target.saves['Factory_autosave'].data, save)
+                self.assertEqual(result.hash, hashlib.sha256(save).hexdigest())
+                self.assertFalse(result.loaded)
+                self.assertGreater(result.throughput, 0)
+
+                source.faults = Faults(drop_rate=1.0, functions=frozenset({'DownloadSaveGame'}))
+                with self.assertRaises(aiohttp.ClientPayloadError):
+                    await migrate_save_async(source_api, target_api, 'Factory_autosave', 'Broken',
+                                             chunk_size=CHUNK_SIZE)
+                self.assertNotIn('Broken', target.saves)
+
+
+if __name__ == '__main__':
+    unittest.main()
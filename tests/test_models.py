@@ -0,0 +1,82 @@
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+
+from satisfactory_api_client import SatisfactoryAPI
+from satisfactory_api_client.data import (AdvancedGameSettings, AdvancedGameSettingsState, Response, ServerGameState,
+                                          ServerOptions, ServerOptionsState, SessionList)
+
+SESSIONS = {
+    'currentSessionIndex': 1,
+    'sessions': [
+        {'sessionName': 'Old', 'saveHeaders': []},
+        {'sessionName': 'Factory', 'saveHeaders': [{
+            'saveName': 'Factory_autosave_0',
+            'saveVersion': 46,
+            'playDurationSeconds': 3600,
+            'saveDateTime': '2024.09.10-18.30.00',
+            'isModdedSave': False,
+        }]},
+    ],
+}
+
+
+class TestModels(unittest.TestCase):
+    def test_server_game_state(self):
+        raw = {'activeSessionName': 'Factory', 'numConnectedPlayers': 2, 'averageTickRate': 29.5}
+        state = ServerGameState(raw)
+        self.assertEqual(state.active_session_name, 'Factory')
+        self.assertEqual(state.num_connected_players, 2)
+        self.assertIsNone(state.is_game_paused)
+        self.assertIs(state.raw, raw)
+        self.assertFalse(hasattr(state, '__dict__'))
+        self.assertEqual(state, ServerGameState(dict(raw)))
+        self.assertIn("active_session_name='Factory'", repr(state))
+
+    def test_sessions_are_built_once(self):
+        sessions = SessionList.from_response(SESSIONS)
+        self.assertIs(sessions.sessions, sessions.sessions)
+        self.assertEqual([session.session_name for session in sessions.sessions], ['Old', 'Factory'])
+        self.assertEqual(sessions.current_session.session_name, 'Factory')
+
+        header = sessions.current_session.save_headers[0]
+        self.assertEqual(header.save_name, 'Factory_autosave_0')
+        self.assertEqual(header.save_date_time, datetime(2024, 9, 10, 18, 30))
+        self.assertIsNone(header.map_name)
+
+        self.assertIsNone(SessionList({'sessions': [], 'currentSessionIndex': -1}).current_session)
+
+    def test_settings_are_converted(self):
+        options = ServerOptionsState({
+            'serverOptions': {'FG.DSAutoPause': 'True', 'FG.AutosaveInterval': '300.0', 'FG.NetworkQuality': '3',
+                              'FG.Unknown': 'x'},
+            'pendingServerOptions': {},
+        })
+        self.assertEqual(options.options, ServerOptions(DSAutoPause=True, AutosaveInterval=300.0, NetworkQuality=3))
+        self.assertEqual(options.pending_options, ServerOptions())
+
+        settings = AdvancedGameSettingsState({
+            'creativeModeEnabled': True,
+            'advancedGameSettings': {'FG.GameRules.NoPower': 'False', 'FG.GameRules.SetGamePhase': '2'},
+        })
+        self.assertEqual(settings.settings, AdvancedGameSettings(NoPower=False, SetGamePhase=2))
+
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_response_model(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
+        mock_response.content = json.dumps({'data': SESSIONS}).encode()
+        mock_post.return_value = mock_response
+
+        response = SatisfactoryAPI("localhost").enumerate_sessions()
+        self.assertEqual(response, Response(success=True, data=SESSIONS))
+        self.assertIsInstance(response.model, SessionList)
+        self.assertIs(response.model, response.model)
+        self.assertIs(response.model.raw, response.data)
+        self.assertIsNone(Response(success=True, data={}).model)
+
+
+if __name__ == '__main__':
+    unittest.main()
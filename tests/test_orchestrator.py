@@ -0,0 +1,94 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from satisfactory_api_client import AsyncSatisfactoryFleet, BackupOrchestrator, BackupStore
+from satisfactory_api_client.backup import BandwidthLimiter
+from satisfactory_api_client.testing import FakeSatisfactoryServer, Faults
+
+
+class TestBandwidthLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_caps_combined_rate(self):
+        limiter = BandwidthLimiter(1_000_000, burst=100_000)
+
+        async def stream():
+            for _ in range(5):
+                yield b'x' * 50_000
+
+        async def consume():
+            return sum([len(chunk) async for chunk in limiter.throttle(stream())])
+
+        start = time.perf_counter()
+        self.assertEqual(await asyncio.gather(consume(), consume()), [250_000, 250_000])
+        # 500 kB at 1 MB/s, less the 100 kB burst
+        self.assertGreaterEqual(time.perf_counter() - start, 0.35)
+
+
+class TestBackupOrchestrator(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.servers = []
+        for _ in range(3):
+            server = FakeSatisfactoryServer()
+            await server.start()
+            self.addAsyncCleanup(server.stop)
+            server.game_state['activeSessionName'] = 'Factory'
+            server.save_data = os.urandom(100_000)
+            self.servers.append(server)
+        self.fleet = AsyncSatisfactoryFleet(skip_ssl_verification=True)
+        self.addAsyncCleanup(self.fleet.close)
+        for server in self.servers:
+            self.fleet.add_server('127.0.0.1', server.port, auth_token=server.issue_token())
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    async def test_backup_to_store(self):
+        store = BackupStore(self.directory)
+        orchestrator = BackupOrchestrator(self.fleet, store, save_name='nightly_{port}', download_concurrency=1,
+                                          bandwidth=1_000_000, stagger=0.05)
+        results = await orchestrator.run()
+
+        self.assertEqual([result.port for result in results], [server.port for server in self.servers])
+        for result, server in zip(results, self.servers):
+            self.assertTrue(result.success, result.error)
+            self.assertEqual(result.save_name, f'nightly_{server.port}')
+            self.assertEqual(result.size, 100_000)
+            self.assertEqual(set(result.stages), {'save', 'confirm', 'download'})
+            restored = b''.join(store.iter_save(store.manifest(result.save_name)))
+            self.assertEqual(restored, server.save_data)
+        self.assertGreaterEqual(max(result.elapsed for result in results), 0.0)
+
+    async def test_backup_to_directory_with_failures(self):
+        self.servers[1].game_state['activeSessionName'] = ''
+        self.servers[2].faults = Faults(drop_rate=1.0, functions=frozenset({'DownloadSaveGame'}))
+        results = await BackupOrchestrator(self.fleet, self.directory).run()
+
+        self.assertTrue(results[0].success)
+        with open(results[0].path, 'rb') as f:
+            self.assertEqual(f.read(), self.servers[0].save_data)
+        self.assertEqual(results[1].error.error_code, 'save_game_failed')
+        self.assertEqual(set(results[1].stages), set())
+        self.assertIsNotNone(results[2].error)
+        self.assertEqual(set(results[2].stages), {'save', 'confirm'})
+        self.assertFalse(os.path.exists(results[2].path))
+
+    async def test_confirm_timeout(self):
+        orchestrator = BackupOrchestrator(self.fleet, self.directory, confirm_timeout=0.2, poll_interval=0.05)
+        for server in self.servers:
+            server._functions['SaveGame'] = lambda data: None
+        results = await orchestrator.run()
+        self.assertTrue(all(isinstance(result.error, TimeoutError) for result in results))
+
+    async def test_hung_save_times_out(self):
+        self.fleet.timeout = 0.2
+        self.servers[0].faults = Faults(latency=1.0, functions=frozenset({'SaveGame'}))
+        results = await BackupOrchestrator(self.fleet, self.directory, save_concurrency=1).run()
+        self.assertIsInstance(results[0].error, TimeoutError)
+        self.assertEqual(set(results[0].stages), set())
+        self.assertTrue(results[1].success and results[2].success)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from satisfactory_api_client import SatisfactoryAPI, CircuitBreaker, CircuitOpenError, RetryPolicy
+from satisfactory_api_client.data import Response
+from satisfactory_api_client.retry import CircuitState
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+        self.assertTrue(policy.should_retry('QueryServerState', 1))
+        self.assertFalse(policy.should_retry('QueryServerState', 3))
+        self.assertFalse(policy.should_retry('SaveGame', 1))
+
+    def test_delay(self):
+        policy = RetryPolicy(base_delay=1, multiplier=2, max_delay=5, jitter=False)
+        self.assertEqual([policy.delay(retry) for retry in range(4)], [1, 2, 4, 5])
+
+        policy.jitter = True
+        for retry in range(4):
+            self.assertLessEqual(policy.delay(retry), min(5, 2 ** retry))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    @patch('satisfactory_api_client.retry.time.monotonic')
+    def test_opens_and_half_opens(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.acquire()
+
+        mock_monotonic.return_value = 10
+        self.assertTrue(breaker.acquire())
+        with self.assertRaises(CircuitOpenError):
+            breaker.acquire()
+
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+        mock_monotonic.return_value = 20
+        self.assertTrue(breaker.acquire())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+        self.assertFalse(breaker.acquire())
+
+
+class TestClientRetries(unittest.TestCase):
+    def setUp(self):
+        self.mock_response = MagicMock()
+        self.mock_response.status_code = 200
+        self.mock_response.content = json.dumps({"data": {"status": "ok"}}).encode()
+        self.mock_response.headers = {'Content-Type': 'application/json;charset=utf-8'}
+
+    @patch('satisfactory_api_client.api_client.time.sleep')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_idempotent_call_is_retried(self, mock_post, mock_sleep):
+        mock_post.side_effect = [requests.ConnectionError(), requests.Timeout(), self.mock_response]
+
+        api = SatisfactoryAPI("localhost", retry_policy=RetryPolicy(max_attempts=3))
+        self.assertEqual(api.query_server_state(), Response(success=True, data={"status": "ok"}))
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('satisfactory_api_client.api_client.time.sleep')
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_write_is_not_retried(self, mock_post, mock_sleep):
+        mock_post.side_effect = requests.ConnectionError()
+
+        api = SatisfactoryAPI("localhost", retry_policy=RetryPolicy())
+        with self.assertRaises(requests.ConnectionError):
+            api.save_game('save')
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_circuit_breaker_fails_fast_and_probes(self, mock_post):
+        mock_post.side_effect = requests.ConnectionError()
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0)
+        api = SatisfactoryAPI("localhost", circuit_breaker=breaker)
+
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                api.query_server_state()
+
+        # recovery_timeout=0 makes the circuit half-open right away, so the next call probes with a health check
+        with self.assertRaises(CircuitOpenError):
+            api.query_server_state()
+        self.assertEqual(json.loads(mock_post.call_args.kwargs['data'])['function'], 'HealthCheck')
+
+        mock_post.side_effect = None
+        mock_post.return_value = self.mock_response
+        self.assertEqual(api.query_server_state(), Response(success=True, data={"status": "ok"}))
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    @patch('satisfactory_api_client.api_client.requests.Session.post')
+    def test_open_circuit_does_not_send(self, mock_post):
+        mock_post.side_effect = requests.ConnectionError()
+        api = SatisfactoryAPI("localhost", circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_timeout=60))
+
+        with self.assertRaises(requests.ConnectionError):
+            api.health_check()
+        with self.assertRaises(CircuitOpenError):
+            api.health_check()
+        self.assertEqual(mock_post.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import hashlib
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+from datetime import datetime
+
+from satisfactory_api_client import SaveFormatError
+from satisfactory_api_client.backup import SAVE_CHUNK_TAG
+from satisfactory_api_client.savefile import (decompress_save_body, iter_save_body, iter_save_chunks,
+                                              iter_save_file_headers, parse_save_file_header, read_save_file_header)
+
+SAVE_TICKS = 638_000_000_000_000_000
+
+
+def fstring(value: str) -> bytes:
+    if not value:
+        return struct.pack('<i', 0)
+    if value.isascii():
+        return struct.pack('<i', len(value) + 1) + value.encode() + b'\0'
+    encoded = value.encode('utf-16-le') + b'\0\0'
+    return struct.pack('<i', -(len(encoded) // 2)) + encoded
+
+
+def build_header(header_version: int = 14, session_name: str = 'Factory', body: bytes = b'',
+                 valid_hash: bool = True) -> bytes:
+    parts = [struct.pack('<3i', header_version, 46, 385_000)]
+    if header_version >= 14:
+        parts.append(fstring('Factory_autosave_0'))
+    parts += [fstring('Persistent_Level'), fstring('?startloc=Grass Fields'), fstring(session_name),
+              struct.pack('<iq', 3600, SAVE_TICKS)]
+    if header_version >= 5:
+        parts.append(b'\x01')
+    if header_version >= 7:
+        parts.append(struct.pack('<i', 44))
+    if header_version >= 8:
+        parts += [fstring('{"Mods": []}'), struct.pack('<i', 0)]
+    if header_version >= 10:
+        parts.append(fstring('3c1d4e2f'))
+    if header_version >= 11:
+        parts.append(struct.pack('<i', 1))
+    if header_version >= 12:
+        parts += [struct.pack('<i', 1), hashlib.md5(body).digest()] if valid_hash else [struct.pack('<i', 0)]
+    if header_version >= 13:
+        parts.append(struct.pack('<i', 1))
+    return b''.join(parts) + body
+
+
+def build_body(data: bytes, chunk_size: int = 128 * 1024, legacy: bool = False) -> bytes:
+    parts = []
+    for offset in range(0, len(data), chunk_size):
+        piece = data[offset:offset + chunk_size]
+        compressed = zlib.compress(piece)
+        sizes = struct.pack('<4q', len(compressed), len(piece), len(compressed), len(piece))
+        version = bytes(4) + struct.pack('<q', chunk_size) if legacy \
+            else b'\x22\x22\x22\x22' + struct.pack('<qB', chunk_size, 3)
+        parts += [SAVE_CHUNK_TAG, version, sizes, compressed]
+    return b''.join(parts)
+
+
+class TestSaveFileHeader(unittest.TestCase):
+    def test_latest_version(self):
+        data = build_header(body=b'body')
+        header = parse_save_file_header(data)
+        self.assertEqual((header.save_header_version, header.save_version, header.build_version), (14, 46, 385_000))
+        self.assertEqual(header.save_name, 'Factory_autosave_0')
+        self.assertEqual(header.map_options, '?startloc=Grass Fields')
+        self.assertEqual(header.session_name, 'Factory')
+        self.assertEqual(header.play_duration_seconds, 3600)
+        self.assertEqual(header.save_date_time, datetime(2022, 9, 28, 22, 13, 20))
+        self.assertEqual(header.mod_metadata, '{"Mods": []}')
+        self.assertFalse(header.is_modded_save)
+        self.assertTrue(header.is_partitioned_world)
+        self.assertEqual(header.save_data_hash, hashlib.md5(b'body').digest())
+        self.assertTrue(header.is_creative_mode_enabled)
+        self.assertEqual(data[header.header_size:], b'body')
+        self.assertFalse(hasattr(header, '__dict__'))
+
+    def test_older_versions(self):
+        header = parse_save_file_header(build_header(6))
+        self.assertIsNone(header.save_name)
+        self.assertEqual(header.session_visibility, 1)
+        self.assertIsNone(header.editor_object_version)
+        self.assertIsNone(header.save_data_hash)
+        self.assertEqual(parse_save_file_header(build_header(11)).save_identifier, '3c1d4e2f')
+
+    def test_invalid_hash(self):
+        data = build_header(13, body=b'body', valid_hash=False)
+        header = parse_save_file_header(data)
+        self.assertIsNone(header.save_data_hash)
+        self.assertTrue(header.is_creative_mode_enabled)
+        self.assertEqual(data[header.header_size:], b'body')
+
+    def test_utf16_strings(self):
+        self.assertEqual(parse_save_file_header(build_header(session_name='Fabrik Süd ✓')).session_name,
+                         'Fabrik Süd ✓')
+
+    def test_invalid_files(self):
+        data = build_header()
+        with self.assertRaises(SaveFormatError) as context:
+            parse_save_file_header(data[:40])
+        self.assertLessEqual(context.exception.offset, 40)
+        with self.assertRaises(SaveFormatError):
+            parse_save_file_header(b'PK\x03\x04' + bytes(100))
+
+    def test_read_from_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ('a.sav', 'b.sav', 'empty.sav', 'notes.sav')]
+            for path, data in zip(paths, (build_header(body=os.urandom(100_000)), build_header(10), b'', b'notes')):
+                with open(path, 'wb') as f:
+                    f.write(data)
+            self.assertEqual(read_save_file_header(paths[0]).session_name, 'Factory')
+            with self.assertRaises(SaveFormatError):
+                read_save_file_header(paths[2])
+            self.assertEqual([path for path, _ in iter_save_file_headers(paths)], paths[:2])
+
+
+class TestSaveFileBody(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        # Compressible but not uniform, like a real save body
+        self.body = b''.join(os.urandom(64) * 64 for _ in range(200))
+
+    def write(self, data: bytes, name: str = 'Factory.sav') -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_locate_chunks(self):
+        for legacy in (False, True):
+            data = build_header() + build_body(self.body, legacy=legacy)
+            chunks = list(iter_save_chunks(data, parse_save_file_header(data).header_size))
+            self.assertEqual(len(chunks), 7)
+            self.assertEqual(sum(chunk.uncompressed_size for chunk in chunks), len(self.body))
+            self.assertEqual(chunks[-1].data_offset + chunks[-1].compressed_size, len(data))
+
+    def test_decompress_in_process_and_on_pool(self):
+        path = self.write(build_header() + build_body(self.body))
+        self.assertEqual(b''.join(iter_save_body(path, max_workers=1, batch_size=300_000)), self.body)
+        self.assertEqual(b''.join(iter_save_body(path, max_workers=2, batch_size=300_000)), self.body)
+
+        progress = []
+        result = decompress_save_body(path, os.path.join(self.directory, 'body.bin'), max_workers=2,
+                                      batch_size=300_000, progress=lambda done, total: progress.append(total))
+        with open(os.path.join(self.directory, 'body.bin'), 'rb') as f:
+            self.assertEqual(f.read(), self.body)
+        self.assertEqual(result['save_name'], 'Factory_autosave_0')
+        self.assertEqual(result['hash'], hashlib.sha256(self.body).hexdigest())
+        self.assertEqual(set(progress), {len(self.body)})
+
+    def test_corrupt_body(self):
+        data = bytearray(build_header() + build_body(self.body))
+        data[-20:] = bytes(20)
+        path = self.write(bytes(data))
+        for max_workers in (1, 2):
+            with self.assertRaises(SaveFormatError):
+                b''.join(iter_save_body(path, max_workers=max_workers))
+        destination = os.path.join(self.directory, 'body.bin')
+        with self.assertRaises(SaveFormatError):
+            decompress_save_body(path, destination, max_workers=1)
+        self.assertFalse(os.path.exists(destination))
+
+        with self.assertRaises(SaveFormatError):
+            list(iter_save_body(self.write(build_header() + build_body(self.body)[:-10], 'short.sav'), max_workers=1))
+
+    def test_empty_file(self):
+        path = self.write(b'', 'empty.sav')
+        with self.assertRaises(SaveFormatError):
+            list(iter_save_body(path, max_workers=1))
+        with self.assertRaises(SaveFormatError):
+            decompress_save_body(path, os.path.join(self.directory, 'body.bin'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import asyncio
+import os
+import stat
+import tempfile
+import unittest
+
+from satisfactory_api_client import (APIError, AsyncSatisfactoryAPI, AsyncSatisfactoryFleet, SatisfactoryAPI,
+                                     SatisfactoryFleet, TokenManager)
+from satisfactory_api_client.data import MinimumPrivilegeLevel
+from satisfactory_api_client.testing import FakeSatisfactoryServer
+
+ADMINISTRATOR = MinimumPrivilegeLevel.ADMINISTRATOR
+
+
+class TestTokenManager(unittest.TestCase):
+    def test_best_token_and_discard(self):
+        manager = TokenManager()
+        manager.put('host', 7777, MinimumPrivilegeLevel.CLIENT, 'client')
+        manager.put('host', 7777, ADMINISTRATOR, 'admin')
+        self.assertEqual(manager.get('host'), 'admin')
+        self.assertEqual(manager.get('host', 7777, MinimumPrivilegeLevel.CLIENT), 'client')
+        self.assertIsNone(manager.get('host', 8888))
+
+        manager.discard('host', 7777, 'admin')
+        self.assertEqual(manager.get('host'), 'client')
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tokens.json')
+            manager = TokenManager(path)
+            manager.put('host', 7777, ADMINISTRATOR, 'admin')
+            manager.set_credentials('host', 7777, ADMINISTRATOR, 'secret')
+
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+            with open(path) as f:
+                self.assertNotIn('secret', f.read())
+            reloaded = TokenManager(path)
+            self.assertEqual(reloaded.get('host', 7777, ADMINISTRATOR), 'admin')
+            self.assertIsNone(reloaded.credentials('host'))
+
+
+class TestReauthentication(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSatisfactoryServer(admin_password='admin').__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.manager = TokenManager()
+
+    def client(self, **kwargs) -> SatisfactoryAPI:
+        api = SatisfactoryAPI('127.0.0.1', port=self.server.port, skip_ssl_verification=True, **kwargs)
+        self.addCleanup(api.close)
+        return api
+
+    def test_logs_in_again_after_token_is_revoked(self):
+        api = self.client(token_manager=self.manager)
+        api.password_login(ADMINISTRATOR, 'admin')
+        self.assertEqual(self.manager.get('127.0.0.1', self.server.port), api.auth_token)
+
+        self.server.tokens.clear()
+        self.assertTrue(api.get_server_options().success)
+        self.assertEqual(self.server.calls['PasswordLogin'], 2)
+        self.assertEqual(self.manager.get('127.0.0.1', self.server.port), api.auth_token)
+
+        self.server.tokens.clear()
+        self.server.add_save('save', 'Factory', b'save data')
+        self.assertEqual(api.download_save_game('save').data, b'save data')
+        self.assertEqual(self.server.calls['PasswordLogin'], 3)
+
+    def test_credentials_from_manager(self):
+        self.manager.set_credentials('127.0.0.1', self.server.port, ADMINISTRATOR, 'admin')
+        api = self.client(token_manager=self.manager)
+        self.assertIsNone(api.auth_token)
+        self.assertTrue(api.query_server_state().success)
+
+        # A second client starts with the stored token instead of logging in
+        other = self.client(token_manager=self.manager)
+        self.assertEqual(other.auth_token, api.auth_token)
+        self.assertTrue(other.query_server_state().success)
+        self.assertEqual(self.server.calls['PasswordLogin'], 1)
+
+    def test_lazy_verification(self):
+        api = self.client(auth_token='stale')
+        self.assertEqual(self.server.calls['VerifyAuthenticationToken'], 0)
+        with self.assertRaises(APIError) as context:
+            api.query_server_state()
+        self.assertEqual(context.exception.error_code, 'invalid_token')
+
+        with self.assertRaises(APIError):
+            self.client(auth_token='stale', verify_token=True)
+        self.assertEqual(self.server.calls['VerifyAuthenticationToken'], 1)
+
+    def test_wrong_password_is_not_retried(self):
+        api = self.client()
+        with self.assertRaises(APIError) as context:
+            api.password_login(ADMINISTRATOR, 'wrong')
+        self.assertEqual(context.exception.error_code, 'wrong_password')
+        self.assertEqual(self.server.calls['PasswordLogin'], 1)
+
+    def test_fleet_verify_tokens(self):
+        with FakeSatisfactoryServer() as other:
+            token = self.server.issue_token()
+            with SatisfactoryFleet(auth_token=token, skip_ssl_verification=True) as fleet:
+                fleet.add_server('127.0.0.1', self.server.port)
+                fleet.add_server('127.0.0.1', other.port)
+                self.assertEqual(self.server.calls['VerifyAuthenticationToken'], 0)
+
+                errors = fleet.verify_tokens()
+                self.assertEqual(list(errors), [('127.0.0.1', other.port)])
+                self.assertEqual(errors[('127.0.0.1', other.port)].error_code, 'invalid_token')
+
+
+class TestAsyncReauthentication(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_login(self):
+        async with FakeSatisfactoryServer(admin_password='admin') as server, \
+                AsyncSatisfactoryAPI('127.0.0.1', port=server.port, skip_ssl_verification=True) as api:
+            await api.password_login(ADMINISTRATOR, 'admin')
+            server.tokens.clear()
+
+            results = await asyncio.gather(api.query_server_state(), api.get_server_options(),
+                                           *(api.run_command(f'echo {i}') for i in range(5)))
+            self.assertTrue(all(result.success for result in results))
+            self.assertEqual(server.calls['PasswordLogin'], 2)
+
+    async def test_fleet_uses_manager_credentials(self):
+        manager = TokenManager()
+        async with FakeSatisfactoryServer(admin_password='admin') as server, \
+                AsyncSatisfactoryFleet(skip_ssl_verification=True, token_manager=manager) as fleet:
+            manager.set_credentials('127.0.0.1', server.port, ADMINISTRATOR, 'admin')
+            fleet.add_server('127.0.0.1', server.port)
+            self.assertEqual(await fleet.verify_tokens(), {})
+            self.assertIsNotNone(manager.get('127.0.0.1', server.port, ADMINISTRATOR))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import patch
+
+from satisfactory_api_client import AsyncSatisfactoryAPI, SatisfactoryAPI, APIError
+from satisfactory_api_client.data import Response
+from satisfactory_api_client.watch import AdaptiveInterval, ServerStateWatcher, diff_server_state
+
+
+def _state(players=0, tick_rate=30.0, paused=False, session='Factory'):
+    return {'numConnectedPlayers': players, 'averageTickRate': tick_rate, 'isGamePaused': paused,
+            'activeSessionName': session, 'totalGameDuration': 100}
+
+
+class TestDiffServerState(unittest.TestCase):
+    def test_first_state_reports_every_field(self):
+        self.assertEqual(diff_server_state(None, _state()), {
+            'numConnectedPlayers': 0, 'averageTickRate': 30.0, 'isGamePaused': False, 'activeSessionName': 'Factory'
+        })
+
+    def test_only_changed_fields_are_reported(self):
+        self.assertEqual(diff_server_state(_state(), _state(players=2)), {'numConnectedPlayers': 2})
+        self.assertEqual(diff_server_state(_state(), _state()), {})
+
+    def test_tick_rate_jitter_is_ignored(self):
+        self.assertEqual(diff_server_state(_state(), _state(tick_rate=29.8)), {})
+        self.assertEqual(diff_server_state(_state(), _state(tick_rate=20.0)), {'averageTickRate': 20.0})
+
+
+class TestAdaptiveInterval(unittest.TestCase):
+    def test_backs_off_while_idle_and_tightens_when_busy(self):
+        interval = AdaptiveInterval(min_interval=1, max_interval=5, backoff=2)
+        self.assertEqual(interval.update(_state(players=0)), 2)
+        self.assertEqual(interval.update(_state(players=3, paused=True)), 4)
+        self.assertEqual(interval.update(_state(players=0)), 5)
+        self.assertEqual(interval.update(_state(players=3)), 1)
+
+
+class TestWatchServerState(unittest.IsolatedAsyncioTestCase):
+    async def test_async_watch_yields_changes(self):
+        states = iter([_state(), _state(), _state(players=1), _state(players=1, session='Other')])
+
+        async def query_server_state(api):
+            return Response(success=True, data={'serverGameState': next(states)})
+
+        with patch('satisfactory_api_client.async_api_client.AsyncSatisfactoryAPI.query_server_state',
+                   new=query_server_state):
+            api = AsyncSatisfactoryAPI("localhost")
+            watch = api.watch_server_state(min_interval=0, max_interval=0)
+            changes = [(await anext(watch)).changes for _ in range(3)]
+            await watch.aclose()
+
+        self.assertEqual(changes[1:], [{'numConnectedPlayers': 1}, {'activeSessionName': 'Other'}])
+
+    def test_watcher_thread(self):
+        states = iter([_state(), _state(paused=True)])
+        received = []
+
+        def query_server_state(api):
+            try:
+                return Response(success=True, data={'serverGameState': next(states)})
+            except StopIteration:
+                raise APIError('server_error', 'Server went away')
+
+        def callback(change):
+            received.append(change.changes)
+
+        with patch('satisfactory_api_client.api_client.SatisfactoryAPI.query_server_state', new=query_server_state):
+            watcher = SatisfactoryAPI("localhost").watch_server_state(callback, min_interval=0, max_interval=0)
+            watcher.join(timeout=5)
+
+        self.assertFalse(watcher.is_alive())
+        self.assertEqual(received[1], {'isGamePaused': True})
+        self.assertIsInstance(watcher.error, APIError)
+
+    def test_raising_callback(self):
+        def query_server_state(api):
+            return Response(success=True, data={'serverGameState': _state(players=next(players))})
+
+        def callback(change):
+            raise ValueError(change.changes)
+
+        with patch('satisfactory_api_client.api_client.SatisfactoryAPI.query_server_state', new=query_server_state):
+            players = iter(range(100))
+            watcher = SatisfactoryAPI("localhost").watch_server_state(callback, min_interval=0, max_interval=0)
+            watcher.join(timeout=5)
+            self.assertFalse(watcher.is_alive())
+            self.assertIsInstance(watcher.error, ValueError)
+
+            players = iter(range(100))
+            errors = []
+
+            def on_error(error):
+                errors.append(error)
+                if len(errors) == 3:
+                    watcher.stop(wait=False)
+
+            watcher = ServerStateWatcher(SatisfactoryAPI("localhost"), callback, interval=AdaptiveInterval(0, 0),
+                                         on_error=on_error)
+            watcher.start()
+            watcher.join(timeout=5)
+
+        # The watcher kept going after each failing callback
+        self.assertFalse(watcher.is_alive())
+        self.assertEqual(len(errors), 3)
+        self.assertEqual([error.args[0] for error in errors[1:]], [{'numConnectedPlayers': n} for n in (1, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()